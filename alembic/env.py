@@ -1,8 +1,12 @@
 """Alembic migration environment configuration."""
 
+import asyncio
+import os
 from logging.config import fileConfig
 
-from sqlalchemy import engine_from_config, pool
+from alembic.script import ScriptDirectory
+from sqlalchemy import Connection, inspect, pool
+from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 from projectvote.backend.models import Base
@@ -21,6 +25,11 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# The application's DATABASE_URL takes precedence over alembic.ini, so the
+# migrations run against the same database as the application.
+if database_url := os.environ.get("DATABASE_URL"):
+    config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
+
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -52,24 +61,51 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
-def run_migrations_online() -> None:
-    """Run migrations in 'online' mode.
-
-    In this scenario we need to create an Engine
-    and associate a connection with the context.
+def do_run_migrations(connection: Connection) -> None:
+    """Run the migrations on ``connection``.
 
+    The early migrations were written for SQLite only and cannot run on other
+    databases. An empty database of another backend is therefore created from
+    the models and stamped with the current head; later migrations apply to it
+    as usual.
     """
-    connectable = engine_from_config(
+    context.configure(connection=connection, target_metadata=target_metadata)
+
+    if connection.dialect.name != "sqlite" and not inspect(connection).has_table(
+        "alembic_version"
+    ):
+        with context.begin_transaction():
+            target_metadata.create_all(connection)
+            context.get_context().stamp(ScriptDirectory.from_config(config), "head")
+        return
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """Create an async Engine and run the migrations on one of its connections."""
+    connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
 
-    with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
 
-        with context.begin_transaction():
-            context.run_migrations()
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    """Run migrations in 'online' mode.
+
+    In this scenario we need to create an Engine
+    and associate a connection with the context. The application uses async
+    drivers only, so the migrations do as well.
+
+    """
+    asyncio.run(run_async_migrations())
 
 
 if context.is_offline_mode():
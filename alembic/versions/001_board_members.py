@@ -0,0 +1,52 @@
+"""Board members table and electorate snapshot per application.
+
+Revision ID: 001_board_members
+Revises: 000_initial
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "001_board_members"
+down_revision: str | Sequence[str] | None = "000_initial"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "board_members",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_board_members_id", "board_members", ["id"], unique=False)
+    op.create_index("ix_board_members_email", "board_members", ["email"], unique=True)
+
+    op.add_column(
+        "applications", sa.Column("electorate_size", sa.Integer(), nullable=True)
+    )
+    # Every board member received a vote record at submission time, so the
+    # number of vote records is the electorate of existing applications.
+    op.execute(
+        "UPDATE applications SET electorate_size = ("
+        "SELECT COUNT(*) FROM votes WHERE votes.application_id = applications.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("applications") as batch_op:
+        batch_op.drop_column("electorate_size")
+    op.drop_index("ix_board_members_email", table_name="board_members")
+    op.drop_index("ix_board_members_id", table_name="board_members")
+    op.drop_table("board_members")
@@ -0,0 +1,71 @@
+"""Vote tallies per application and vote history.
+
+Revision ID: 002_vote_changes
+Revises: 001_board_members
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002_vote_changes"
+down_revision: str | Sequence[str] | None = "001_board_members"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# SQLAlchemy persists enum members by name, so these are the stored values.
+TALLY_COLUMNS = {
+    "approve_count": "APPROVE",
+    "reject_count": "REJECT",
+    "abstain_count": "ABSTAIN",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in TALLY_COLUMNS:
+        op.add_column(
+            "applications",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+    # Backfill the tallies from the votes cast so far.
+    for column, option in TALLY_COLUMNS.items():
+        op.execute(
+            f"UPDATE applications SET {column} = ("  # noqa: S608
+            "SELECT COUNT(*) FROM votes WHERE votes.application_id = applications.id "
+            f"AND votes.vote_status = 'CAST' AND votes.vote = '{option}')"
+        )
+
+    op.create_table(
+        "vote_history",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("vote_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "previous_vote",
+            sa.Enum("APPROVE", "REJECT", "ABSTAIN", name="voteoption"),
+            nullable=True,
+        ),
+        sa.Column(
+            "vote",
+            sa.Enum("APPROVE", "REJECT", "ABSTAIN", name="voteoption"),
+            nullable=False,
+        ),
+        sa.Column("cast_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["vote_id"], ["votes.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_vote_history_vote_id", "vote_history", ["vote_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_vote_history_vote_id", table_name="vote_history")
+    op.drop_table("vote_history")
+    with op.batch_alter_table("applications") as batch_op:
+        for column in TALLY_COLUMNS:
+            batch_op.drop_column(column)
@@ -0,0 +1,29 @@
+"""Index votes by voter email and status.
+
+Revision ID: 003_votes_voter_email_index
+Revises: 002_vote_changes
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003_votes_voter_email_index"
+down_revision: str | Sequence[str] | None = "002_vote_changes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_votes_voter_email_vote_status", "votes", ["voter_email", "vote_status"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_votes_voter_email_vote_status", table_name="votes")
@@ -0,0 +1,38 @@
+"""Reminder history.
+
+Revision ID: 004_reminders
+Revises: 003_votes_voter_email_index
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004_reminders"
+down_revision: str | Sequence[str] | None = "003_votes_voter_email_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "reminders",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("voter_email", sa.String(), nullable=False),
+        sa.Column("pending_votes", sa.Integer(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_reminders_voter_email", "reminders", ["voter_email"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reminders_voter_email", table_name="reminders")
+    op.drop_table("reminders")
@@ -0,0 +1,38 @@
+"""Voting deadline.
+
+Revision ID: 005_voting_deadline
+Revises: 004_reminders
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005_voting_deadline"
+down_revision: str | Sequence[str] | None = "004_reminders"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "applications", sa.Column("voting_deadline", sa.DateTime(), nullable=True)
+    )
+    op.create_index(
+        "ix_applications_status_voting_deadline",
+        "applications",
+        ["status", "voting_deadline"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_applications_status_voting_deadline", table_name="applications")
+    with op.batch_alter_table("applications") as batch_op:
+        batch_op.drop_column("voting_deadline")
@@ -0,0 +1,55 @@
+"""Email delivery log.
+
+Revision ID: 006_email_deliveries
+Revises: 005_voting_deadline
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_email_deliveries"
+down_revision: str | Sequence[str] | None = "005_voting_deadline"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "email_deliveries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("recipient", sa.String(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("template_name", sa.String(), nullable=False),
+        sa.Column("template_body", sa.JSON(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("SENT", "FAILED", "DEAD", name="deliverystatus"),
+            nullable=False,
+        ),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("latency_ms", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_attempt_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_email_deliveries_recipient", "email_deliveries", ["recipient"])
+    op.create_index(
+        "ix_email_deliveries_template_name", "email_deliveries", ["template_name"]
+    )
+    op.create_index("ix_email_deliveries_status", "email_deliveries", ["status"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_email_deliveries_status", table_name="email_deliveries")
+    op.drop_index("ix_email_deliveries_template_name", table_name="email_deliveries")
+    op.drop_index("ix_email_deliveries_recipient", table_name="email_deliveries")
+    op.drop_table("email_deliveries")
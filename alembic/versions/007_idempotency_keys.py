@@ -0,0 +1,43 @@
+"""Idempotency keys of application submissions.
+
+Revision ID: 007_idempotency_keys
+Revises: 006_email_deliveries
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_idempotency_keys"
+down_revision: str | Sequence[str] | None = "006_email_deliveries"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "idempotency_keys",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("application_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["application_id"], ["applications.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_idempotency_keys_key", "idempotency_keys", ["key"], unique=True)
+    op.create_index(
+        "ix_idempotency_keys_created_at", "idempotency_keys", ["created_at"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_idempotency_keys_created_at", table_name="idempotency_keys")
+    op.drop_index("ix_idempotency_keys_key", table_name="idempotency_keys")
+    op.drop_table("idempotency_keys")
@@ -0,0 +1,36 @@
+"""Content encoding and compression ratio of attachments.
+
+Revision ID: 009_attachment_compression
+Revises: 008_resumable_uploads
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_attachment_compression"
+down_revision: str | Sequence[str] | None = "008_resumable_uploads"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "attachments", sa.Column("content_encoding", sa.String(), nullable=True)
+    )
+    op.add_column(
+        "attachments", sa.Column("compression_ratio", sa.Float(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("attachments") as batch_op:
+        batch_op.drop_column("compression_ratio")
+        batch_op.drop_column("content_encoding")
@@ -0,0 +1,62 @@
+"""Store application creation times in UTC.
+
+On SQLite, the server default of ``applications.created_at`` used local time,
+while the application writes UTC. Rows created by the old default are converted
+to UTC, and the default is replaced by ``CURRENT_TIMESTAMP``, which is UTC.
+Other databases used a UTC default from the start and are not changed.
+
+Rows written by the application always carry microseconds, whereas the old
+default produced whole seconds; this tells both kinds of rows apart. The
+conversion uses the local time zone of the migrating process, so run it with
+the same ``TZ`` as the server that wrote the rows.
+
+Revision ID: 010_utc_timestamps
+Revises: 009_attachment_compression
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010_utc_timestamps"
+down_revision: str | Sequence[str] | None = "009_attachment_compression"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_context().dialect.name != "sqlite":
+        return
+    op.execute(
+        "UPDATE applications SET created_at = datetime(created_at, 'utc') "
+        "WHERE length(created_at) = 19"
+    )
+    with op.batch_alter_table("applications") as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Converted timestamps stay in UTC, which is what the application expects.
+    """
+    if op.get_context().dialect.name != "sqlite":
+        return
+    with op.batch_alter_table("applications") as batch_op:
+        batch_op.alter_column(
+            "created_at",
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text("datetime('now', 'localtime')"),
+        )
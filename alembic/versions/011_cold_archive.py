@@ -0,0 +1,148 @@
+"""Archive tables for applications concluded long ago.
+
+Applications are moved to the archive tables with their ids, so on SQLite the
+hot tables switch to ``AUTOINCREMENT``; otherwise the ids of the newest rows
+could be handed out again once they were archived. Other databases never
+reuse ids.
+
+Downgrading moves archived applications back. Their votes get placeholder
+tokens, since tokens are not archived.
+
+Revision ID: 011_cold_archive
+Revises: 010_utc_timestamps
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011_cold_archive"
+down_revision: str | Sequence[str] | None = "010_utc_timestamps"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Hot tables whose ids are kept by the archive tables.
+ARCHIVED_TABLES = ("applications", "votes", "vote_history", "attachments")
+
+
+def _vote_option() -> sa.Enum:
+    return sa.Enum("APPROVE", "REJECT", "ABSTAIN", name="voteoption", native_enum=False)
+
+
+def _set_sqlite_autoincrement(*, enabled: bool) -> None:
+    if op.get_context().dialect.name != "sqlite":
+        return
+    for table in ARCHIVED_TABLES:
+        with op.batch_alter_table(
+            table, recreate="always", table_kwargs={"sqlite_autoincrement": enabled}
+        ):
+            pass
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "archived_applications",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("first_name", sa.String(), nullable=False),
+        sa.Column("last_name", sa.String(), nullable=False),
+        sa.Column("applicant_email", sa.String(), nullable=False),
+        sa.Column("department", sa.String(), nullable=False),
+        sa.Column("project_title", sa.String(), nullable=False),
+        sa.Column("project_description", sa.String(), nullable=False),
+        sa.Column("costs", sa.Float(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum(
+                "PENDING",
+                "APPROVED",
+                "REJECTED",
+                name="applicationstatus",
+                native_enum=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("concluded_at", sa.DateTime(), nullable=False),
+        sa.Column("voting_deadline", sa.DateTime(), nullable=True),
+        sa.Column("electorate_size", sa.Integer(), nullable=True),
+        sa.Column("approve_count", sa.Integer(), nullable=False),
+        sa.Column("reject_count", sa.Integer(), nullable=False),
+        sa.Column("abstain_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "archived_votes",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("application_id", sa.Integer(), nullable=False),
+        sa.Column("voter_email", sa.String(), nullable=False),
+        sa.Column("vote", _vote_option(), nullable=True),
+        sa.Column("voted_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["application_id"], ["archived_applications.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "archived_vote_history",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("vote_id", sa.Integer(), nullable=False),
+        sa.Column("previous_vote", _vote_option(), nullable=True),
+        sa.Column("vote", _vote_option(), nullable=False),
+        sa.Column("cast_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["vote_id"], ["archived_votes.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "archived_attachments",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("application_id", sa.Integer(), nullable=False),
+        sa.Column("filename", sa.String(), nullable=False),
+        sa.Column("filepath", sa.String(), nullable=False),
+        sa.Column("mime_type", sa.String(), nullable=False),
+        sa.Column("content_encoding", sa.String(), nullable=True),
+        sa.Column("compression_ratio", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(["application_id"], ["archived_applications.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    _set_sqlite_autoincrement(enabled=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_sqlite_autoincrement(enabled=False)
+    op.execute(
+        "INSERT INTO applications (id, first_name, last_name, applicant_email, "
+        "department, project_title, project_description, costs, status, "
+        "created_at, concluded_at, voting_deadline, electorate_size, "
+        "approve_count, reject_count, abstain_count) "
+        "SELECT id, first_name, last_name, applicant_email, department, "
+        "project_title, project_description, costs, status, created_at, "
+        "concluded_at, voting_deadline, electorate_size, approve_count, "
+        "reject_count, abstain_count FROM archived_applications"
+    )
+    op.execute(
+        "INSERT INTO votes (id, application_id, voter_email, token, vote, "
+        "vote_status, voted_at) "
+        "SELECT id, application_id, voter_email, "
+        "'archived-' || CAST(id AS VARCHAR), vote, "
+        "CASE WHEN vote IS NULL THEN 'PENDING' ELSE 'CAST' END, voted_at "
+        "FROM archived_votes"
+    )
+    op.execute(
+        "INSERT INTO vote_history (id, vote_id, previous_vote, vote, cast_at) "
+        "SELECT id, vote_id, previous_vote, vote, cast_at FROM archived_vote_history"
+    )
+    op.execute(
+        "INSERT INTO attachments (id, application_id, filename, filepath, "
+        "mime_type, content_encoding, compression_ratio) "
+        "SELECT id, application_id, filename, filepath, mime_type, "
+        "content_encoding, compression_ratio FROM archived_attachments"
+    )
+    op.drop_table("archived_attachments")
+    op.drop_table("archived_vote_history")
+    op.drop_table("archived_votes")
+    op.drop_table("archived_applications")
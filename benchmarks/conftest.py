@@ -0,0 +1,115 @@
+"""Configuration and shared fixtures for the benchmark suite."""
+
+import asyncio
+import datetime as dt
+from collections.abc import Callable, Coroutine, Generator
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from pydantic import SecretStr
+
+from projectvote.backend.config import Settings
+from projectvote.backend.models import ApplicationStatus, VoteOption
+
+BENCH_BOARD_MEMBERS = [f"bench.member{i}@example.com" for i in range(1, 5)]
+
+type AsyncRunner = Callable[[Coroutine[Any, Any, Any]], Any]
+
+
+@pytest.fixture(name="bench_settings")
+def bench_settings_fixture() -> Settings:
+    """Provide settings that never talk to a real mail server."""
+    return Settings(
+        board_members=",".join(BENCH_BOARD_MEMBERS),
+        mail_driver="console",
+        mail_password=SecretStr("bench-password"),
+        db_echo=False,
+    )
+
+
+@pytest.fixture(name="run")
+def run_fixture() -> Generator[AsyncRunner, None, None]:
+    """Provide a function that runs coroutines on one dedicated event loop.
+
+    pytest-benchmark only times synchronous callables, so async code under test
+    is driven through a single ``asyncio.Runner`` that lives for the whole test.
+    """
+    with asyncio.Runner() as runner:
+        yield runner.run
+
+
+def make_archive_rows(count: int) -> list[SimpleNamespace]:
+    """Build ``count`` attribute-access rows shaped like archived applications.
+
+    Plain namespaces are used instead of ORM instances so that the benchmark
+    measures ``ApplicationOut`` validation only, not SQLAlchemy bookkeeping.
+    """
+    created_at = dt.datetime(2026, 1, 29, 12, 0, 0, tzinfo=dt.UTC)
+    concluded_at = dt.datetime(2026, 2, 3, 9, 30, 0, tzinfo=dt.UTC)
+    options = list(VoteOption)
+    return [
+        SimpleNamespace(
+            id=i,
+            first_name="Bench",
+            last_name=f"Applicant {i}",
+            applicant_email=f"applicant{i}@example.com",
+            department="Benchmarking",
+            project_title=f"Project {i}",
+            project_description="A project used to benchmark archive serialization.",
+            costs=100.0 + i,
+            status=ApplicationStatus.APPROVED,
+            created_at=created_at,
+            concluded_at=concluded_at,
+            votes=[
+                SimpleNamespace(
+                    voter_email=email,
+                    vote=options[(i + j) % len(options)],
+                    voted_at=concluded_at,
+                )
+                for j, email in enumerate(BENCH_BOARD_MEMBERS)
+            ],
+            attachments=[SimpleNamespace(id=i, filename=f"plan_{i}.pdf")],
+        )
+        for i in range(count)
+    ]
+
+
+type ArchiveTuples = tuple[list[tuple[Any, ...]], ...]
+
+
+def make_archive_tuples(count: int) -> ArchiveTuples:
+    """Build the row tuples of ``count`` archived applications.
+
+    The tuples hold the same data as ``make_archive_rows``, shaped like the
+    results of the column queries in ``projectvote.backend.archive``.
+    """
+    rows = make_archive_rows(count)
+    applications = [
+        (
+            row.id,
+            row.first_name,
+            row.last_name,
+            row.applicant_email,
+            row.department,
+            row.project_title,
+            row.project_description,
+            row.costs,
+            row.status,
+            row.created_at,
+            row.concluded_at,
+            None,
+        )
+        for row in rows
+    ]
+    votes = [
+        (row.id, vote.voter_email, vote.vote, vote.voted_at)
+        for row in rows
+        for vote in row.votes
+    ]
+    attachments = [
+        (row.id, attachment.id, attachment.filename)
+        for row in rows
+        for attachment in row.attachments
+    ]
+    return applications, votes, attachments
@@ -0,0 +1,103 @@
+"""Benchmarks for email template rendering."""
+
+import functools
+
+import pytest
+from fastapi_mail import ConnectionConfig
+from pytest_benchmark.fixture import BenchmarkFixture
+from pytest_mock import MockerFixture
+
+from projectvote.backend import email_service
+from projectvote.backend.config import Settings
+
+from .conftest import AsyncRunner
+
+TEMPLATE_BODY = {
+    "first_name": "Bench",
+    "last_name": "Applicant",
+    "applicant_email": "bench.applicant@example.com",
+    "department": "Benchmarking",
+    "project_title": "Rendering benchmark",
+    "project_description": "A description long enough to be realistic. " * 20,
+    "costs": 1234.5,
+    "status": "genehmigt",
+    "created_at": "29.01.2026, 13:00 Uhr",
+    "concluded_at": "03.02.2026, 10:30 Uhr",
+    "vote_url": "http://localhost:5173/vote/bench-token",
+    "token": "bench-token",
+    "frontend_url": "http://localhost:5173",
+    "backend_url": "http://localhost:8008",
+    "attachment_filenames": ["plan.pdf"],
+    "attachments": [
+        {"id": 1, "filename": "plan.pdf", "url": "http://localhost:5173/plan.pdf"}
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "template_name",
+    [
+        "application_confirmation.html",
+        "new_application.html",
+        "final_decision_applicant.html",
+        "final_decision_board.html",
+    ],
+)
+def test_send_email_rendering(
+    benchmark: BenchmarkFixture,
+    run: AsyncRunner,
+    bench_settings: Settings,
+    mocker: MockerFixture,
+    template_name: str,
+) -> None:
+    """Benchmark ``send_email`` end to end with a transport that never connects.
+
+    ``SUPPRESS_SEND`` keeps the full pipeline (template rendering, mailer
+    construction and MIME assembly) while skipping the SMTP session.
+    """
+    mocker.patch.object(
+        email_service,
+        "ConnectionConfig",
+        functools.partial(ConnectionConfig, SUPPRESS_SEND=1),
+    )
+
+    benchmark(
+        lambda: run(
+            email_service.send_email(
+                recipients=["bench.recipient@example.com"],
+                subject="Benchmark",
+                template_body=TEMPLATE_BODY,
+                template_name=template_name,
+                settings=bench_settings,
+            )
+        )
+    )
+
+
+@pytest.mark.parametrize("board_size", [4, 50])
+def test_send_board_decision_email(
+    benchmark: BenchmarkFixture,
+    run: AsyncRunner,
+    bench_settings: Settings,
+    mocker: MockerFixture,
+    board_size: int,
+) -> None:
+    """Benchmark announcing a decision to the whole board with one ``send_email``."""
+    mocker.patch.object(
+        email_service,
+        "ConnectionConfig",
+        functools.partial(ConnectionConfig, SUPPRESS_SEND=1),
+    )
+    board = [f"bench.member{i}@example.com" for i in range(board_size)]
+
+    benchmark(
+        lambda: run(
+            email_service.send_email(
+                recipients=board,
+                subject="Benchmark",
+                template_body=TEMPLATE_BODY,
+                template_name="final_decision_board.html",
+                settings=bench_settings,
+            )
+        )
+    )
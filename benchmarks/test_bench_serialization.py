@@ -0,0 +1,138 @@
+"""Benchmarks for archive serialization and email timestamp formatting."""
+
+import datetime as dt
+import gzip
+from functools import cache
+from types import SimpleNamespace
+
+import pytest
+from pydantic import TypeAdapter
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from projectvote.backend.archive import build_archive
+from projectvote.backend.config import Settings
+from projectvote.backend.main import ApplicationOut, format_datetime_for_email
+from projectvote.backend.responses import PydanticJSONResponse
+
+from .conftest import ArchiveTuples, make_archive_rows, make_archive_tuples
+
+ARCHIVE_SIZES = [1_000, 10_000, 100_000]
+ARCHIVE_ADAPTER = TypeAdapter(list[ApplicationOut])
+
+
+@cache
+def _archive_rows(count: int) -> list[SimpleNamespace]:
+    """Build archive rows once per size and share them across benchmarks."""
+    return make_archive_rows(count)
+
+
+@pytest.mark.parametrize("rows", ARCHIVE_SIZES)
+def test_application_out_model_validate(benchmark: BenchmarkFixture, rows: int) -> None:
+    """Benchmark validating an archive of ``rows`` applications."""
+    applications = _archive_rows(rows)
+
+    result = benchmark.pedantic(
+        lambda: [ApplicationOut.model_validate(app) for app in applications],
+        rounds=3 if rows >= max(ARCHIVE_SIZES) else 10,
+        iterations=1,
+    )
+
+    assert len(result) == rows
+
+
+@cache
+def _archive_tuples(count: int) -> ArchiveTuples:
+    """Build archive row tuples once per size and share them across benchmarks."""
+    return make_archive_tuples(count)
+
+
+@cache
+def _archive_json(count: int) -> bytes:
+    """Serialize an archive once per size and share it across benchmarks."""
+    return ARCHIVE_ADAPTER.dump_json(
+        [ApplicationOut.model_validate(app) for app in _archive_rows(count)]
+    )
+
+
+@pytest.mark.parametrize("rows", ARCHIVE_SIZES[:2])
+def test_archive_dump_json(benchmark: BenchmarkFixture, rows: int) -> None:
+    """Benchmark serializing validated archive models to JSON bytes."""
+    applications = [ApplicationOut.model_validate(app) for app in _archive_rows(rows)]
+
+    result = benchmark(ARCHIVE_ADAPTER.dump_json, applications)
+
+    assert result == _archive_json(rows)
+
+
+@pytest.mark.parametrize("rows", ARCHIVE_SIZES[:2])
+def test_pydantic_json_response_render(benchmark: BenchmarkFixture, rows: int) -> None:
+    """Benchmark rendering archive models with the Rust JSON response class."""
+    applications = [ApplicationOut.model_validate(app) for app in _archive_rows(rows)]
+
+    response = benchmark(PydanticJSONResponse, applications)
+
+    assert response.body == _archive_json(rows)
+
+
+@pytest.mark.parametrize("rows", ARCHIVE_SIZES[1:])
+def test_archive_validated_to_json(benchmark: BenchmarkFixture, rows: int) -> None:
+    """Benchmark the former archive path: validate every row, then serialize."""
+    applications = _archive_rows(rows)
+
+    result = benchmark.pedantic(
+        lambda: ARCHIVE_ADAPTER.dump_json(
+            [ApplicationOut.model_validate(app) for app in applications]
+        ),
+        rounds=3 if rows >= max(ARCHIVE_SIZES) else 10,
+        iterations=1,
+    )
+
+    assert result == _archive_json(rows)
+
+
+@pytest.mark.parametrize("rows", ARCHIVE_SIZES[1:])
+def test_archive_from_row_tuples(benchmark: BenchmarkFixture, rows: int) -> None:
+    """Benchmark building and serializing the archive from row tuples."""
+    applications, votes, attachments = _archive_tuples(rows)
+
+    result = benchmark.pedantic(
+        lambda: (
+            PydanticJSONResponse(build_archive(applications, votes, attachments)).body
+        ),
+        rounds=3 if rows >= max(ARCHIVE_SIZES) else 10,
+        iterations=1,
+    )
+
+    assert result == _archive_json(rows)
+
+
+@pytest.mark.parametrize("compresslevel", [1, 6, 9])
+def test_archive_gzip(benchmark: BenchmarkFixture, compresslevel: int) -> None:
+    """Benchmark gzip-compressing a serialized archive of 10,000 applications."""
+    body = _archive_json(10_000)
+
+    result = benchmark(gzip.compress, body, compresslevel)
+
+    assert len(result) < len(body)
+
+
+def test_format_datetime_for_email_default_timezone(
+    benchmark: BenchmarkFixture,
+) -> None:
+    """Benchmark formatting an aware timestamp with the default timezone."""
+    timestamp = dt.datetime(2026, 1, 29, 12, 0, 0, tzinfo=dt.UTC)
+
+    result = benchmark(format_datetime_for_email, timestamp)
+
+    assert result == "29.01.2026, 13:00 Uhr"
+
+
+def test_format_datetime_for_email_configured_timezone(
+    benchmark: BenchmarkFixture, bench_settings: Settings
+) -> None:
+    """Benchmark formatting a naive timestamp with a configured timezone."""
+    timestamp = dt.datetime(2026, 1, 29, 12, 0, 0)  # noqa: DTZ001
+
+    result = benchmark(format_datetime_for_email, timestamp, bench_settings)
+
+    assert result == "29.01.2026, 13:00 Uhr"
@@ -0,0 +1,100 @@
+"""Benchmarks for the vote finalization hot path."""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from projectvote.backend.config import Settings
+from projectvote.backend.main import _check_and_finalize_voting
+from projectvote.backend.models import (
+    Application,
+    ApplicationStatus,
+    Base,
+    VoteOption,
+    VoteRecord,
+    VoteStatus,
+)
+from projectvote.backend.voting import decide_batch
+
+from .conftest import AsyncRunner
+
+
+async def _seed_pending_application(
+    session: AsyncSession, board_members: list[str]
+) -> int:
+    """Create an application whose votes do not yet decide the outcome."""
+    application = Application(
+        first_name="Bench",
+        last_name="Voting",
+        applicant_email="bench.voting@example.com",
+        department="Benchmarking",
+        project_title="Finalization benchmark",
+        project_description="Pending application with a split vote.",
+        costs=250.0,
+        status=ApplicationStatus.PENDING,
+        electorate_size=len(board_members),
+        approve_count=1,
+        reject_count=1,
+    )
+    session.add(application)
+    await session.flush()
+    # One approval and one rejection keep the application pending for any board
+    # size, so every benchmark round walks the full majority computation.
+    for i, email in enumerate(board_members):
+        vote = None
+        if i < 2:  # noqa: PLR2004
+            vote = VoteOption.APPROVE if i == 0 else VoteOption.REJECT
+        session.add(
+            VoteRecord(
+                application_id=application.id,
+                voter_email=email,
+                vote=vote,
+                vote_status=VoteStatus.CAST if vote else VoteStatus.PENDING,
+            )
+        )
+    await session.commit()
+    return application.id
+
+
+@pytest.mark.parametrize("board_size", [4, 50])
+def test_check_and_finalize_voting_pending(
+    benchmark: BenchmarkFixture,
+    run: AsyncRunner,
+    bench_settings: Settings,
+    mocker: MockerFixture,
+    board_size: int,
+) -> None:
+    """Benchmark the majority computation for an undecided application."""
+    mocker.patch("projectvote.backend.main.send_email", new_callable=mocker.AsyncMock)
+    board_members = [f"bench.member{i}@example.com" for i in range(board_size)]
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def setup() -> tuple[AsyncSession, int]:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session = async_sessionmaker(bind=engine, expire_on_commit=False)()
+        return session, await _seed_pending_application(session, board_members)
+
+    session, application_id = run(setup())
+
+    benchmark(
+        lambda: run(_check_and_finalize_voting(application_id, session, bench_settings))
+    )
+
+    run(session.close())
+    run(engine.dispose())
+
+
+@pytest.mark.parametrize("applications", [10_000, 100_000])
+def test_decide_batch(benchmark: BenchmarkFixture, applications: int) -> None:
+    """Benchmark re-evaluating many pending applications at once."""
+    approvals = [i % 3 for i in range(applications)]
+    rejects = [i % 2 for i in range(applications)]
+    abstains = [i % 4 // 3 for i in range(applications)]
+    electorate = [5] * applications
+
+    outcomes = benchmark(decide_batch, approvals, rejects, abstains, electorate)
+
+    assert len(outcomes) == applications
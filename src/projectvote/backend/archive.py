@@ -0,0 +1,251 @@
+"""Serialization of the application archive straight from database rows.
+
+The archive only contains data the application wrote itself, so validating
+every row with ``ApplicationOut`` again is wasted work. Instead, the archive is
+loaded with three column queries and assembled into plain dictionaries from
+the row tuples, which are rendered to JSON by pydantic's serializer. The
+dictionaries have the same keys, in the same order, as ``ApplicationOut``, so
+the resulting JSON is identical.
+
+Applications concluded long ago are moved to cold storage, compact archive
+tables that day-to-day queries never touch, by ``move_to_cold_storage``. The
+archive reads hot and cold storage alike: votes and attachments of one
+application are always stored together with it, so the rows of both stores
+only need to be merged by application id.
+"""
+
+import heapq
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from operator import itemgetter
+from typing import Any
+
+from sqlalchemy import ColumnElement, Insert, Select, Table, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import (
+    Application,
+    ArchivedApplication,
+    ArchivedAttachment,
+    ArchivedVote,
+    ArchivedVoteHistory,
+    Attachment,
+    IdempotencyKey,
+    VoteHistory,
+    VoteRecord,
+)
+
+APPLICATION_COLUMNS = (
+    Application.id,
+    Application.first_name,
+    Application.last_name,
+    Application.applicant_email,
+    Application.department,
+    Application.project_title,
+    Application.project_description,
+    Application.costs,
+    Application.status,
+    Application.created_at,
+    Application.concluded_at,
+    Application.voting_deadline,
+)
+VOTE_COLUMNS = (
+    VoteRecord.application_id,
+    VoteRecord.voter_email,
+    VoteRecord.vote,
+    VoteRecord.voted_at,
+)
+ATTACHMENT_COLUMNS = (Attachment.application_id, Attachment.id, Attachment.filename)
+ARCHIVED_APPLICATION_COLUMNS = (
+    ArchivedApplication.id,
+    ArchivedApplication.first_name,
+    ArchivedApplication.last_name,
+    ArchivedApplication.applicant_email,
+    ArchivedApplication.department,
+    ArchivedApplication.project_title,
+    ArchivedApplication.project_description,
+    ArchivedApplication.costs,
+    ArchivedApplication.status,
+    ArchivedApplication.created_at,
+    ArchivedApplication.concluded_at,
+    ArchivedApplication.voting_deadline,
+)
+ARCHIVED_VOTE_COLUMNS = (
+    ArchivedVote.application_id,
+    ArchivedVote.voter_email,
+    ArchivedVote.vote,
+    ArchivedVote.voted_at,
+)
+ARCHIVED_ATTACHMENT_COLUMNS = (
+    ArchivedAttachment.application_id,
+    ArchivedAttachment.id,
+    ArchivedAttachment.filename,
+)
+
+
+def select_applications() -> Select[*tuple[Any, ...]]:
+    """Return the query for the pending and concluded applications, newest first.
+
+    Applications moved to cold storage are archived and read by
+    ``select_archived_applications`` instead.
+    """
+    return select(*APPLICATION_COLUMNS).order_by(Application.id.desc())
+
+
+def select_votes() -> Select[*tuple[Any, ...]]:
+    """Return the query for the votes of all pending and concluded applications."""
+    return select(*VOTE_COLUMNS).order_by(VoteRecord.id)
+
+
+def select_attachments() -> Select[*tuple[Any, ...]]:
+    """Return the query for the attachments of pending and concluded applications."""
+    return select(*ATTACHMENT_COLUMNS).order_by(Attachment.id)
+
+
+def select_archived_applications() -> Select[*tuple[Any, ...]]:
+    """Return the query for the archived applications in cold storage, newest first."""
+    return select(*ARCHIVED_APPLICATION_COLUMNS).order_by(ArchivedApplication.id.desc())
+
+
+def select_archived_votes() -> Select[*tuple[Any, ...]]:
+    """Return the query for the votes of all archived applications."""
+    return select(*ARCHIVED_VOTE_COLUMNS).order_by(ArchivedVote.id)
+
+
+def select_archived_attachments() -> Select[*tuple[Any, ...]]:
+    """Return the query for the attachments of all archived applications."""
+    return select(*ARCHIVED_ATTACHMENT_COLUMNS).order_by(ArchivedAttachment.id)
+
+
+def merge_hot_and_cold(
+    hot: Iterable[Sequence[Any]], cold: Iterable[Sequence[Any]]
+) -> Iterator[Sequence[Any]]:
+    """Merge application rows of both stores, each newest first, into one.
+
+    Examples
+    --------
+    >>> list(merge_hot_and_cold([(5, "e"), (2, "b")], [(4, "d"), (1, "a")]))
+    [(5, 'e'), (4, 'd'), (2, 'b'), (1, 'a')]
+    """
+    return heapq.merge(hot, cold, key=itemgetter(0), reverse=True)
+
+
+def build_archive(
+    applications: Iterable[Sequence[Any]],
+    votes: Iterable[Sequence[Any]],
+    attachments: Iterable[Sequence[Any]],
+) -> list[dict[str, Any]]:
+    """Assemble the archive from row tuples without validating them.
+
+    Parameters
+    ----------
+    applications : Iterable[Sequence[Any]]
+        Rows of ``APPLICATION_COLUMNS``, in archive order.
+    votes : Iterable[Sequence[Any]]
+        Rows of ``VOTE_COLUMNS``.
+    attachments : Iterable[Sequence[Any]]
+        Rows of ``ATTACHMENT_COLUMNS``.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        One dictionary per application, shaped like ``ApplicationOut``.
+    """
+    votes_by_application: defaultdict[int, list[dict[str, Any]]] = defaultdict(list)
+    for application_id, voter_email, decision, voted_at in votes:
+        votes_by_application[application_id].append(
+            {
+                "voter_email": voter_email,
+                "decision": decision,
+                "voted_at": voted_at,
+            }
+        )
+    attachments_by_application: defaultdict[int, list[dict[str, Any]]] = defaultdict(
+        list
+    )
+    for application_id, attachment_id, filename in attachments:
+        attachments_by_application[application_id].append(
+            {
+                "id": attachment_id,
+                "filename": filename,
+            }
+        )
+
+    return [
+        {
+            "id": application_id,
+            "first_name": first_name,
+            "last_name": last_name,
+            "applicant_email": applicant_email,
+            "department": department,
+            "project_title": project_title,
+            "project_description": project_description,
+            "costs": costs,
+            "status": status,
+            "created_at": created_at,
+            "concluded_at": concluded_at,
+            "voting_deadline": voting_deadline,
+            "votes": votes_by_application.get(application_id, []),
+            "attachments": attachments_by_application.get(application_id, []),
+        }
+        for (
+            application_id,
+            first_name,
+            last_name,
+            applicant_email,
+            department,
+            project_title,
+            project_description,
+            costs,
+            status,
+            created_at,
+            concluded_at,
+            voting_deadline,
+        ) in applications
+    ]
+
+
+def _copy_rows(source: Table, target: Table, where: ColumnElement[bool]) -> Insert:
+    """Return an INSERT copying the columns of ``target`` from ``source``."""
+    names = [column.name for column in target.columns]
+    return insert(target).from_select(
+        names, select(*(source.c[name] for name in names)).where(where)
+    )
+
+
+async def move_to_cold_storage(
+    db: AsyncSession, application_ids: Sequence[int]
+) -> None:
+    """Move concluded applications with their votes and attachments to cold storage.
+
+    The rows are copied to the archive tables and deleted from the hot tables
+    in the current transaction; the caller commits. Idempotency keys of the
+    applications are deleted, and attached files stay where they are.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        The session to use.
+    application_ids : Sequence[int]
+        The ids of the applications to move.
+    """
+    in_applications = Application.id.in_(application_ids)
+    of_applications = VoteRecord.application_id.in_(application_ids)
+    of_votes = VoteHistory.vote_id.in_(select(VoteRecord.id).where(of_applications))
+    of_attachments = Attachment.application_id.in_(application_ids)
+
+    for source, target, where in (
+        (Application, ArchivedApplication, in_applications),
+        (VoteRecord, ArchivedVote, of_applications),
+        (VoteHistory, ArchivedVoteHistory, of_votes),
+        (Attachment, ArchivedAttachment, of_attachments),
+    ):
+        await db.execute(_copy_rows(source.__table__, target.__table__, where))
+
+    await db.execute(delete(VoteHistory).where(of_votes))
+    await db.execute(
+        delete(IdempotencyKey).where(IdempotencyKey.application_id.in_(application_ids))
+    )
+    await db.execute(delete(Attachment).where(of_attachments))
+    await db.execute(delete(VoteRecord).where(of_applications))
+    await db.execute(delete(Application).where(in_applications))
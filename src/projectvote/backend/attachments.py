@@ -0,0 +1,352 @@
+"""Storage of uploaded application attachments."""
+
+import asyncio
+import dataclasses
+import gzip
+import hashlib
+import importlib
+import io
+import shutil
+import uuid
+from collections.abc import AsyncIterator, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import aiofiles
+import aiofiles.os
+from fastapi import UploadFile
+
+# Size of the chunks in which uploads are copied to disk.
+CHUNK_SIZE = 1024 * 1024
+
+# Suffix of compressed files per content encoding.
+ENCODING_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+# Types that usually compress well, besides all text/* types. Office Open XML
+# documents are already zip archives, but often still shrink noticeably.
+COMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/json",
+        "application/msword",
+        "application/rtf",
+        "application/vnd.ms-excel",
+        "application/vnd.ms-powerpoint",
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "application/xml",
+    }
+)
+# A compressed file is only kept if it is at most this fraction of the original.
+MAX_COMPRESSED_FRACTION = 0.9
+
+
+class UploadLimitError(ValueError):
+    """Raised when uploaded files exceed the configured count or size limits."""
+
+
+@dataclass(frozen=True, slots=True)
+class StoredFile:
+    """An uploaded file that was written to disk.
+
+    Attributes
+    ----------
+    filename : str
+        The original name of the file.
+    path : Path
+        Where the file was stored, under a unique name.
+    mime_type : str
+        The content type declared by the client.
+    size : int
+        Size of the file in bytes.
+    encoding : str | None
+        Content encoding the file is compressed with, ``None`` if uncompressed.
+    stored_size : int | None
+        Size of the compressed file on disk, ``None`` if uncompressed.
+    """
+
+    filename: str
+    path: Path
+    mime_type: str
+    size: int
+    encoding: str | None = None
+    stored_size: int | None = None
+
+    @property
+    def compression_ratio(self) -> float | None:
+        """Return the original size divided by the compressed size."""
+        if self.stored_size is None:
+            return None
+        return self.size / self.stored_size
+
+
+def _unique_name(filename: str) -> str:
+    """Return a unique file name that keeps the extension of ``filename``."""
+    return f"{uuid.uuid4()}{Path(filename).suffix}"
+
+
+def check_upload_limits(
+    sizes: Sequence[int], *, max_count: int, max_file_size: int, max_total_size: int
+) -> None:
+    """Check the number and sizes of a set of files against the upload limits.
+
+    Raises
+    ------
+    UploadLimitError
+        If the files exceed one of the limits.
+    """
+    if len(sizes) > max_count:
+        msg = f"At most {max_count} attachments are allowed."
+        raise UploadLimitError(msg)
+    if any(size > max_file_size for size in sizes):
+        msg = f"An attachment exceeds the limit of {max_file_size} bytes."
+        raise UploadLimitError(msg)
+    if sum(sizes) > max_total_size:
+        msg = f"The attachments exceed the total limit of {max_total_size} bytes."
+        raise UploadLimitError(msg)
+
+
+async def store_uploads(
+    uploads: Sequence[UploadFile],
+    directory: Path,
+    *,
+    max_count: int,
+    max_file_size: int,
+    max_total_size: int,
+    concurrency: int,
+) -> list[StoredFile]:
+    """Stream uploaded files to ``directory``, at most ``concurrency`` at a time.
+
+    Limits are checked against the declared sizes before anything is written and
+    again while copying, so a client cannot exceed them by misreporting sizes.
+    If any file fails, every file written by this call is removed again.
+
+    Parameters
+    ----------
+    uploads : Sequence[UploadFile]
+        The uploaded files.
+    directory : Path
+        Directory to store the files in; created if missing.
+    max_count : int
+        Maximum number of files.
+    max_file_size : int
+        Maximum size of a single file in bytes.
+    max_total_size : int
+        Maximum combined size of all files in bytes.
+    concurrency : int
+        Maximum number of files written simultaneously.
+
+    Returns
+    -------
+    list[StoredFile]
+        The stored files, in upload order.
+
+    Raises
+    ------
+    UploadLimitError
+        If the files exceed one of the limits.
+    """
+    check_upload_limits(
+        [upload.size or 0 for upload in uploads],
+        max_count=max_count,
+        max_file_size=max_file_size,
+        max_total_size=max_total_size,
+    )
+
+    await aiofiles.os.makedirs(directory, exist_ok=True)
+    paths = [directory / _unique_name(upload.filename or "") for upload in uploads]
+    semaphore = asyncio.Semaphore(concurrency)
+    total = 0
+
+    async def write(upload: UploadFile, path: Path) -> int:
+        nonlocal total
+        size = 0
+        async with semaphore, aiofiles.open(path, "wb") as f:
+            while chunk := await upload.read(CHUNK_SIZE):
+                size += len(chunk)
+                total += len(chunk)
+                if size > max_file_size:
+                    msg = f"An attachment exceeds the limit of {max_file_size} bytes."
+                    raise UploadLimitError(msg)
+                if total > max_total_size:
+                    msg = (
+                        "The attachments exceed the total limit of "
+                        f"{max_total_size} bytes."
+                    )
+                    raise UploadLimitError(msg)
+                await f.write(chunk)
+        return size
+
+    try:
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(write(upload, path))
+                    for upload, path in zip(uploads, paths, strict=True)
+                ]
+        except BaseException:
+            for path in paths:
+                path.unlink(missing_ok=True)
+            raise
+    except* UploadLimitError as group:
+        raise group.exceptions[0] from None
+
+    return [
+        StoredFile(
+            filename=upload.filename or path.name,
+            path=path,
+            mime_type=upload.content_type or "application/octet-stream",
+            size=task.result(),
+        )
+        for upload, path, task in zip(uploads, paths, tasks, strict=True)
+    ]
+
+
+async def link_staged_file(
+    source: Path, directory: Path, filename: str, mime_type: str
+) -> StoredFile:
+    """Link a completed resumable upload from staging into ``directory``.
+
+    The staging file is kept, so the upload is still intact if the submission
+    fails; it is removed once the submission is committed.
+
+    Parameters
+    ----------
+    source : Path
+        The staging file, on the same file system as ``directory``.
+    directory : Path
+        Directory to store the file in; created if missing.
+    filename : str
+        The original name of the file.
+    mime_type : str
+        The content type declared by the client.
+
+    Returns
+    -------
+    StoredFile
+        The stored file.
+    """
+    await aiofiles.os.makedirs(directory, exist_ok=True)
+    path = directory / _unique_name(filename)
+    await aiofiles.os.link(source, path)
+    size = await aiofiles.os.path.getsize(path)
+    return StoredFile(filename=filename, path=path, mime_type=mime_type, size=size)
+
+
+async def write_chunk(
+    path: Path, offset: int, chunks: AsyncIterator[bytes], end: int
+) -> int:
+    """Write a chunk of a resumable upload to its staging file at ``offset``.
+
+    Only the range from ``offset`` to ``end`` is written and the file is never
+    truncated, so writers of different ranges do not interfere. Data left
+    after ``offset`` by a chunk that was only partly received is overwritten
+    when the chunk is sent again.
+
+    Parameters
+    ----------
+    path : Path
+        The staging file, which must exist.
+    offset : int
+        Position at which the chunk starts.
+    chunks : AsyncIterator[bytes]
+        The data of the chunk as it arrives.
+    end : int
+        Position at which the chunk must end.
+
+    Returns
+    -------
+    int
+        The offset after the written data, ``end`` unless the data was short.
+
+    Raises
+    ------
+    UploadLimitError
+        If the data extends beyond ``end``.
+    """
+    async with aiofiles.open(path, "r+b") as f:
+        await f.seek(offset)
+        position = offset
+        async for chunk in chunks:
+            position += len(chunk)
+            if position > end:
+                msg = f"The chunk exceeds its declared end at byte {end}."
+                raise UploadLimitError(msg)
+            await f.write(chunk)
+    return position
+
+
+def _sha256(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+async def file_sha256(path: Path) -> str:
+    """Return the hex SHA-256 digest of a file, computed in a worker thread."""
+    return await asyncio.to_thread(_sha256, path)
+
+
+def should_compress(mime_type: str) -> bool:
+    """Return whether files of ``mime_type`` are worth compressing."""
+    return mime_type.startswith("text/") or mime_type in COMPRESSIBLE_TYPES
+
+
+def open_compressed(path: Path, encoding: str, mode: str) -> io.BufferedIOBase:
+    """Open a file compressed with the content encoding ``encoding``."""
+    if encoding == "gzip":
+        return gzip.GzipFile(path, mode)
+    return importlib.import_module("compression.zstd").open(path, mode)
+
+
+def _compress(source: Path, encoding: str) -> Path:
+    target = source.with_name(source.name + ENCODING_SUFFIXES[encoding])
+    try:
+        with source.open("rb") as src, open_compressed(target, encoding, "wb") as dst:
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
+    except BaseException:
+        # Never leave a partial copy behind
+        target.unlink(missing_ok=True)
+        raise
+    return target
+
+
+async def compress_stored_file(file: StoredFile, encoding: str) -> StoredFile:
+    """Compress a stored file in a worker thread if its type is compressible.
+
+    The compressed copy replaces the file only if it saves enough space, see
+    ``MAX_COMPRESSED_FRACTION``; otherwise the file is kept as it is.
+
+    Parameters
+    ----------
+    file : StoredFile
+        The uncompressed file.
+    encoding : str
+        The content encoding to compress with, ``"gzip"`` or ``"zstd"``.
+
+    Returns
+    -------
+    StoredFile
+        The stored file, with ``encoding`` and ``stored_size`` set if it was
+        compressed.
+    """
+    if (
+        file.encoding is not None
+        or file.size == 0
+        or not should_compress(file.mime_type)
+    ):
+        return file
+    target = await asyncio.to_thread(_compress, file.path, encoding)
+    stored_size = (await aiofiles.os.stat(target)).st_size
+    if stored_size > file.size * MAX_COMPRESSED_FRACTION:
+        await aiofiles.os.remove(target)
+        return file
+    await aiofiles.os.remove(file.path)
+    return dataclasses.replace(
+        file, path=target, encoding=encoding, stored_size=stored_size
+    )
+
+
+def iter_decompressed(path: Path, encoding: str) -> Iterator[bytes]:
+    """Yield the decompressed content of a compressed file in chunks."""
+    with open_compressed(path, encoding, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
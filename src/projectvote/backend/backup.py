@@ -0,0 +1,223 @@
+"""Online backups of the SQLite database together with the uploaded attachments.
+
+The database is copied with SQLite's backup API while the application keeps
+running. A read transaction on the source pins one snapshot of the database
+for the whole copy, so concurrent writes neither tear the backup nor restart
+it. The copy proceeds a limited number of pages at a time with a pause between
+steps, so that requests are not starved.
+
+The attachments referenced by that snapshot, and their previews, are bundled
+with the database in one tar archive. Attachments never change once stored,
+so the archive is consistent even though files uploaded later keep arriving.
+
+Run a backup from the command line with::
+
+    python -m projectvote.backend.backup --output data/backups
+"""
+
+import argparse
+import contextlib
+import datetime as dt
+import functools
+import logging
+import sqlite3
+import tarfile
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from .config import Settings
+from .database import sqlite_database_path
+from .previews import preview_path
+
+logger = logging.getLogger(__name__)
+
+# Name of the database within a backup archive.
+BACKUP_DATABASE_NAME = "applications.db"
+
+
+@dataclass(frozen=True, slots=True)
+class BackupResult:
+    """A finished backup.
+
+    Attributes
+    ----------
+    path : Path
+        The tar archive.
+    size : int
+        Size of the archive in bytes.
+    attachment_count : int
+        Number of attachments in the archive.
+    created_at : dt.datetime
+        When the backup was started.
+    """
+
+    path: Path
+    size: int
+    attachment_count: int
+    created_at: dt.datetime
+
+
+def _pause_between_steps(
+    step_sleep: float, _status: int, remaining: int, _total: int
+) -> None:
+    """Sleep after a backup step, unless it was the last one.
+
+    The ``sleep`` argument of ``sqlite3.Connection.backup`` only applies after
+    a step found the database busy or locked, so it cannot throttle the copy.
+    """
+    if remaining:
+        time.sleep(step_sleep)
+
+
+def backup_database(
+    source: Path, target: Path, *, pages_per_step: int, step_sleep: float
+) -> list[str]:
+    """Copy the SQLite database at ``source`` to ``target`` while it is in use.
+
+    This blocks and is meant to run in a worker thread.
+
+    Parameters
+    ----------
+    source : Path
+        The database to back up.
+    target : Path
+        Where to write the copy.
+    pages_per_step : int
+        Number of database pages copied per step.
+    step_sleep : float
+        Pause between steps in seconds.
+
+    Returns
+    -------
+    list[str]
+        The stored paths of all attachments in the copied snapshot.
+    """
+    with (
+        contextlib.closing(
+            sqlite3.connect(
+                f"{source.resolve().as_uri()}?mode=ro", uri=True, isolation_level=None
+            )
+        ) as source_db,
+        contextlib.closing(sqlite3.connect(target)) as target_db,
+    ):
+        # Without a pinned snapshot, every write to the database restarts the
+        # backup, which might then never finish under load.
+        source_db.execute("BEGIN")
+        try:
+            filepaths = [
+                row[0]
+                for row in source_db.execute(
+                    "SELECT filepath FROM attachments "
+                    "UNION ALL SELECT filepath FROM archived_attachments"
+                )
+            ]
+            source_db.backup(
+                target_db,
+                pages=pages_per_step,
+                progress=functools.partial(_pause_between_steps, step_sleep),
+            )
+        finally:
+            source_db.execute("ROLLBACK")
+    return filepaths
+
+
+def create_backup(
+    database: Path,
+    project_root: Path,
+    output_dir: Path,
+    *,
+    pages_per_step: int,
+    step_sleep: float,
+    now: dt.datetime | None = None,
+) -> BackupResult:
+    """Back up the database and its attachments into one tar archive.
+
+    This blocks and is meant to run in a worker thread.
+
+    Parameters
+    ----------
+    database : Path
+        The SQLite database.
+    project_root : Path
+        Directory that the stored attachment paths are relative to.
+    output_dir : Path
+        Directory to write the archive to.
+    pages_per_step : int
+        Number of database pages copied per step.
+    step_sleep : float
+        Pause between steps in seconds.
+    now : dt.datetime | None
+        The current time, used in the name of the archive.
+
+    Returns
+    -------
+    BackupResult
+        The written archive.
+    """
+    now = now or dt.datetime.now(dt.UTC)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"projectvote-{now:%Y%m%dT%H%M%SZ}.tar"
+    partial = path.with_name(path.name + ".part")
+    attachment_count = 0
+    with tempfile.TemporaryDirectory(dir=output_dir) as tmp:
+        database_copy = Path(tmp) / BACKUP_DATABASE_NAME
+        filepaths = backup_database(
+            database,
+            database_copy,
+            pages_per_step=pages_per_step,
+            step_sleep=step_sleep,
+        )
+        with tarfile.open(partial, "w") as tar:
+            tar.add(database_copy, arcname=BACKUP_DATABASE_NAME)
+            for filepath in filepaths:
+                attachment = project_root / filepath
+                if not attachment.is_file():
+                    logger.warning("Attachment %s is missing from the backup", filepath)
+                    continue
+                tar.add(attachment, arcname=filepath)
+                attachment_count += 1
+                preview = preview_path(attachment)
+                if preview.is_file():
+                    tar.add(preview, arcname=str(preview_path(Path(filepath))))
+    partial.replace(path)
+    return BackupResult(
+        path=path,
+        size=path.stat().st_size,
+        attachment_count=attachment_count,
+        created_at=now,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Back up the configured database from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Back up the database and the uploaded attachments."
+    )
+    parser.add_argument(
+        "--output", type=Path, help="directory for the archive (default: BACKUP_DIR)"
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    settings = Settings()
+    database = sqlite_database_path(settings.database_url)
+    if database is None:
+        parser.error("Online backups are only supported for SQLite databases.")
+    result = create_backup(
+        database,
+        settings.project_root,
+        args.output or settings.project_root / settings.backup_dir,
+        pages_per_step=settings.backup_pages_per_step,
+        step_sleep=settings.backup_step_sleep_seconds,
+    )
+    logger.info(
+        "Backed up the database and %d attachments to %s (%d bytes)",
+        result.attachment_count,
+        result.path,
+        result.size,
+    )
+
+
+if __name__ == "__main__":
+    main()
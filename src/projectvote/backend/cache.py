@@ -0,0 +1,99 @@
+"""Small in-process caches used by the API."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+
+class TTLCache[K, V]:
+    """A bounded mapping whose entries expire after a fixed time to live.
+
+    Entries are evicted in least-recently-used order once ``maxsize`` is reached.
+    The cache is local to the process; it is meant for data that is cheap to
+    recompute and whose staleness is bounded by ``ttl``.
+
+    A value computed while an invalidation was running may already be stale. To
+    avoid storing it, read ``generation`` before computing the value and pass it
+    to ``set``, which then skips the write if anything was invalidated since.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of entries. ``0`` disables the cache.
+    ttl : float
+        Time to live of an entry in seconds. ``0`` disables the cache.
+    timer : Callable[[], float]
+        Monotonic clock used to compute expiry times.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._timer = timer
+        self._generation = 0
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones."""
+        return len(self._data)
+
+    @property
+    def generation(self) -> int:
+        """Return a counter that is advanced by every invalidation."""
+        return self._generation
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether the cache stores anything at all."""
+        return self.maxsize > 0 and self.ttl > 0
+
+    def configure(self, maxsize: int, ttl: float) -> None:
+        """Change the size limit and time to live, dropping all entries."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clear()
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for ``key``, or ``None`` if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._timer():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, generation: int | None = None) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry.
+
+        If ``generation`` is given and entries were invalidated since it was
+        read, the value is not stored.
+        """
+        if not self.enabled or generation not in {None, self._generation}:
+            return
+        self._data[key] = (self._timer() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, *keys: K) -> None:
+        """Remove the given keys from the cache."""
+        self.invalidate_many(keys)
+
+    def invalidate_many(self, keys: Iterable[K]) -> None:
+        """Remove every key of ``keys`` from the cache."""
+        self._generation += 1
+        for key in keys:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._generation += 1
+        self._data.clear()
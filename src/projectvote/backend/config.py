@@ -1,6 +1,8 @@
 """Configuration for the application, loaded from environment variables."""
 
+import importlib
 from pathlib import Path
+from typing import Literal
 
 from pydantic import EmailStr, Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -29,7 +31,20 @@ class Settings(BaseSettings):
     mail_starttls: bool = False
     mail_ssl_tls: bool = False
     mail_from_name: str = "ProjectVote"
+    # "smtp" (or "console", which skips the password check) sends via SMTP,
+    # "file" appends messages to a local mailbox and "null" only counts them.
     mail_driver: str = "smtp"
+    # Mailbox written by the "file" driver, relative to the project root.
+    mail_file_path: Path = Path("data/outbox.mbox")
+    mail_file_format: Literal["mbox", "maildir"] = "mbox"
+    # Address an email to several recipients as one message with all of them in
+    # BCC instead of one message per recipient.
+    mail_use_bcc: bool = False
+    # A message that failed this many times is dead-lettered and only sent
+    # again on explicit request.
+    mail_max_attempts: int = 3
+    # Number of failed messages re-sent per transaction.
+    mail_resend_batch_size: int = 50
 
     # Application settings
     frontend_url: str = "http://localhost:5173"
@@ -37,9 +52,89 @@ class Settings(BaseSettings):
     send_automatic_confirmation_email: bool = False
     send_automatic_rejection_email: bool = False
     tz: str = Field(default="Europe/Berlin")
+    # Secret used to sign magic links for the voter dashboard. Magic links are
+    # disabled while it is unset; voting tokens keep working either way.
+    secret_key: SecretStr | None = None
+    # Token required in the X-Admin-Token header of the admin API, which is
+    # disabled while it is unset.
+    admin_token: SecretStr | None = None
+
+    # Voting closes this many days after submission. 0 means no deadline.
+    voting_period_days: int = 0
+
+    # Attachment uploads
+    max_attachment_count: int = 10
+    max_attachment_bytes: int = 10 * 1024 * 1024
+    max_attachments_total_bytes: int = 50 * 1024 * 1024
+    # Maximum number of attachments of one submission written simultaneously.
+    attachment_write_concurrency: int = 4
+    # Compress attachments of compressible types at rest: "none", "gzip" or
+    # "zstd" (Python 3.14+).
+    attachment_compression: Literal["none", "gzip", "zstd"] = "none"
+
+    @field_validator("attachment_compression")
+    @classmethod
+    def compression_must_be_available(cls, v: str) -> str:
+        """Validate that the chosen compression is supported by this Python."""
+        if v == "zstd":
+            try:
+                importlib.import_module("compression.zstd")
+            except ImportError as e:
+                msg = "zstd compression requires Python 3.14 or later."
+                raise ValueError(msg) from e
+        return v
+
+    # Resumable uploads not submitted within this many hours are deleted.
+    resumable_upload_ttl_hours: float = 24.0
+    # Number of worker processes rendering attachment previews (needs the
+    # "previews" extra). 0 disables previews.
+    preview_processes: int = 1
+    # Maximum width and height of previews in pixels.
+    preview_max_size: int = 320
+    # Maximum number of attachments waiting for a preview.
+    preview_queue_size: int = 100
+
+    # Background jobs. With several instances sharing a database, enable the
+    # scheduler on exactly one of them; the jobs do not coordinate.
+    scheduler_enabled: bool = True
+    scheduler_interval_seconds: float = 3600.0
+    # Remind board members of votes still pending after this many days, at most
+    # once per this many days per member. 0 disables reminders.
+    reminder_after_days: int = 0
+    # Maximum number of expired applications concluded per deadline sweep batch.
+    deadline_sweep_batch_size: int = 100
+    # Idempotency keys of submissions are remembered for this many hours.
+    idempotency_key_ttl_hours: float = 24.0
+    # Move applications concluded more than this many years ago to the archive
+    # tables, this many per transaction. 0 keeps all applications in place.
+    archive_after_years: int = 0
+    archive_batch_size: int = 500
 
     # Database settings
+    # Any async SQLAlchemy URL, e.g. postgresql+asyncpg://user:pw@host/db (needs
+    # the "postgres" extra). Relative SQLite paths are resolved against the
+    # working directory.
+    database_url: str = "sqlite+aiosqlite:///./data/applications.db"
     db_echo: bool = True
+    # Replica serving read-only queries. With SQLite, reads use a read-only
+    # connection to the main database instead.
+    database_read_url: str | None = None
+    # Connection pool of each engine. Connections older than
+    # db_pool_recycle_seconds are replaced; -1 keeps them open indefinitely.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle_seconds: int = -1
+
+    # Online backups of SQLite databases, written to this directory relative to
+    # the project root. The database is copied this many pages per step, with
+    # a pause between steps so that requests are not starved.
+    backup_dir: Path = Path("data/backups")
+    backup_pages_per_step: int = 256
+    backup_step_sleep_seconds: float = 0.005
+
+    # Cache settings (a size or TTL of 0 disables the cache)
+    vote_details_cache_size: int = 1024
+    vote_details_cache_ttl_seconds: float = 300.0
 
     # This assumes that config.py is in src/projectvote/backend
     # So the project root is 4 levels up.
@@ -1,29 +1,162 @@
-"""Database configuration and session management for the application."""
+"""Database configuration and session management for the application.
+
+Writes and reads use separate engines, so long reads such as the archive or
+attachment downloads never hold connections that vote writes are waiting for.
+With SQLite, the database runs in WAL mode and the reader opens it read-only,
+which lets reads proceed while a write is in progress. Other databases can
+point the reader at a replica with ``DATABASE_READ_URL``.
+
+The database is configured with ``DATABASE_URL`` and the ``DB_POOL_*``
+settings, see ``Settings``.
+"""
 
 from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
 
+from sqlalchemy import URL, event, make_url
+from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from .config import Settings
 
-DATABASE_URL = "sqlite+aiosqlite:///./data/applications.db"
-
 settings = Settings()
 
-engine = create_async_engine(DATABASE_URL, echo=settings.db_echo)
+DATABASE_URL = settings.database_url
+
+
+def sqlite_database_path(url: str) -> Path | None:
+    """Return the file of the SQLite database at ``url``.
+
+    Returns ``None`` for other databases and in-memory SQLite databases.
+
+    Examples
+    --------
+    >>> sqlite_database_path("sqlite+aiosqlite:///./data/applications.db")
+    PosixPath('data/applications.db')
+    >>> sqlite_database_path("postgresql+asyncpg://localhost/projectvote") is None
+    True
+    """
+    parsed = make_url(url)
+    database = parsed.database
+    if (
+        parsed.get_backend_name() != "sqlite"
+        or database is None
+        or database in {"", ":memory:"}
+    ):
+        return None
+    return Path(database)
+
+
+def read_only_url(url: str) -> URL:
+    """Return the URL of a read-only connection to the SQLite database at ``url``.
+
+    Examples
+    --------
+    >>> read_only = read_only_url("sqlite+aiosqlite:///./data/applications.db")
+    >>> read_only.database, dict(read_only.query)
+    ('file:./data/applications.db', {'mode': 'ro', 'uri': 'true'})
+    """
+    parsed = make_url(url)
+    return parsed.set(
+        database=f"file:{parsed.database}",
+        query={**parsed.query, "mode": "ro", "uri": "true"},
+    )
+
+
+def _enable_wal(dbapi_connection: DBAPIConnection, _: ConnectionPoolEntry) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    finally:
+        cursor.close()
+
+
+def create_engines(
+    url: str,
+    read_url: str | None = None,
+    *,
+    echo: bool = False,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_recycle: int = -1,
+) -> tuple[AsyncEngine, AsyncEngine]:
+    """Create the writer and the reader engine for the database at ``url``.
+
+    Parameters
+    ----------
+    url : str
+        URL of the database.
+    read_url : str | None
+        URL of a replica to read from. Defaults to a read-only connection to
+        ``url`` for SQLite and to ``url`` itself for other databases.
+    echo : bool
+        Whether to log all statements.
+    pool_size : int
+        Number of connections kept open by each engine.
+    max_overflow : int
+        Number of additional connections each engine opens under load.
+    pool_recycle : int
+        Age in seconds after which connections are replaced, ``-1`` for never.
+
+    Returns
+    -------
+    tuple[AsyncEngine, AsyncEngine]
+        The writer and the reader engine.
+    """
+    options: dict[str, Any] = {"echo": echo}
+    reader_url: str | URL = read_url or url
+    is_sqlite = make_url(url).get_backend_name() == "sqlite"
+    if not is_sqlite or sqlite_database_path(url) is not None:
+        # In-memory SQLite databases live in a single, static connection.
+        options |= {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_recycle": pool_recycle,
+        }
+    writer = create_async_engine(url, **options)
+    if sqlite_database_path(url) is not None:
+        event.listen(writer.sync_engine, "connect", _enable_wal)
+        if read_url is None:
+            reader_url = read_only_url(url)
+    reader = create_async_engine(reader_url, **options)
+    return writer, reader
+
+
+engine, read_engine = create_engines(
+    DATABASE_URL,
+    settings.database_read_url,
+    echo=settings.db_echo,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle_seconds,
+)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
     expire_on_commit=False,
 )
+ReadSessionLocal = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Yield a new database session."""
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield a new session for read-only queries from the reader engine."""
+    async with ReadSessionLocal() as session:
+        yield session
@@ -1,6 +1,16 @@
 """Email sending service for the application."""
 
+import asyncio
+import datetime as dt
+import functools
 import logging
+import mailbox
+import threading
+import time
+from collections import Counter
+from collections.abc import Collection
+from email.message import EmailMessage
+from email.utils import formataddr, formatdate, make_msgid
 from pathlib import Path
 from typing import Any
 
@@ -11,12 +21,89 @@ from fastapi_mail import (
     MessageType,
     NameEmail,
 )
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from pydantic import EmailStr, SecretStr
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .config import Settings
+from .models import DeliveryStatus, EmailDelivery
 
 logger = logging.getLogger(__name__)
 
+TEMPLATE_DIR = Path(__file__).parent / "templates" / "email"
+
+# Number of messages handed to each mail driver by this process.
+delivery_counts: Counter[str] = Counter()
+
+_mailbox_lock = threading.Lock()
+
+
+@functools.cache
+def get_template_environment() -> Environment:
+    """Return the process-wide Jinja environment for email templates.
+
+    Templates are looked up relative to this package, independent of the working
+    directory. Parsed templates are kept in memory, and their compiled bytecode
+    is cached on disk so that new processes skip the parsing step as well.
+
+    Returns
+    -------
+    Environment
+        The shared Jinja environment.
+    """
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        bytecode_cache=FileSystemBytecodeCache(),
+        autoescape=True,
+        auto_reload=False,
+    )
+
+
+def precompile_templates() -> list[str]:
+    """Load every email template into the shared environment.
+
+    Called once at startup, so a missing template directory or a syntax error in
+    a template fails the boot instead of the first email.
+
+    Returns
+    -------
+    list[str]
+        The names of the loaded templates.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the template directory contains no templates.
+    """
+    env = get_template_environment()
+    names = env.list_templates(extensions=["html"])
+    if not names:
+        msg = f"No email templates found in {TEMPLATE_DIR}."
+        raise FileNotFoundError(msg)
+    for name in names:
+        env.get_template(name)
+    return names
+
+
+async def render_template(template_name: str, template_body: dict[str, Any]) -> str:
+    """Render an email template in a worker thread.
+
+    Parameters
+    ----------
+    template_name : str
+        The name of the HTML template to use.
+    template_body : dict[str, Any]
+        A dictionary with the template variables.
+
+    Returns
+    -------
+    str
+        The rendered HTML.
+    """
+    template = get_template_environment().get_template(template_name)
+    return await asyncio.to_thread(template.render, template_body)
+
 
 def get_mailer(settings: Settings) -> FastMail:
     """Return a FastMail instance based on application settings.
@@ -52,20 +139,174 @@ def get_mailer(settings: Settings) -> FastMail:
         MAIL_FROM_NAME=settings.mail_from_name,
         USE_CREDENTIALS=True,
         VALIDATE_CERTS=True,
-        TEMPLATE_FOLDER=Path("./src/projectvote/backend/templates/email"),
     )
     return FastMail(conf)
 
 
+def build_messages(
+    recipients: list[EmailStr], subject: str, body: str, settings: Settings
+) -> list[MessageSchema]:
+    """Address a rendered email to every recipient.
+
+    Each recipient gets a separate message, so no one sees the other addresses.
+    With ``mail_use_bcc`` enabled, a single message addressed to the sender with
+    all recipients in BCC is built instead.
+
+    Parameters
+    ----------
+    recipients : list[EmailStr]
+        A list of email addresses.
+    subject : str
+        The subject of the email.
+    body : str
+        The rendered HTML body, shared by all messages.
+    settings : Settings
+        The application settings.
+
+    Returns
+    -------
+    list[MessageSchema]
+        The messages to send.
+    """
+    addresses = [NameEmail(name=r, email=r) for r in recipients]
+    if settings.mail_use_bcc and len(addresses) > 1:
+        sender = NameEmail(name=settings.mail_from_name, email=settings.mail_from)
+        return [
+            MessageSchema(
+                subject=subject,
+                recipients=[sender],
+                bcc=addresses,
+                body=body,
+                subtype=MessageType.html,
+            )
+        ]
+    return [
+        MessageSchema(
+            subject=subject,
+            recipients=[address],
+            body=body,
+            subtype=MessageType.html,
+        )
+        for address in addresses
+    ]
+
+
+def _format_address(address: NameEmail) -> str:
+    # Recipients are addressed by their email only, without repeating it as name.
+    if address.name in {"", address.email}:
+        return address.email
+    return formataddr((address.name, address.email))
+
+
+def to_email_message(message: MessageSchema, settings: Settings) -> EmailMessage:
+    """Build the MIME message the file driver stores for ``message``.
+
+    Blind copies are kept in a ``Bcc`` header, so the local mailbox records
+    every recipient.
+
+    Parameters
+    ----------
+    message : MessageSchema
+        The message to build.
+    settings : Settings
+        The application settings, providing the sender.
+
+    Returns
+    -------
+    EmailMessage
+        The message with its headers and HTML or plain text body.
+    """
+    email = EmailMessage()
+    email["Subject"] = message.subject
+    email["From"] = formataddr((settings.mail_from_name, settings.mail_from))
+    email["To"] = ", ".join(_format_address(r) for r in message.recipients)
+    if message.bcc:
+        email["Bcc"] = ", ".join(_format_address(r) for r in message.bcc)
+    email["Date"] = formatdate(localtime=True)
+    email["Message-ID"] = make_msgid()
+    email.set_content(str(message.body or ""), subtype=message.subtype.value)
+    return email
+
+
+def append_to_mailbox(
+    path: Path, mail_format: str, messages: list[EmailMessage]
+) -> None:
+    """Append messages to a local mbox file or maildir, creating it if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    box = (
+        mailbox.Maildir(path, create=True)
+        if mail_format == "maildir"
+        else mailbox.mbox(path)
+    )
+    with _mailbox_lock:
+        box.lock()
+        try:
+            for message in messages:
+                box.add(message)
+        finally:
+            box.close()
+
+
+async def deliver_messages(messages: list[MessageSchema], settings: Settings) -> None:
+    """Hand messages to the mail driver configured in ``settings``.
+
+    Parameters
+    ----------
+    messages : list[MessageSchema]
+        The messages to deliver.
+    settings : Settings
+        The application settings.
+    """
+    if settings.mail_driver == "file":
+        await asyncio.to_thread(
+            append_to_mailbox,
+            settings.project_root / settings.mail_file_path,
+            settings.mail_file_format,
+            [to_email_message(message, settings) for message in messages],
+        )
+    elif settings.mail_driver != "null":
+        await get_mailer(settings).send_message(messages)
+    delivery_counts[settings.mail_driver] += len(messages)
+
+
+async def _deliver_timed(
+    messages: list[MessageSchema], recipients: list[str], settings: Settings
+) -> tuple[str | None, float]:
+    """Deliver messages and return the error, if any, and the latency in ms."""
+    start = time.perf_counter()
+    try:
+        await deliver_messages(messages, settings)
+    except Exception as error:
+        logger.exception(
+            "An unexpected error occurred while sending email to %s", recipients
+        )
+        return repr(error), (time.perf_counter() - start) * 1000
+    return None, (time.perf_counter() - start) * 1000
+
+
+def _failure_status(attempts: int, settings: Settings) -> DeliveryStatus:
+    """Return the status of a message that failed on its ``attempts``-th try."""
+    if attempts >= settings.mail_max_attempts:
+        return DeliveryStatus.DEAD
+    return DeliveryStatus.FAILED
+
+
 async def send_email(
     recipients: list[EmailStr],
     subject: str,
     template_body: dict[str, Any],
     template_name: str,
     settings: Settings,
+    *,
+    db: AsyncSession | None = None,
 ) -> None:
     """Send an email to a list of recipients.
 
+    The template is rendered once and all messages are delivered over a single
+    SMTP connection, see ``build_messages`` for how recipients are addressed.
+    Delivery errors are logged, not raised. If ``db`` is given, the outcome is
+    added to the delivery log, one entry per recipient; the caller commits.
+
     Parameters
     ----------
     recipients : list[EmailStr]
@@ -78,18 +319,93 @@ async def send_email(
         The name of the HTML template to use.
     settings : Settings
         The application settings.
+    db : AsyncSession | None
+        Session to record the deliveries in.
     """
-    message = MessageSchema(
-        subject=subject,
-        recipients=[NameEmail(name=r, email=r) for r in recipients],
-        template_body=template_body,
-        subtype=MessageType.html,
-    )
-    mailer = get_mailer(settings)
-    try:
-        await mailer.send_message(message, template_name=template_name)
+    body = await render_template(template_name, template_body)
+    messages = build_messages(recipients, subject, body, settings)
+    error, latency_ms = await _deliver_timed(messages, recipients, settings)
+    if error is None:
         logger.info("Email sent to %s with subject '%s'", recipients, subject)
-    except Exception:
-        logger.exception(
-            "An unexpected error occurred while sending email to %s", recipients
+    if db is not None:
+        db.add_all(
+            EmailDelivery(
+                recipient=recipient,
+                subject=subject,
+                template_name=template_name,
+                template_body=template_body,
+                status=DeliveryStatus.SENT
+                if error is None
+                else _failure_status(1, settings),
+                last_error=error,
+                latency_ms=latency_ms,
+            )
+            for recipient in recipients
+        )
+
+
+async def resend_failed_emails(
+    db: AsyncSession,
+    settings: Settings,
+    ids: Collection[int] | None = None,
+    *,
+    include_dead: bool = False,
+) -> Counter[DeliveryStatus]:
+    """Send failed emails from the delivery log again.
+
+    Messages are processed in id order in batches of ``mail_resend_batch_size``,
+    committing after every batch. Every message is attempted at most once per
+    call.
+
+    Parameters
+    ----------
+    db : AsyncSession
+        The database session.
+    settings : Settings
+        The application settings.
+    ids : Collection[int] | None
+        Restrict the re-send to these delivery ids.
+    include_dead : bool
+        Whether dead-lettered messages are sent again as well.
+
+    Returns
+    -------
+    Counter[DeliveryStatus]
+        The number of processed messages per resulting status.
+    """
+    statuses = [DeliveryStatus.FAILED]
+    if include_dead:
+        statuses.append(DeliveryStatus.DEAD)
+    outcomes: Counter[DeliveryStatus] = Counter()
+    last_id = 0
+    while True:
+        query = (
+            select(EmailDelivery)
+            .where(EmailDelivery.status.in_(statuses), EmailDelivery.id > last_id)
+            .order_by(EmailDelivery.id)
+            .limit(settings.mail_resend_batch_size)
         )
+        if ids is not None:
+            query = query.where(EmailDelivery.id.in_(ids))
+        batch = (await db.execute(query)).scalars().all()
+        if not batch:
+            return outcomes
+        for delivery in batch:
+            body = await render_template(delivery.template_name, delivery.template_body)
+            messages = build_messages(
+                [delivery.recipient], delivery.subject, body, settings
+            )
+            error, delivery.latency_ms = await _deliver_timed(
+                messages, [delivery.recipient], settings
+            )
+            delivery.attempts += 1
+            delivery.last_error = error
+            delivery.last_attempt_at = dt.datetime.now(dt.UTC)
+            delivery.status = (
+                DeliveryStatus.SENT
+                if error is None
+                else _failure_status(delivery.attempts, settings)
+            )
+            outcomes[delivery.status] += 1
+        last_id = batch[-1].id
+        await db.commit()
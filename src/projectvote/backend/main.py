@@ -1,37 +1,133 @@
 """FastAPI application for ProjectVote."""
 
+import asyncio
+import contextlib
 import datetime as dt
+import functools
+import hmac
+import itertools
 import os
 import tomllib
-import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Sequence
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, cast
+from urllib.parse import quote
 from zoneinfo import ZoneInfo
 
-import aiofiles
+import aiofiles.os
 from dotenv import load_dotenv
-from fastapi import Depends, FastAPI, File, Form, HTTPException, UploadFile
+from fastapi import (
+    Depends,
+    FastAPI,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, ConfigDict, Field, field_validator
-from sqlalchemy import select
+from fastapi.responses import FileResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import (
+    ColumnElement,
+    CursorResult,
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from .archive import (
+    build_archive,
+    merge_hot_and_cold,
+    move_to_cold_storage,
+    select_applications,
+    select_archived_applications,
+    select_archived_attachments,
+    select_archived_votes,
+    select_attachments,
+    select_votes,
+)
+from .attachments import (
+    StoredFile,
+    UploadLimitError,
+    check_upload_limits,
+    compress_stored_file,
+    file_sha256,
+    iter_decompressed,
+    link_staged_file,
+    store_uploads,
+    write_chunk,
+)
+from .backup import create_backup
+from .cache import TTLCache
 from .config import Settings
-from .database import DATABASE_URL, engine, get_db
-from .email_service import send_email
+from .database import (
+    DATABASE_URL,
+    AsyncSessionLocal,
+    engine,
+    get_db,
+    get_read_db,
+    sqlite_database_path,
+)
+from .email_service import precompile_templates, resend_failed_emails, send_email
 from .models import (
     Application,
     ApplicationStatus,
+    ArchivedAttachment,
     Attachment,
     Base,
+    BoardMember,
+    DeliveryStatus,
+    EmailDelivery,
+    IdempotencyKey,
+    Reminder,
+    ResumableUpload,
+    VoteHistory,
     VoteOption,
     VoteRecord,
     VoteStatus,
 )
+from .previews import (
+    PREVIEW_CACHE_MAX_AGE,
+    PREVIEW_MEDIA_TYPE,
+    PreviewWorker,
+    preview_path,
+)
+from .responses import (
+    PydanticJSONResponse,
+    ResponseCompressionMiddleware,
+    accepts_encoding,
+)
+from .scheduler import Scheduler
+from .signing import create_voter_token, verify_voter_token
+from .voting import decide_batch
+
+VOTING_CLOSED_DETAIL = "Voting for this application has closed."
+
+# Rendered `GET /vote/{token}` payloads with the voting deadline of their
+# application, keyed by token. Board members and email link scanners open the
+# same link repeatedly, and the payload only changes when that vote is cast or
+# the application concludes.
+vote_details_cache: TTLCache[str, tuple[bytes, dt.datetime | None]] = TTLCache(
+    maxsize=1024, ttl=300.0
+)
+preview_worker = PreviewWorker()
+# Held while a backup is written; backups are not taken concurrently.
+backup_lock = asyncio.Lock()
 
 
 @asynccontextmanager
@@ -39,16 +135,39 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
     """Handle application startup and shutdown events."""
     # Ensure the data directory exists before creating tables.
     # This is placed here to run once on application startup.
-    db_path_str = DATABASE_URL.split("///", 1)[1]
-    db_dir = Path(db_path_str).parent
-    db_dir.mkdir(parents=True, exist_ok=True)
+    db_path = sqlite_database_path(DATABASE_URL)
+    if db_path is not None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Database table creation
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    settings = get_app_settings()
+    # Parse every email template now, so a broken install fails at boot.
+    precompile_templates()
+    vote_details_cache.configure(
+        maxsize=settings.vote_details_cache_size,
+        ttl=settings.vote_details_cache_ttl_seconds,
+    )
+
+    # Mirror the configured board into the database once per process start.
+    async with AsyncSessionLocal() as db:
+        await sync_board_members(db, parse_board_members(settings))
+
+    scheduler = create_scheduler(settings)
+    scheduler.start()
+    preview_worker.start(
+        processes=settings.preview_processes,
+        max_size=settings.preview_max_size,
+        queue_size=settings.preview_queue_size,
+    )
+
     yield
 
+    await preview_worker.stop()
+    await scheduler.stop()
+
 
 app = FastAPI(lifespan=lifespan)
 
@@ -64,6 +183,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Compress JSON and other large bodies with brotli or gzip
+app.add_middleware(ResponseCompressionMiddleware)  # type: ignore[arg-type]
 
 
 def get_app_settings() -> Settings:
@@ -89,22 +210,84 @@ def get_app_settings() -> Settings:
     return Settings()
 
 
-def get_board_members(
+def unique_emails(emails: Iterable[str]) -> list[str]:
+    """Strip emails and drop empty entries and case-insensitive duplicates.
+
+    The first spelling of an address is kept.
+
+    >>> unique_emails([" a@x.com", "", "b@x.com ", "A@X.com"])
+    ['a@x.com', 'b@x.com']
+    """
+    unique: dict[str, str] = {}
+    for email in (email.strip() for email in emails):
+        if email:
+            unique.setdefault(email.lower(), email)
+    return list(unique.values())
+
+
+def parse_board_members(settings: Settings) -> list[str]:
+    """Parse the comma-separated list of board members from settings."""
+    assert settings.board_members is not None  # Type narrowing for static analysis
+    return unique_emails(settings.board_members.split(","))
+
+
+async def sync_board_members(db: AsyncSession, emails: list[str]) -> None:
+    """Make the active board members in the database match the given emails.
+
+    Members missing from ``emails`` are deactivated rather than deleted, and
+    previously deactivated members are reactivated when they are configured again.
+    Emails are compared case-insensitively.
+    """
+    result = await db.execute(select(BoardMember).order_by(BoardMember.id))
+    wanted = {email.lower(): email for email in unique_emails(emails)}
+
+    for member in result.scalars():
+        # Only the first of members differing in case stays active
+        member.is_active = wanted.pop(member.email.lower(), None) is not None
+    db.add_all(BoardMember(email=email) for email in wanted.values())
+    await db.commit()
+
+
+async def get_board_members(
+    db: Annotated[AsyncSession, Depends(get_db)],
     settings: Annotated[Settings, Depends(get_app_settings)],
 ) -> list[str]:
-    """Provide the list of board members from settings."""
-    assert settings.board_members is not None  # Type narrowing for static analysis
-    return [email.strip() for email in settings.board_members.split(",")]
+    """Provide the list of active board members.
+
+    The database is the source of truth once it has been synchronized at startup.
+    The configuration is only used as a fallback for an empty table.
+    """
+    result = await db.execute(
+        select(BoardMember.email)
+        .where(BoardMember.is_active.is_(True))
+        .order_by(BoardMember.id)
+    )
+    emails = list(result.scalars())
+    return emails or parse_board_members(settings)
+
+
+DEFAULT_TIMEZONE = "Europe/Berlin"
+
+
+@functools.cache
+def get_timezone(key: str) -> ZoneInfo:
+    """Return the timezone named ``key``, looked up only once per name."""
+    return ZoneInfo(key)
 
 
 def get_configured_timezone() -> ZoneInfo:
     """Return the Berlin timezone (default)."""
-    return ZoneInfo("Europe/Berlin")
+    return get_timezone(DEFAULT_TIMEZONE)
 
 
 def get_now() -> dt.datetime:
     """Get current time in UTC."""
-    return dt.datetime.now(ZoneInfo("UTC"))
+    return dt.datetime.now(dt.UTC)
+
+
+def is_past(timestamp: dt.datetime | None) -> bool:
+    """Return whether ``timestamp`` lies in the past."""
+    return timestamp is not None and timestamp <= get_now()
 
 
 def format_datetime_for_email(
@@ -114,10 +297,10 @@ def format_datetime_for_email(
     if not timestamp:
         return "N/A"
     # Determine timezone to use
-    tz = get_configured_timezone() if settings is None else ZoneInfo(settings.tz)
-    # Datetimes from SQLite are naive. We assume they were stored as UTC.
+    tz = get_configured_timezone() if settings is None else get_timezone(settings.tz)
+    # Timestamps from the database are aware; naive values are taken as UTC.
     if timestamp.tzinfo is None:
-        timestamp = timestamp.replace(tzinfo=ZoneInfo("UTC"))
+        timestamp = timestamp.replace(tzinfo=dt.UTC)
     localized_time = timestamp.astimezone(tz)
     return localized_time.strftime("%d.%m.%Y, %H:%M Uhr")
 
@@ -152,14 +335,6 @@ class VoteOut(BaseModel):
     decision: VoteOption | None = Field(validation_alias="vote")
     voted_at: dt.datetime | None
 
-    @field_validator("voted_at", mode="after")
-    @classmethod
-    def make_voted_at_utc(cls, v: dt.datetime | None) -> dt.datetime | None:
-        """Ensure naive voted_at datetimes are treated as UTC."""
-        if v is not None and v.tzinfo is None:
-            return v.replace(tzinfo=dt.UTC)
-        return v
-
 
 class AttachmentOut(BaseModel):
     """Schema for displaying an attachment."""
@@ -186,22 +361,141 @@ class ApplicationOut(BaseModel):
     status: ApplicationStatus
     created_at: dt.datetime
     concluded_at: dt.datetime | None
+    voting_deadline: dt.datetime | None = None
     votes: list[VoteOut]
     attachments: list[AttachmentOut] = []
 
-    @field_validator("created_at", "concluded_at", mode="after")
-    @classmethod
-    def make_datetimes_utc(cls, v: dt.datetime | None) -> dt.datetime | None:
-        """Ensure naive datetimes are treated as UTC."""
-        if v is not None and v.tzinfo is None:
-            return v.replace(tzinfo=dt.UTC)
-        return v
+
+class VoteApplicationOut(BaseModel):
+    """Schema for the application shown on a voting page."""
+
+    id: int
+    project_title: str
+    project_description: str
+    costs: float
+    department: str
+    attachments: list[AttachmentOut]
+
+
+class VoteDetailsOut(BaseModel):
+    """Schema for the voting page of one board member."""
+
+    voter_email: str
+    application: VoteApplicationOut
+    vote_options: list[VoteOption]
+    current_vote: VoteOption | None
+
+
+class BatchVoteItem(BaseModel):
+    """Schema for one decision within a batch of votes."""
+
+    token: str
+    decision: VoteOption
+
+
+class BatchVoteCreate(BaseModel):
+    """Schema for casting several votes at once."""
+
+    votes: list[BatchVoteItem] = Field(min_length=1)
+
+
+class OpenVoteOut(BaseModel):
+    """Schema for a vote on an application that is still open."""
+
+    token: str
+    application_id: int
+    project_title: str
+    department: str
+    costs: float
+    created_at: dt.datetime
+    current_vote: VoteOption | None
+
+
+class VoterDashboardOut(BaseModel):
+    """Schema for all open votes of one board member."""
+
+    voter_email: str
+    votes: list[OpenVoteOut]
+
+
+class EmailDeliveryOut(BaseModel):
+    """Schema for an entry of the email delivery log."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    recipient: str
+    subject: str
+    template_name: str
+    status: DeliveryStatus
+    attempts: int
+    last_error: str | None
+    latency_ms: float | None
+    created_at: dt.datetime
+    last_attempt_at: dt.datetime
+
+
+class EmailResendRequest(BaseModel):
+    """Schema for re-sending failed emails, all of them unless ``ids`` is given."""
+
+    ids: list[int] | None = None
+    include_dead: bool = False
+
+
+class UploadCreate(BaseModel):
+    """Schema for starting a resumable upload."""
+
+    filename: str = Field(min_length=1, max_length=255)
+    mime_type: str = "application/octet-stream"
+    length: int = Field(ge=0)
+
+
+class UploadComplete(BaseModel):
+    """Schema for finishing a resumable upload."""
+
+    sha256: str = Field(pattern=r"^[0-9a-fA-F]{64}$")
+
+
+class UploadOut(BaseModel):
+    """Schema for the state of a resumable upload."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    filename: str
+    mime_type: str
+    length: int
+    offset: int
+    sha256: str | None
+
+
+class TemplateDeliveryStats(BaseModel):
+    """Schema for the delivery statistics of one email template."""
+
+    template_name: str
+    total: int
+    sent: int
+    failed: int
+    dead: int
+    failure_rate: float
+    avg_latency_ms: float | None
+
+
+class BackupOut(BaseModel):
+    """Schema for a finished backup."""
+
+    filename: str
+    size: int
+    attachment_count: int
+    created_at: dt.datetime
 
 
 # --- Email Sending Functions ---
 
 
-async def send_confirmation_email(application: Application, settings: Settings) -> None:
+async def send_confirmation_email(
+    application: Application, settings: Settings, db: AsyncSession | None = None
+) -> None:
     """Send a confirmation email to the applicant."""
     await send_email(
         recipients=[application.applicant_email],
@@ -215,13 +509,12 @@ async def send_confirmation_email(application: Application, settings: Settings)
             "project_description": application.project_description,
             "costs": application.costs,
             "created_at": format_datetime_for_email(application.created_at, settings),
-            "attachment_filename": application.attachments[0].filename
-            if application.attachments
-            else None,
+            "attachment_filenames": [att.filename for att in application.attachments],
             "frontend_url": settings.frontend_url,
         },
         template_name="application_confirmation.html",
         settings=settings,
+        db=db,
     )
 
 
@@ -255,6 +548,11 @@ async def send_voting_links(
                 "created_at": format_datetime_for_email(
                     application.created_at, settings
                 ),
+                "voting_deadline": (
+                    format_datetime_for_email(application.voting_deadline, settings)
+                    if application.voting_deadline
+                    else None
+                ),
                 "vote_url": vote_url,
                 "token": vote_record.token,
                 "frontend_url": settings.frontend_url,
@@ -271,11 +569,15 @@ async def send_voting_links(
             },
             template_name="new_application.html",
             settings=settings,
+            db=db,
         )
 
 
 async def send_final_decision_emails(
-    application: Application, board_members: list[str], settings: Settings
+    application: Application,
+    board_members: list[str],
+    settings: Settings,
+    db: AsyncSession | None = None,
 ) -> None:
     """Send final decision emails to the applicant and board members."""
     status_translations = {
@@ -321,77 +623,482 @@ async def send_final_decision_emails(
             template_body=template_body,
             template_name="final_decision_applicant.html",
             settings=settings,
+            db=db,
         )
 
     # --- Email to Board Members ---
-    for member_email in board_members:
-        await send_email(
-            recipients=[member_email],
-            subject=f"Abstimmung abgeschlossen für: {application.project_title}",
-            template_body=template_body,
-            template_name="final_decision_board.html",
-            settings=settings,
-        )
+    # Rendered once and delivered to the whole board in one SMTP session.
+    await send_email(
+        recipients=board_members,
+        subject=f"Abstimmung abgeschlossen für: {application.project_title}",
+        template_body=template_body,
+        template_name="final_decision_board.html",
+        settings=settings,
+        db=db,
+    )
 
 
-async def _check_and_finalize_voting(
+# Tally column of the application for every vote option
+TALLY_COLUMNS = {
+    VoteOption.APPROVE: Application.approve_count,
+    VoteOption.REJECT: Application.reject_count,
+    VoteOption.ABSTAIN: Application.abstain_count,
+}
+
+
+async def _record_vote(
+    db: AsyncSession,
+    vote_id: int,
     application_id: int,
+    previous_vote: VoteOption | None,
+    decision: VoteOption,
+) -> None:
+    """
+    Store a new or changed vote and adjust the application's tallies in place.
+
+    Both updates are guarded by the state they expect, so a concurrent change of
+    the same vote or a concluded application leaves the tallies untouched. The
+    caller is responsible for committing the transaction.
+
+    Raises
+    ------
+    HTTPException
+        409 if the vote was changed concurrently, 400 if voting has closed.
+    """
+    previous_matches = (
+        VoteRecord.vote.is_(None)
+        if previous_vote is None
+        else VoteRecord.vote == previous_vote
+    )
+    vote_result = cast(
+        "CursorResult",
+        await db.execute(
+            update(VoteRecord)
+            .where(VoteRecord.id == vote_id, previous_matches)
+            .values(vote=decision, vote_status=VoteStatus.CAST, voted_at=get_now())
+        ),
+    )
+    if vote_result.rowcount != 1:
+        await db.rollback()
+        raise HTTPException(
+            status_code=409, detail="The vote was changed concurrently."
+        )
+
+    new_column = TALLY_COLUMNS[decision]
+    tallies = {new_column.key: new_column + 1}
+    if previous_vote is not None:
+        old_column = TALLY_COLUMNS[previous_vote]
+        tallies[old_column.key] = old_column - 1
+    tally_result = cast(
+        "CursorResult",
+        await db.execute(
+            update(Application)
+            .where(
+                Application.id == application_id,
+                Application.status == ApplicationStatus.PENDING,
+                or_(
+                    Application.voting_deadline.is_(None),
+                    Application.voting_deadline > get_now(),
+                ),
+            )
+            .values(tallies)
+        ),
+    )
+    if tally_result.rowcount != 1:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=VOTING_CLOSED_DETAIL)
+
+    db.add(VoteHistory(vote_id=vote_id, previous_vote=previous_vote, vote=decision))
+
+
+async def finalize_applications(
+    application_ids: Iterable[int],
     db: AsyncSession,
-    board_members: list[str],
     settings: Settings,
-) -> None:
+    now: dt.datetime | None = None,
+) -> list[int]:
     """
-    Check if a definitive decision has been reached and finalize the application status.
+    Conclude every given application whose outcome has become definitive.
 
     A definitive decision is reached if the outcome is determined even if not all
     board members have voted. This occurs when a simple majority for 'approve' or
-    'reject' is irreversible.
+    'reject' is irreversible. Once the voting deadline has passed, every
+    application without an approval majority is rejected. The quorum is based on
+    the electorate snapshot taken at submission time, and the decision is
+    announced to that same electorate.
+
+    The tallies of all applications are read with one query and every decided
+    application is concluded with one UPDATE, so casting many votes at once
+    costs a constant number of round-trips. Deadlines are checked against, and
+    ``concluded_at`` is set to, ``now``.
+
+    Returns
+    -------
+    list[int]
+        The ids of the applications concluded by this call.
     """
-    application_result = await db.execute(
+    application_ids = set(application_ids)
+    if not application_ids:
+        return []
+    now = now or get_now()
+
+    # Applications created before electorate snapshots existed have one vote
+    # record per board member at submission time.
+    vote_count = (
+        select(func.count())
+        .where(VoteRecord.application_id == Application.id)
+        .correlate(Application)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(
+            Application.id,
+            Application.approve_count,
+            Application.reject_count,
+            Application.abstain_count,
+            func.coalesce(Application.electorate_size, vote_count),
+            and_(
+                Application.voting_deadline.is_not(None),
+                Application.voting_deadline <= now,
+            ),
+        ).where(
+            Application.id.in_(application_ids),
+            Application.status == ApplicationStatus.PENDING,
+        )
+    )
+    rows = result.all()
+    if not rows:
+        return []
+    ids, approvals, rejects, abstains, electorate, closed = zip(*rows, strict=True)
+    outcomes = decide_batch(approvals, rejects, abstains, electorate, closed)
+    approved, rejected = [], []
+    for application_id, status in zip(ids, outcomes, strict=True):
+        if status == ApplicationStatus.APPROVED:
+            approved.append(application_id)
+        elif status == ApplicationStatus.REJECTED:
+            rejected.append(application_id)
+    if not approved and not rejected:
+        return []
+
+    # Only the call that actually moves an application out of 'pending'
+    # announces its decision.
+    status_type = Application.status.type
+    result = await db.execute(
+        update(Application)
+        .where(
+            Application.id.in_(approved + rejected),
+            Application.status == ApplicationStatus.PENDING,
+        )
+        .values(
+            status=case(
+                (
+                    Application.id.in_(approved),
+                    literal(ApplicationStatus.APPROVED, status_type),
+                ),
+                else_=literal(ApplicationStatus.REJECTED, status_type),
+            ),
+            # Store concluded_at as UTC so it can be converted correctly for emails
+            concluded_at=now,
+        )
+        .returning(Application.id)
+        .execution_options(synchronize_session=False)
+    )
+    concluded_ids = sorted(result.scalars().all())
+    await db.commit()
+    if not concluded_ids:
+        return []
+
+    result = await db.execute(
         select(Application)
-        .where(Application.id == application_id)
-        .options(selectinload(Application.votes)),
+        .where(Application.id.in_(concluded_ids))
+        .options(selectinload(Application.votes))
+        .execution_options(populate_existing=True)
+    )
+    applications = result.scalars().all()
+    for application in applications:
+        vote_details_cache.invalidate_many(v.token for v in application.votes)
+
+    await asyncio.gather(
+        *(
+            send_final_decision_emails(
+                application, [v.voter_email for v in application.votes], settings, db
+            )
+            for application in applications
+        )
     )
-    application = application_result.scalar_one_or_none()
+    # Persist the delivery log entries added while sending.
+    await db.commit()
+    return concluded_ids
 
-    if not application or application.status != ApplicationStatus.PENDING.value:
-        return
 
-    # Refresh the votes relationship to ensure the latest vote is loaded
-    await db.refresh(application, attribute_names=["votes"])
+async def _check_and_finalize_voting(
+    application_id: int,
+    db: AsyncSession,
+    settings: Settings,
+) -> None:
+    """Check if a definitive decision has been reached for a single application."""
+    await finalize_applications([application_id], db, settings)
 
-    cast_votes = [v for v in application.votes if v.vote_status == VoteStatus.CAST]
 
-    num_board_members = len(board_members)
+async def send_pending_vote_reminders(
+    db: AsyncSession, settings: Settings, now: dt.datetime | None = None
+) -> int:
+    """
+    Send one digest email to every board member with long-pending votes.
+
+    A vote is long-pending if it has not been cast and its application is still
+    pending more than ``reminder_after_days`` after submission. Members who were
+    reminded within the same period are skipped. If ``secret_key`` is set, the
+    digest links to the member's dashboard with a magic link that is valid until
+    the next reminder.
+
+    Returns
+    -------
+    int
+        The number of reminder emails sent.
+    """
+    now = now or get_now()
+    cutoff = now - dt.timedelta(days=settings.reminder_after_days)
+    recently_reminded = select(Reminder.voter_email).where(Reminder.sent_at > cutoff)
+    result = await db.execute(
+        select(
+            VoteRecord.voter_email,
+            VoteRecord.token,
+            Application.project_title,
+            Application.created_at,
+        )
+        .join(Application)
+        .where(
+            VoteRecord.vote_status == VoteStatus.PENDING,
+            Application.status == ApplicationStatus.PENDING,
+            Application.created_at <= cutoff,
+            VoteRecord.voter_email.not_in(recently_reminded),
+        )
+        .order_by(VoteRecord.voter_email, Application.created_at)
+    )
 
-    approvals = sum(1 for v in cast_votes if v.vote == VoteOption.APPROVE)
-    rejects = sum(1 for v in cast_votes if v.vote == VoteOption.REJECT)
-    abstains = sum(1 for v in cast_votes if v.vote == VoteOption.ABSTAIN)
+    reminders = []
+    for voter_email, rows in itertools.groupby(result, key=lambda row: row[0]):
+        votes = [
+            {
+                "project_title": row.project_title,
+                "created_at": format_datetime_for_email(row.created_at, settings),
+                "vote_url": f"{settings.frontend_url}/vote/{row.token}",
+            }
+            for row in rows
+        ]
+        dashboard_url = None
+        if settings.secret_key is not None:
+            credential = create_voter_token(
+                voter_email,
+                settings.secret_key.get_secret_value(),
+                now + dt.timedelta(days=settings.reminder_after_days),
+            )
+            dashboard_url = f"{settings.frontend_url}/api/voters/{credential}/votes"
+        await send_email(
+            recipients=[voter_email],
+            subject=f"Erinnerung: {len(votes)} offene Abstimmung(en)",
+            template_body={
+                "votes": votes,
+                "dashboard_url": dashboard_url,
+                "frontend_url": settings.frontend_url,
+            },
+            template_name="pending_votes_reminder.html",
+            settings=settings,
+            db=db,
+        )
+        reminders.append(
+            Reminder(voter_email=voter_email, pending_votes=len(votes), sent_at=now)
+        )
+
+    db.add_all(reminders)
+    await db.commit()
+    return len(reminders)
 
-    remaining_votes = num_board_members - len(cast_votes)
 
-    # The number of votes that could possibly be decisive (not abstain)
-    possible_decisive_votes = num_board_members - abstains
-    # The majority needed from that number of possible decisive votes
-    majority_needed = (possible_decisive_votes // 2) + 1
+async def close_expired_applications(
+    db: AsyncSession, settings: Settings, now: dt.datetime | None = None
+) -> list[int]:
+    """
+    Conclude every pending application whose voting deadline has passed.
+
+    Expired applications are found with an index scan on ``(status,
+    voting_deadline)`` and concluded in batches of
+    ``deadline_sweep_batch_size`` through ``finalize_applications``, which also
+    sends the decision emails.
+
+    Returns
+    -------
+    list[int]
+        The ids of the applications concluded by this call.
+    """
+    now = now or get_now()
+    concluded_ids: list[int] = []
+    while True:
+        result = await db.execute(
+            select(Application.id)
+            .where(
+                Application.status == ApplicationStatus.PENDING,
+                Application.voting_deadline <= now,
+            )
+            .order_by(Application.voting_deadline)
+            .limit(settings.deadline_sweep_batch_size)
+        )
+        expired_ids = result.scalars().all()
+        if not expired_ids:
+            return concluded_ids
+        batch_ids = await finalize_applications(expired_ids, db, settings, now)
+        if not batch_ids:
+            # Nothing in this batch could be concluded, so the next query would
+            # return the same applications again.
+            return concluded_ids
+        concluded_ids.extend(batch_ids)
+
+
+def _with_session(
+    job: Callable[[AsyncSession, Settings], Awaitable[object]], settings: Settings
+) -> Callable[[], Awaitable[object]]:
+    """Bind a job to the settings and run each invocation in a fresh session."""
+
+    async def run() -> object:
+        async with AsyncSessionLocal() as db:
+            return await job(db, settings)
+
+    return run
+
+
+async def delete_expired_idempotency_keys(
+    db: AsyncSession, settings: Settings, now: dt.datetime | None = None
+) -> int:
+    """Delete idempotency keys older than ``idempotency_key_ttl_hours``.
+
+    Returns
+    -------
+    int
+        The number of deleted keys.
+    """
+    now = now or get_now()
+    cutoff = now - dt.timedelta(hours=settings.idempotency_key_ttl_hours)
+    result = cast(
+        "CursorResult",
+        await db.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.created_at < cutoff)
+        ),
+    )
+    await db.commit()
+    return result.rowcount
 
-    new_status = None
 
-    # 1. Is approval guaranteed?
-    if approvals >= majority_needed:
-        new_status = ApplicationStatus.APPROVED
+async def delete_expired_uploads(
+    db: AsyncSession, settings: Settings, now: dt.datetime | None = None
+) -> int:
+    """Delete resumable uploads older than ``resumable_upload_ttl_hours``.
 
-    # 2. Is rejection guaranteed?
-    elif rejects >= majority_needed or approvals + remaining_votes < majority_needed:
-        new_status = ApplicationStatus.REJECTED
+    Both the database records and the staged data are removed.
 
-    if new_status:
-        application.status = new_status
-        # Store concluded_at as UTC now so it can be converted correctly for emails
-        application.concluded_at = dt.datetime.now(ZoneInfo("UTC"))
+    Returns
+    -------
+    int
+        The number of deleted uploads.
+    """
+    now = now or get_now()
+    cutoff = now - dt.timedelta(hours=settings.resumable_upload_ttl_hours)
+    result = await db.execute(
+        select(ResumableUpload.id).where(ResumableUpload.created_at < cutoff)
+    )
+    upload_ids = list(result.scalars())
+    if not upload_ids:
+        return 0
+    await db.execute(delete(ResumableUpload).where(ResumableUpload.id.in_(upload_ids)))
+    await db.commit()
+    for upload_id in upload_ids:
+        with contextlib.suppress(FileNotFoundError):
+            await aiofiles.os.remove(_staging_path(upload_id, settings))
+    return len(upload_ids)
+
+
+async def archive_concluded_applications(
+    db: AsyncSession, settings: Settings, now: dt.datetime | None = None
+) -> int:
+    """Move applications concluded ``archive_after_years`` ago to cold storage.
+
+    The applications are moved in batches of ``archive_batch_size``, one
+    transaction each, see ``archive.move_to_cold_storage``. Every batch
+    continues along the primary key where the previous one stopped, so a
+    run reads the hot table at most once.
+
+    Returns
+    -------
+    int
+        The number of archived applications.
+    """
+    now = now or get_now()
+    years = settings.archive_after_years
+    try:
+        cutoff = now.replace(year=now.year - years)
+    except ValueError:
+        # February 29th in a year that is not a leap year
+        cutoff = now.replace(year=now.year - years, day=28)
+
+    archived = 0
+    last_id = 0
+    while True:
+        result = await db.execute(
+            select(Application.id)
+            .where(
+                Application.id > last_id,
+                Application.status != ApplicationStatus.PENDING,
+                Application.concluded_at < cutoff,
+            )
+            .order_by(Application.id)
+            .limit(settings.archive_batch_size)
+        )
+        application_ids = result.scalars().all()
+        if not application_ids:
+            return archived
+        await move_to_cold_storage(db, application_ids)
         await db.commit()
-        await db.refresh(application)  # Refresh to load the concluded_at value
-        await send_final_decision_emails(application, board_members, settings)
+        archived += len(application_ids)
+        last_id = application_ids[-1]
+
+
+def create_scheduler(settings: Settings) -> Scheduler:
+    """Create the scheduler with all background jobs enabled in ``settings``.
+
+    Without ``scheduler_enabled`` the scheduler has no jobs, so that only one of
+    several instances sharing a database runs them.
+    """
+    scheduler = Scheduler()
+    if not settings.scheduler_enabled:
+        return scheduler
+    scheduler.add_job(
+        "voting-deadline-sweeper",
+        settings.scheduler_interval_seconds,
+        _with_session(close_expired_applications, settings),
+    )
+    scheduler.add_job(
+        "idempotency-key-sweeper",
+        settings.scheduler_interval_seconds,
+        _with_session(delete_expired_idempotency_keys, settings),
+    )
+    scheduler.add_job(
+        "resumable-upload-sweeper",
+        settings.scheduler_interval_seconds,
+        _with_session(delete_expired_uploads, settings),
+    )
+    if settings.reminder_after_days > 0:
+        scheduler.add_job(
+            "pending-vote-reminders",
+            settings.scheduler_interval_seconds,
+            _with_session(send_pending_vote_reminders, settings),
+        )
+    if settings.archive_after_years > 0:
+        scheduler.add_job(
+            "cold-archiver",
+            settings.scheduler_interval_seconds,
+            _with_session(archive_concluded_applications, settings),
+        )
+    return scheduler
 
 
 # --- API Endpoints ---
@@ -403,8 +1110,143 @@ async def read_root() -> dict:
     return {"message": "Welcome to the Funding Application API"}
 
 
+def _staging_path(upload_id: str, settings: Settings) -> Path:
+    """Return the file in which the data of a resumable upload is staged."""
+    return settings.project_root / "data" / "uploads" / "tmp" / upload_id
+
+
+async def _get_upload(
+    db: AsyncSession, upload_id: str, settings: Settings
+) -> ResumableUpload:
+    """Return an unexpired resumable upload or raise 404."""
+    cutoff = get_now() - dt.timedelta(hours=settings.resumable_upload_ttl_hours)
+    result = await db.execute(
+        select(ResumableUpload).where(
+            ResumableUpload.id == upload_id, ResumableUpload.created_at >= cutoff
+        )
+    )
+    upload = result.scalar_one_or_none()
+    if upload is None:
+        raise HTTPException(status_code=404, detail="Upload not found.")
+    return upload
+
+
+async def _claim_uploads(
+    db: AsyncSession, upload_ids: Sequence[str], settings: Settings
+) -> list[ResumableUpload]:
+    """Claim completed resumable uploads for a submission.
+
+    The upload records are deleted within the transaction of the submission, so
+    an upload can be attached to one application only.
+
+    Raises
+    ------
+    HTTPException
+        400 if an upload does not exist, has expired or is not complete, 409 if
+        a concurrent submission claimed it first.
+    """
+    if not upload_ids:
+        return []
+    upload_ids = list(dict.fromkeys(upload_ids))
+    cutoff = get_now() - dt.timedelta(hours=settings.resumable_upload_ttl_hours)
+    claimable = and_(
+        ResumableUpload.id.in_(upload_ids), ResumableUpload.completed_at.is_not(None)
+    )
+    result = await db.execute(
+        select(ResumableUpload).where(claimable, ResumableUpload.created_at >= cutoff)
+    )
+    uploads = {upload.id: upload for upload in result.scalars()}
+    if len(uploads) != len(upload_ids):
+        raise HTTPException(
+            status_code=400, detail="Unknown, expired or incomplete upload."
+        )
+    deleted = cast(
+        "CursorResult", await db.execute(delete(ResumableUpload).where(claimable))
+    )
+    if deleted.rowcount != len(upload_ids):
+        raise HTTPException(status_code=409, detail="Upload was already submitted.")
+    return [uploads[upload_id] for upload_id in upload_ids]
+
+
+async def _find_submission(
+    db: AsyncSession, idempotency_key: str, settings: Settings
+) -> int | None:
+    """Return the application created with an unexpired idempotency key."""
+    cutoff = get_now() - dt.timedelta(hours=settings.idempotency_key_ttl_hours)
+    result = await db.execute(
+        select(IdempotencyKey.application_id).where(
+            IdempotencyKey.key == idempotency_key, IdempotencyKey.created_at >= cutoff
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+def _replayed_submission(response: Response, application_id: int) -> dict:
+    """Return the response of an already processed submission."""
+    response.headers["Idempotent-Replayed"] = "true"
+    return {
+        "message": "Application submitted successfully",
+        "application_id": application_id,
+    }
+
+
+async def _remove_files(paths: Sequence[Path]) -> None:
+    """Remove files, ignoring those that do not exist."""
+    for path in paths:
+        with contextlib.suppress(FileNotFoundError):
+            await aiofiles.os.remove(path)
+
+
+async def _save_submission(
+    application: Application,
+    stored: list[StoredFile],
+    db: AsyncSession,
+    board_members: list[str],
+    settings: Settings,
+) -> None:
+    """Record the attachments of a new application and start the vote.
+
+    Stored files are compressed first if ``attachment_compression`` is set;
+    ``stored`` is updated in place so it lists the files that were kept.
+    """
+    if settings.attachment_compression != "none":
+        stored[:] = await asyncio.gather(
+            *(
+                compress_stored_file(file, settings.attachment_compression)
+                for file in stored
+            )
+        )
+    if stored:
+        # Insert all attachment records in a single statement
+        await db.execute(
+            insert(Attachment),
+            [
+                {
+                    "application_id": application.id,
+                    "filename": file.filename,
+                    "filepath": str(file.path.relative_to(settings.project_root)),
+                    "mime_type": file.mime_type,
+                    "content_encoding": file.encoding,
+                    "compression_ratio": file.compression_ratio,
+                }
+                for file in stored
+            ],
+        )
+
+    # Refresh the application with attachments relationship loaded
+    await db.refresh(application, attribute_names=["attachments"])
+
+    # Send confirmation email to the applicant
+    await send_confirmation_email(application, settings, db)
+
+    # Generate vote records and send links
+    await send_voting_links(application, db, board_members, settings)
+    await db.commit()  # Commit all changes (application, attachment, and vote records)
+
+
 @app.post("/applications")
 async def submit_application(
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     board_members: Annotated[list[str], Depends(get_board_members)],
     settings: Annotated[Settings, Depends(get_app_settings)],
@@ -415,9 +1257,26 @@ async def submit_application(
     project_title: Annotated[str, Form()],
     project_description: Annotated[str, Form()],
     costs: Annotated[float, Form()],
+    attachments: Annotated[list[UploadFile] | None, File()] = None,
     attachment: Annotated[UploadFile | None, File()] = None,
+    upload_ids: Annotated[list[str] | None, Form()] = None,
+    idempotency_key: Annotated[str | None, Header(max_length=255)] = None,
 ) -> dict:
-    """Create a new application and trigger the voting process."""
+    """Create a new application and trigger the voting process.
+
+    Files may be uploaded as ``attachments`` (any number, within the configured
+    limits) and, for older clients, as a single ``attachment``. Files sent as
+    resumable uploads are attached by passing their ids as ``upload_ids``.
+    Exceeding a limit is answered with 413.
+
+    A retried request with the same ``Idempotency-Key`` header returns the
+    original application without storing files or sending emails again.
+    """
+    if idempotency_key is not None:
+        application_id = await _find_submission(db, idempotency_key, settings)
+        if application_id is not None:
+            return _replayed_submission(response, application_id)
+
     application_data = {
         "first_name": first_name,
         "last_name": last_name,
@@ -427,46 +1286,89 @@ async def submit_application(
         "project_description": project_description,
         "costs": costs,
     }
+    voting_deadline = (
+        get_now() + dt.timedelta(days=settings.voting_period_days)
+        if settings.voting_period_days > 0
+        else None
+    )
     new_application = Application(
         **application_data,
         status=ApplicationStatus.PENDING.value,
+        electorate_size=len(board_members),
+        voting_deadline=voting_deadline,
     )
     db.add(new_application)
     await db.flush()  # Flush to get the application ID
 
-    if attachment and attachment.filename:
-        # Ensure the uploads directory exists
-        uploads_dir = settings.project_root / "data" / "uploads"
-        uploads_dir.mkdir(parents=True, exist_ok=True)
-
-        # Sanitize filename and create a unique path
-        file_extension = Path(attachment.filename).suffix
-        saved_filename = f"{uuid.uuid4()}{file_extension}"
-        file_path = uploads_dir / saved_filename
-
-        # Save the file asynchronously
-        contents = await attachment.read()
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(contents)
-
-        # Create the attachment record
-        new_attachment = Attachment(
-            application_id=new_application.id,
-            filename=attachment.filename,
-            filepath=str(file_path.relative_to(settings.project_root)),
-            mime_type=attachment.content_type or "application/octet-stream",
+    if idempotency_key is not None:
+        # Claim the key before any side effect; the unique index makes a
+        # concurrent duplicate fail here. An expired key that has not been swept
+        # yet is released first.
+        await db.execute(
+            delete(IdempotencyKey).where(
+                IdempotencyKey.key == idempotency_key,
+                IdempotencyKey.created_at
+                < get_now() - dt.timedelta(hours=settings.idempotency_key_ttl_hours),
+            )
         )
-        db.add(new_attachment)
-
-    # Refresh the application with attachments relationship loaded
-    await db.refresh(new_application, attribute_names=["attachments"])
-
-    # Send confirmation email to the applicant
-    await send_confirmation_email(new_application, settings)
-
-    # Generate vote records and send links
-    await send_voting_links(new_application, db, board_members, settings)
-    await db.commit()  # Commit all changes (application, attachment, and vote records)
+        db.add(IdempotencyKey(key=idempotency_key, application_id=new_application.id))
+        try:
+            await db.flush()
+        except IntegrityError:
+            await db.rollback()
+            application_id = await _find_submission(db, idempotency_key, settings)
+            if application_id is None:
+                raise
+            return _replayed_submission(response, application_id)
+
+    uploads = [
+        upload
+        for upload in [*(attachments or []), *([attachment] if attachment else [])]
+        if upload.filename
+    ]
+    staged = await _claim_uploads(db, upload_ids or [], settings)
+    stored: list[StoredFile] = []
+    uploads_dir = settings.project_root / "data" / "uploads"
+    if uploads or staged:
+        staged_size = sum(upload.length for upload in staged)
+        try:
+            check_upload_limits(
+                [upload.length for upload in staged]
+                + [upload.size or 0 for upload in uploads],
+                max_count=settings.max_attachment_count,
+                max_file_size=settings.max_attachment_bytes,
+                max_total_size=settings.max_attachments_total_bytes,
+            )
+            stored = await store_uploads(
+                uploads,
+                uploads_dir,
+                max_count=settings.max_attachment_count - len(staged),
+                max_file_size=settings.max_attachment_bytes,
+                max_total_size=settings.max_attachments_total_bytes - staged_size,
+                concurrency=settings.attachment_write_concurrency,
+            )
+        except UploadLimitError as e:
+            raise HTTPException(status_code=413, detail=str(e)) from e
+    try:
+        for upload in staged:
+            stored.append(
+                await link_staged_file(
+                    _staging_path(upload.id, settings),
+                    uploads_dir,
+                    upload.filename,
+                    upload.mime_type,
+                )
+            )
+        await _save_submission(new_application, stored, db, board_members, settings)
+    except BaseException:
+        # The rollback restores the claimed uploads, whose staged data is kept
+        await _remove_files([file.path for file in stored])
+        raise
+    await _remove_files([_staging_path(upload.id, settings) for upload in staged])
+
+    # Render previews in the background, once the attachments are committed
+    for file in stored:
+        preview_worker.enqueue(file.path, file.mime_type)
 
     return {
         "message": "Application submitted successfully",
@@ -474,11 +1376,22 @@ async def submit_application(
     }
 
 
-@app.get("/vote/{token}")
+@app.get("/vote/{token}", response_model=VoteDetailsOut)
 async def get_vote_details(
-    token: str, db: Annotated[AsyncSession, Depends(get_db)]
-) -> dict:
-    """Fetch application details using a secure token."""
+    token: str, db: Annotated[AsyncSession, Depends(get_read_db)]
+) -> Response:
+    """Fetch application details using a secure token.
+
+    The serialized payload is cached, so repeated requests neither query the
+    database nor serialize again. Concluding an application evicts its tokens,
+    and a cached payload is not served once the voting deadline has passed.
+    """
+    cached = vote_details_cache.get(token)
+    if cached is not None and not is_past(cached[1]):
+        return PydanticJSONResponse(cached[0])
+    # Skip storing the payload if a vote is cast or concluded while it is read
+    generation = vote_details_cache.generation
+
     result = await db.execute(
         select(VoteRecord)
         .where(VoteRecord.token == token)
@@ -491,24 +1404,28 @@ async def get_vote_details(
     if not vote_record:
         raise HTTPException(status_code=404, detail="Invalid or expired token.")
 
-    if vote_record.vote_status == VoteStatus.CAST.value:
-        raise HTTPException(status_code=400, detail="This vote has already been cast.")
-
     app = vote_record.application
-    application_data = {
-        "id": app.id,
-        "project_title": app.project_title,
-        "project_description": app.project_description,
-        "costs": app.costs,
-        "department": app.department,
-        "attachments": [AttachmentOut.model_validate(att) for att in app.attachments],
-    }
-
-    return {
-        "voter_email": vote_record.voter_email,
-        "application": application_data,
-        "vote_options": [option.value for option in VoteOption],
-    }
+    if app.status != ApplicationStatus.PENDING or is_past(app.voting_deadline):
+        raise HTTPException(status_code=400, detail=VOTING_CLOSED_DETAIL)
+
+    vote_details = VoteDetailsOut(
+        voter_email=vote_record.voter_email,
+        application=VoteApplicationOut(
+            id=app.id,
+            project_title=app.project_title,
+            project_description=app.project_description,
+            costs=app.costs,
+            department=app.department,
+            attachments=[AttachmentOut.model_validate(att) for att in app.attachments],
+        ),
+        vote_options=list(VoteOption),
+        current_vote=vote_record.vote,
+    )
+    response = PydanticJSONResponse(vote_details)
+    vote_details_cache.set(
+        token, (bytes(response.body), app.voting_deadline), generation
+    )
+    return response
 
 
 @app.post("/vote/{token}")
@@ -516,43 +1433,203 @@ async def cast_vote(
     token: str,
     vote_data: VoteCreate,
     db: Annotated[AsyncSession, Depends(get_db)],
-    board_members: Annotated[list[str], Depends(get_board_members)],
     settings: Annotated[Settings, Depends(get_app_settings)],
 ) -> dict:
-    """Cast a vote using a secure token and checks if voting is complete."""
-    result = await db.execute(select(VoteRecord).where(VoteRecord.token == token))
-    vote_record = result.scalar_one_or_none()
+    """Cast or change a vote using a secure token and check if voting is complete.
+
+    A vote can be changed as long as the application is pending.
+    """
+    result = await db.execute(
+        select(
+            VoteRecord.id,
+            VoteRecord.application_id,
+            VoteRecord.vote,
+            Application.status,
+        )
+        .join(Application)
+        .where(VoteRecord.token == token)
+    )
+    vote_record = result.one_or_none()
 
     if not vote_record:
         raise HTTPException(status_code=404, detail="Invalid or expired token.")
 
-    if vote_record.vote_status == VoteStatus.CAST.value:
-        raise HTTPException(status_code=400, detail="Vote has already been cast.")
+    if vote_record.status != ApplicationStatus.PENDING:
+        raise HTTPException(status_code=400, detail=VOTING_CLOSED_DETAIL)
 
-    # Update vote record
-    vote_record.vote = vote_data.decision
-    vote_record.vote_status = VoteStatus.CAST
-    vote_record.voted_at = get_now()
-    await db.commit()
+    if vote_record.vote == vote_data.decision:
+        return {"message": "Vote cast successfully"}
 
-    # After a vote is cast, check if the voting process is complete.
-    await _check_and_finalize_voting(
-        int(vote_record.application_id),
+    await _record_vote(
         db,
-        board_members,
-        settings,
+        vote_record.id,
+        vote_record.application_id,
+        vote_record.vote,
+        vote_data.decision,
     )
+    await db.commit()
+    vote_details_cache.invalidate(token)
+
+    # After a vote is cast, check if the voting process is complete.
+    await _check_and_finalize_voting(vote_record.application_id, db, settings)
 
     return {"message": "Vote cast successfully"}
 
 
+async def get_voter_email(
+    credential: str,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    settings: Annotated[Settings, Depends(get_app_settings)],
+) -> str:
+    """Resolve a voting token or a signed magic link to a board member's email."""
+    if settings.secret_key is not None:
+        email = verify_voter_token(
+            credential, settings.secret_key.get_secret_value(), get_now()
+        )
+        if email is not None:
+            return email
+
+    email = await db.scalar(
+        select(VoteRecord.voter_email).where(VoteRecord.token == credential)
+    )
+    if email is None:
+        raise HTTPException(status_code=404, detail="Invalid or expired token.")
+    return email
+
+
+@app.get("/voters/{credential}/votes")
+async def get_open_votes(
+    voter_email: Annotated[str, Depends(get_voter_email)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> VoterDashboardOut:
+    """Return every vote of a board member on applications that are still open."""
+    result = await db.execute(
+        select(
+            VoteRecord.token,
+            VoteRecord.application_id,
+            VoteRecord.vote.label("current_vote"),
+            Application.project_title,
+            Application.department,
+            Application.costs,
+            Application.created_at,
+        )
+        .join(Application)
+        .where(
+            VoteRecord.voter_email == voter_email,
+            Application.status == ApplicationStatus.PENDING,
+            or_(
+                Application.voting_deadline.is_(None),
+                Application.voting_deadline > get_now(),
+            ),
+        )
+        .order_by(Application.created_at, Application.id)
+    )
+    return VoterDashboardOut(
+        voter_email=voter_email,
+        votes=[OpenVoteOut.model_validate(row._asdict()) for row in result],
+    )
+
+
+@app.post("/voters/{credential}/votes")
+async def cast_votes(
+    batch: BatchVoteCreate,
+    voter_email: Annotated[str, Depends(get_voter_email)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    settings: Annotated[Settings, Depends(get_app_settings)],
+) -> dict:
+    """Cast or change several votes of one board member in a single transaction.
+
+    Either every vote of the batch is recorded or none is.
+    """
+    decisions = {item.token: item.decision for item in batch.votes}
+    result = await db.execute(
+        select(
+            VoteRecord.id,
+            VoteRecord.token,
+            VoteRecord.application_id,
+            VoteRecord.vote,
+            Application.status,
+        )
+        .join(Application)
+        .where(
+            VoteRecord.token.in_(decisions),
+            VoteRecord.voter_email == voter_email,
+        )
+    )
+    vote_records = result.all()
+
+    if len(vote_records) != len(decisions):
+        raise HTTPException(status_code=404, detail="Invalid or expired token.")
+    if any(v.status != ApplicationStatus.PENDING for v in vote_records):
+        raise HTTPException(status_code=400, detail=VOTING_CLOSED_DETAIL)
+
+    changed = [v for v in vote_records if v.vote != decisions[v.token]]
+    for vote_record in changed:
+        await _record_vote(
+            db,
+            vote_record.id,
+            vote_record.application_id,
+            vote_record.vote,
+            decisions[vote_record.token],
+        )
+    await db.commit()
+    vote_details_cache.invalidate_many(v.token for v in changed)
+
+    await finalize_applications((v.application_id for v in changed), db, settings)
+
+    return {"message": "Votes cast successfully", "votes_cast": len(changed)}
+
+
+def _attachment_response(
+    attachment: Attachment | ArchivedAttachment, request: Request, settings: Settings
+) -> Response:
+    """Return the file of an attachment as a download.
+
+    A compressed file is sent as it is stored, with a ``Content-Encoding``
+    header, if the client accepts its encoding. Otherwise it is decompressed
+    while it is streamed.
+    """
+    file_path = settings.project_root / attachment.filepath
+
+    if not file_path.is_file():
+        raise HTTPException(status_code=404, detail="File not found on disk.")
+
+    encoding = attachment.content_encoding
+    if encoding is None:
+        return FileResponse(
+            path=file_path,
+            filename=attachment.filename,
+            media_type=attachment.mime_type,
+        )
+    if accepts_encoding(request.headers.get("accept-encoding"), encoding):
+        return FileResponse(
+            path=file_path,
+            filename=attachment.filename,
+            media_type=attachment.mime_type,
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+        )
+    # Same Content-Disposition as FileResponse sends for uncompressed files
+    quoted_filename = quote(attachment.filename)
+    disposition = (
+        f'attachment; filename="{attachment.filename}"'
+        if quoted_filename == attachment.filename
+        else f"attachment; filename*=utf-8''{quoted_filename}"
+    )
+    return StreamingResponse(
+        iter_decompressed(file_path, encoding),
+        media_type=attachment.mime_type,
+        headers={"Content-Disposition": disposition, "Vary": "Accept-Encoding"},
+    )
+
+
 @app.get("/vote/{token}/attachments/{attachment_id}")
 async def get_attachment(
     token: str,
     attachment_id: int,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     settings: Annotated[Settings, Depends(get_app_settings)],
-) -> FileResponse:
+) -> Response:
     """Get an attachment associated with a vote token."""
     # Validate token
     result = await db.execute(
@@ -577,58 +1654,272 @@ async def get_attachment(
     if not attachment:
         raise HTTPException(status_code=404, detail="Attachment not found.")
 
-    # Construct the full file path
-    file_path = settings.project_root / attachment.filepath
-
-    if not file_path.is_file():
-        raise HTTPException(status_code=404, detail="File not found on disk.")
-
-    return FileResponse(
-        path=file_path,
-        filename=attachment.filename,
-        media_type=attachment.mime_type,
-    )
+    return _attachment_response(attachment, request, settings)
 
 
 @app.get("/attachments/{attachment_id}")
 async def get_attachment_public(
     attachment_id: int,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
     settings: Annotated[Settings, Depends(get_app_settings)],
-) -> FileResponse:
-    """Get an attachment by ID (public access for archive)."""
-    result = await db.execute(select(Attachment).where(Attachment.id == attachment_id))
-    attachment = result.scalar_one_or_none()
+) -> Response:
+    """Get an attachment by ID (public access for archive).
+
+    Attachments of applications in cold storage are looked up in the archive
+    tables if the id is not found in the hot table.
+    """
+    attachment: Attachment | ArchivedAttachment | None = None
+    for model in (Attachment, ArchivedAttachment):
+        result = await db.execute(select(model).where(model.id == attachment_id))
+        attachment = result.scalar_one_or_none()
+        if attachment is not None:
+            break
 
     if not attachment:
         raise HTTPException(status_code=404, detail="Attachment not found.")
 
-    # Construct the full file path
-    file_path = settings.project_root / attachment.filepath
+    return _attachment_response(attachment, request, settings)
 
-    if not file_path.is_file():
-        raise HTTPException(status_code=404, detail="File not found on disk.")
 
-    return FileResponse(
-        path=file_path,
-        filename=attachment.filename,
-        media_type=attachment.mime_type,
+@app.post("/uploads", status_code=201)
+async def create_upload(
+    upload_in: UploadCreate,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    settings: Annotated[Settings, Depends(get_app_settings)],
+) -> UploadOut:
+    """Start a resumable upload.
+
+    The data is then sent with ``PATCH /uploads/{id}`` in one or more chunks and
+    verified with ``POST /uploads/{id}/complete``. A completed upload is attached
+    to an application by passing its id in ``upload_ids``.
+    """
+    if upload_in.length > settings.max_attachment_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=(
+                "An attachment exceeds the limit of "
+                f"{settings.max_attachment_bytes} bytes."
+            ),
+        )
+    upload = ResumableUpload(**upload_in.model_dump(), offset=0)
+    db.add(upload)
+    await db.flush()
+    staging_path = _staging_path(upload.id, settings)
+    await aiofiles.os.makedirs(staging_path.parent, exist_ok=True)
+    async with aiofiles.open(staging_path, "wb"):
+        pass
+    await db.commit()
+    response.headers["Location"] = f"/uploads/{upload.id}"
+    return UploadOut.model_validate(upload)
+
+
+@app.get("/uploads/{upload_id}")
+async def get_upload(
+    upload_id: str,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    settings: Annotated[Settings, Depends(get_app_settings)],
+) -> UploadOut:
+    """Return the state of a resumable upload, e.g. to resume an interrupted one."""
+    upload = await _get_upload(db, upload_id, settings)
+    response.headers["Upload-Offset"] = str(upload.offset)
+    response.headers["Cache-Control"] = "no-store"
+    return UploadOut.model_validate(upload)
+
+
+async def _release_chunk_claim(
+    db: AsyncSession, upload_id: str, offset: int, claimed_offset: int
+) -> None:
+    """Reset an upload to ``offset`` if it still ends at the claimed chunk."""
+    await db.execute(
+        update(ResumableUpload)
+        .where(
+            ResumableUpload.id == upload_id,
+            ResumableUpload.offset == claimed_offset,
+        )
+        .values(offset=offset)
     )
+    await db.commit()
 
 
-@app.get("/applications/archive")
-async def get_applications_archive(
+@app.patch("/uploads/{upload_id}", status_code=204)
+async def append_upload_chunk(
+    upload_id: str,
+    request: Request,
+    upload_offset: Annotated[int, Header(ge=0)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    settings: Annotated[Settings, Depends(get_app_settings)],
+) -> Response:
+    """Write the request body to a resumable upload at ``Upload-Offset``.
+
+    The offset must equal the current offset of the upload, otherwise 409 is
+    returned together with the current offset. The new offset is returned in the
+    ``Upload-Offset`` header.
+
+    The range of the chunk is claimed in the database before anything is
+    written, so of two concurrent requests for the same offset only one ever
+    touches the staging file. If writing fails, the claim is released and the
+    chunk can be sent again.
+    """
+    if request.headers.get("content-type") != "application/offset+octet-stream":
+        raise HTTPException(
+            status_code=415,
+            detail="Chunks must be sent as application/offset+octet-stream.",
+        )
+    content_length = request.headers.get("content-length", "")
+    if not content_length.isdigit():
+        raise HTTPException(
+            status_code=411, detail="Chunks must have a Content-Length."
+        )
+    upload = await _get_upload(db, upload_id, settings)
+    if upload.completed_at is not None:
+        raise HTTPException(status_code=409, detail="Upload is already complete.")
+    if upload_offset != upload.offset:
+        raise HTTPException(
+            status_code=409,
+            detail="Upload-Offset does not match the current offset.",
+            headers={"Upload-Offset": str(upload.offset)},
+        )
+    new_offset = upload_offset + int(content_length)
+    if new_offset > upload.length:
+        raise HTTPException(
+            status_code=413,
+            detail=f"The upload exceeds its declared length of {upload.length} bytes.",
+        )
+
+    # Only advance from the offset this chunk starts at, so that of two
+    # concurrent requests for the same offset exactly one succeeds.
+    result = cast(
+        "CursorResult",
+        await db.execute(
+            update(ResumableUpload)
+            .where(
+                ResumableUpload.id == upload.id,
+                ResumableUpload.offset == upload_offset,
+            )
+            .values(offset=new_offset)
+        ),
+    )
+    if result.rowcount == 0:
+        raise HTTPException(status_code=409, detail="Upload was modified concurrently.")
+    await db.commit()
+
+    try:
+        written = await write_chunk(
+            _staging_path(upload.id, settings),
+            upload_offset,
+            request.stream(),
+            new_offset,
+        )
+    except Exception as e:
+        await _release_chunk_claim(db, upload.id, upload_offset, new_offset)
+        if isinstance(e, UploadLimitError):
+            raise HTTPException(status_code=413, detail=str(e)) from e
+        raise
+    if written != new_offset:
+        await _release_chunk_claim(db, upload.id, upload_offset, new_offset)
+        raise HTTPException(
+            status_code=400, detail="The chunk is shorter than its Content-Length."
+        )
+    return Response(status_code=204, headers={"Upload-Offset": str(new_offset)})
+
+
+@app.post("/uploads/{upload_id}/complete")
+async def complete_upload(
+    upload_id: str,
+    upload_complete: UploadComplete,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[ApplicationOut]:
-    """Return a list of all applications with their current status and votes."""
+    settings: Annotated[Settings, Depends(get_app_settings)],
+) -> UploadOut:
+    """Verify the SHA-256 checksum of a fully transferred resumable upload.
+
+    On a mismatch the upload is discarded and has to be started again.
+    """
+    upload = await _get_upload(db, upload_id, settings)
+    if upload.completed_at is None:
+        if upload.offset != upload.length:
+            raise HTTPException(status_code=409, detail="Upload is not complete yet.")
+        staging_path = _staging_path(upload.id, settings)
+        checksum = await file_sha256(staging_path)
+        if checksum != upload_complete.sha256.lower():
+            await db.delete(upload)
+            await db.commit()
+            await aiofiles.os.remove(staging_path)
+            raise HTTPException(status_code=400, detail="Checksum mismatch.")
+        upload.sha256 = checksum
+        upload.completed_at = get_now()
+        await db.commit()
+    elif upload.sha256 != upload_complete.sha256.lower():
+        raise HTTPException(status_code=400, detail="Checksum mismatch.")
+    return UploadOut.model_validate(upload)
+
+
+@app.get("/attachments/{attachment_id}/preview")
+async def get_attachment_preview(
+    attachment_id: int,
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    settings: Annotated[Settings, Depends(get_app_settings)],
+) -> Response:
+    """Get the preview image of an attachment.
+
+    Previews are rendered in the background after the upload, so a preview may
+    not be available yet; it never is for unsupported file types.
+    """
     result = await db.execute(
-        select(Application)
-        .options(selectinload(Application.votes), selectinload(Application.attachments))
-        .order_by(Application.id.desc()),
+        union_all(
+            select(Attachment.filepath).where(Attachment.id == attachment_id),
+            select(ArchivedAttachment.filepath).where(
+                ArchivedAttachment.id == attachment_id
+            ),
+        )
+    )
+    filepath = result.scalar_one_or_none()
+    if filepath is None:
+        raise HTTPException(status_code=404, detail="Attachment not found.")
+
+    path = preview_path(settings.project_root / filepath)
+    try:
+        stat = await aiofiles.os.stat(path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Preview not available.") from None
+
+    headers = {
+        "Cache-Control": f"public, max-age={PREVIEW_CACHE_MAX_AGE}",
+        "ETag": f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"',
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(
+        path=path, media_type=PREVIEW_MEDIA_TYPE, headers=headers, stat_result=stat
     )
-    applications = result.scalars().unique().all()
 
-    return [ApplicationOut.model_validate(app) for app in applications]
+
+@app.get("/applications/archive", response_model=list[ApplicationOut])
+async def get_applications_archive(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+) -> Response:
+    """Return a list of all applications with their current status and votes.
+
+    The archive is built from row tuples of hot and cold storage and serialized
+    without validation, see ``archive.build_archive``.
+    """
+    applications = await db.execute(select_applications())
+    votes = await db.execute(select_votes())
+    attachments = await db.execute(select_attachments())
+    archived_applications = await db.execute(select_archived_applications())
+    archived_votes = await db.execute(select_archived_votes())
+    archived_attachments = await db.execute(select_archived_attachments())
+
+    return PydanticJSONResponse(
+        build_archive(
+            merge_hot_and_cold(applications, archived_applications),
+            itertools.chain(votes, archived_votes),
+            itertools.chain(attachments, archived_attachments),
+        )
+    )
 
 
 def load_version() -> str:
@@ -651,3 +1942,124 @@ APP_VERSION = load_version()
 async def get_version() -> dict[str, str]:
     """Return the application version from pyproject.toml."""
     return {"version": APP_VERSION}
+
+
+# --- Admin API ---
+
+
+async def require_admin(
+    settings: Annotated[Settings, Depends(get_app_settings)],
+    x_admin_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """Allow the request only with the configured admin token."""
+    if settings.admin_token is None:
+        raise HTTPException(status_code=403, detail="The admin API is disabled.")
+    if x_admin_token is None or not hmac.compare_digest(
+        x_admin_token, settings.admin_token.get_secret_value()
+    ):
+        raise HTTPException(status_code=401, detail="Invalid admin token.")
+
+
+@app.get("/admin/emails", dependencies=[Depends(require_admin)])
+async def list_email_deliveries(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    status: Annotated[list[DeliveryStatus] | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    offset: Annotated[int, Query(ge=0)] = 0,
+) -> list[EmailDeliveryOut]:
+    """List logged email deliveries, by default the failed and dead-lettered ones."""
+    statuses = status or [DeliveryStatus.FAILED, DeliveryStatus.DEAD]
+    result = await db.execute(
+        select(EmailDelivery)
+        .where(EmailDelivery.status.in_(statuses))
+        .order_by(EmailDelivery.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+    return [EmailDeliveryOut.model_validate(d) for d in result.scalars()]
+
+
+@app.post("/admin/emails/resend", dependencies=[Depends(require_admin)])
+async def resend_email_deliveries(
+    request: EmailResendRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    settings: Annotated[Settings, Depends(get_app_settings)],
+) -> dict[str, int]:
+    """Send failed emails again and return the number of messages per outcome."""
+    outcomes = await resend_failed_emails(
+        db, settings, request.ids, include_dead=request.include_dead
+    )
+    return {status.value: outcomes[status] for status in DeliveryStatus}
+
+
+@app.get("/admin/emails/stats", dependencies=[Depends(require_admin)])
+async def get_email_delivery_stats(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    since: dt.datetime | None = None,
+) -> list[TemplateDeliveryStats]:
+    """Return delivery counts, failure rate and mean latency per email template."""
+
+    def count(status: DeliveryStatus) -> ColumnElement[int]:
+        return func.sum(case((EmailDelivery.status == status, 1), else_=0))
+
+    query = (
+        select(
+            EmailDelivery.template_name,
+            func.count(),
+            count(DeliveryStatus.SENT),
+            count(DeliveryStatus.FAILED),
+            count(DeliveryStatus.DEAD),
+            func.avg(EmailDelivery.latency_ms),
+        )
+        .group_by(EmailDelivery.template_name)
+        .order_by(EmailDelivery.template_name)
+    )
+    if since is not None:
+        query = query.where(EmailDelivery.created_at >= since)
+    result = await db.execute(query)
+    return [
+        TemplateDeliveryStats(
+            template_name=template_name,
+            total=total,
+            sent=sent,
+            failed=failed,
+            dead=dead,
+            failure_rate=(failed + dead) / total,
+            avg_latency_ms=avg_latency_ms,
+        )
+        for template_name, total, sent, failed, dead, avg_latency_ms in result
+    ]
+
+
+@app.post("/admin/backups", status_code=201, dependencies=[Depends(require_admin)])
+async def create_database_backup(
+    settings: Annotated[Settings, Depends(get_app_settings)],
+) -> BackupOut:
+    """Back up the database and all attachments while the application runs.
+
+    The backup is written to ``BACKUP_DIR`` by a worker thread, see
+    ``backup.create_backup``.
+    """
+    database = sqlite_database_path(settings.database_url)
+    if database is None:
+        raise HTTPException(
+            status_code=409,
+            detail="Online backups are only supported for SQLite databases.",
+        )
+    if backup_lock.locked():
+        raise HTTPException(status_code=409, detail="A backup is already running.")
+    async with backup_lock:
+        result = await asyncio.to_thread(
+            create_backup,
+            database,
+            settings.project_root,
+            settings.project_root / settings.backup_dir,
+            pages_per_step=settings.backup_pages_per_step,
+            step_sleep=settings.backup_step_sleep_seconds,
+        )
+    return BackupOut(
+        filename=result.path.name,
+        size=result.size,
+        attachment_count=result.attachment_count,
+        created_at=result.created_at,
+    )
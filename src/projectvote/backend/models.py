@@ -3,21 +3,64 @@
 import datetime as dt
 import enum
 import uuid
+from typing import override
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
 from sqlalchemy import (
     Enum as PyEnum,
 )
+from sqlalchemy.engine import Dialect
 from sqlalchemy.orm import (
     Mapped,
     declarative_base,
     mapped_column,
     relationship,
 )
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
 
+class UTCDateTime(TypeDecorator[dt.datetime]):
+    """Timestamp column that always returns timezone-aware UTC datetimes.
+
+    Values are stored as naive UTC, which keeps them comparable in SQL on
+    databases without time zone support such as SQLite. Aware values are
+    converted to UTC before they are written; naive values are assumed to be
+    UTC already.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    @override
+    def process_bind_param(
+        self, value: dt.datetime | None, dialect: Dialect
+    ) -> dt.datetime | None:
+        """Convert ``value`` to naive UTC for storage."""
+        if value is None or value.tzinfo is None:
+            return value
+        return value.astimezone(dt.UTC).replace(tzinfo=None)
+
+    @override
+    def process_result_value(
+        self, value: dt.datetime | None, dialect: Dialect
+    ) -> dt.datetime | None:
+        """Mark a stored timestamp as UTC."""
+        if value is None:
+            return None
+        return value.replace(tzinfo=dt.UTC)
+
+
 class ApplicationStatus(enum.StrEnum):
     """Enum for the status of an application."""
 
@@ -41,6 +84,15 @@ class VoteStatus(enum.StrEnum):
     CAST = "cast"
 
 
+class DeliveryStatus(enum.StrEnum):
+    """Enum for the delivery state of an outgoing email."""
+
+    SENT = "sent"
+    FAILED = "failed"
+    # Failed too often to be retried automatically.
+    DEAD = "dead"
+
+
 class Application(Base):
     """Represents a funding application."""
 
@@ -55,15 +107,60 @@ class Application(Base):
     project_description: Mapped[str] = mapped_column(String, nullable=False)
     costs: Mapped[float] = mapped_column(Float, nullable=False)
     status: Mapped[ApplicationStatus] = mapped_column(
-        PyEnum(ApplicationStatus), default=ApplicationStatus.PENDING, nullable=False
+        PyEnum(ApplicationStatus, native_enum=False),
+        default=ApplicationStatus.PENDING,
+        nullable=False,
     )
     created_at: Mapped[dt.datetime] = mapped_column(
-        DateTime, nullable=False, default=lambda: dt.datetime.now(dt.UTC)
+        UTCDateTime, nullable=False, default=lambda: dt.datetime.now(dt.UTC)
+    )
+    concluded_at: Mapped[dt.datetime | None] = mapped_column(UTCDateTime, nullable=True)
+    # Voting closes at this time even without a majority; None means no deadline.
+    voting_deadline: Mapped[dt.datetime | None] = mapped_column(
+        UTCDateTime, nullable=True
+    )
+    # Number of board members entitled to vote, frozen at submission time so that
+    # later changes of the board do not alter the quorum of pending applications.
+    electorate_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Running tallies of the current votes, adjusted atomically on every cast so
+    # that finalization never has to recount the vote records.
+    approve_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    reject_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
     )
-    concluded_at: Mapped[dt.datetime | None] = mapped_column(DateTime, nullable=True)
+    abstain_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    # Ordered, since other databases than SQLite return rows in no fixed order
+    votes: Mapped[list["VoteRecord"]] = relationship(
+        back_populates="application", order_by="VoteRecord.id"
+    )
+    attachments: Mapped[list["Attachment"]] = relationship(
+        back_populates="application", order_by="Attachment.id"
+    )
+
+    # Supports the deadline sweeper's scan for expired pending applications.
+    # With SQLite, ids must not be reused once the newest rows were archived.
+    __table_args__ = (
+        Index("ix_applications_status_voting_deadline", "status", "voting_deadline"),
+        {"sqlite_autoincrement": True},
+    )
+
 
-    votes: Mapped[list["VoteRecord"]] = relationship(back_populates="application")
-    attachments: Mapped[list["Attachment"]] = relationship(back_populates="application")
+class BoardMember(Base):
+    """Represents a member of the board entitled to vote on new applications."""
+
+    __tablename__ = "board_members"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime, nullable=False, default=lambda: dt.datetime.now(dt.UTC)
+    )
 
 
 def generate_uuid() -> str:
@@ -75,6 +172,11 @@ class VoteRecord(Base):
     """Represents a single vote record for an application."""
 
     __tablename__ = "votes"
+    __table_args__ = (
+        # Serves the per-member lookups of the voter dashboard and reminders.
+        Index("ix_votes_voter_email_vote_status", "voter_email", "vote_status"),
+        {"sqlite_autoincrement": True},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     application_id: Mapped[int] = mapped_column(
@@ -84,19 +186,49 @@ class VoteRecord(Base):
     token: Mapped[str] = mapped_column(
         String, unique=True, index=True, nullable=False, default=generate_uuid
     )
-    vote: Mapped[VoteOption | None] = mapped_column(PyEnum(VoteOption), nullable=True)
+    vote: Mapped[VoteOption | None] = mapped_column(
+        PyEnum(VoteOption, native_enum=False), nullable=True
+    )
     vote_status: Mapped[VoteStatus] = mapped_column(
-        PyEnum(VoteStatus), default=VoteStatus.PENDING, nullable=False
+        PyEnum(VoteStatus, native_enum=False),
+        default=VoteStatus.PENDING,
+        nullable=False,
     )
-    voted_at: Mapped[dt.datetime | None] = mapped_column(DateTime, nullable=True)
+    voted_at: Mapped[dt.datetime | None] = mapped_column(UTCDateTime, nullable=True)
 
     application: Mapped["Application"] = relationship(back_populates="votes")
 
 
+class VoteHistory(Base):
+    """Represents one cast or change of a vote, for auditing.
+
+    Only the vote id and the options are stored; voter and application are
+    reachable through the referenced vote record.
+    """
+
+    __tablename__ = "vote_history"
+    __table_args__ = ({"sqlite_autoincrement": True},)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    vote_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("votes.id"), index=True, nullable=False
+    )
+    previous_vote: Mapped[VoteOption | None] = mapped_column(
+        PyEnum(VoteOption, native_enum=False), nullable=True
+    )
+    vote: Mapped[VoteOption] = mapped_column(
+        PyEnum(VoteOption, native_enum=False), nullable=False
+    )
+    cast_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime, nullable=False, default=lambda: dt.datetime.now(dt.UTC)
+    )
+
+
 class Attachment(Base):
     """Represents an uploaded file attachment for an application."""
 
     __tablename__ = "attachments"
+    __table_args__ = ({"sqlite_autoincrement": True},)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     application_id: Mapped[int] = mapped_column(
@@ -105,5 +237,174 @@ class Attachment(Base):
     filename: Mapped[str] = mapped_column(String, nullable=False)
     filepath: Mapped[str] = mapped_column(String, nullable=False, unique=True)
     mime_type: Mapped[str] = mapped_column(String, nullable=False)
+    # Content encoding of the stored file, NULL if it is stored uncompressed.
+    content_encoding: Mapped[str | None] = mapped_column(String, nullable=True)
+    # Original size divided by the compressed size, NULL if uncompressed.
+    compression_ratio: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     application: Mapped["Application"] = relationship(back_populates="attachments")
+
+
+class ArchivedApplication(Base):
+    """Represents an application moved to cold storage long after it concluded.
+
+    Archived applications keep their ids and are only read by the archive, so
+    the table carries no secondary indexes.
+    """
+
+    __tablename__ = "archived_applications"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    first_name: Mapped[str] = mapped_column(String, nullable=False)
+    last_name: Mapped[str] = mapped_column(String, nullable=False)
+    applicant_email: Mapped[str] = mapped_column(String, nullable=False)
+    department: Mapped[str] = mapped_column(String, nullable=False)
+    project_title: Mapped[str] = mapped_column(String, nullable=False)
+    project_description: Mapped[str] = mapped_column(String, nullable=False)
+    costs: Mapped[float] = mapped_column(Float, nullable=False)
+    status: Mapped[ApplicationStatus] = mapped_column(
+        PyEnum(ApplicationStatus, native_enum=False), nullable=False
+    )
+    created_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, nullable=False)
+    concluded_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, nullable=False)
+    voting_deadline: Mapped[dt.datetime | None] = mapped_column(
+        UTCDateTime, nullable=True
+    )
+    electorate_size: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    approve_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    reject_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    abstain_count: Mapped[int] = mapped_column(Integer, nullable=False)
+
+
+class ArchivedVote(Base):
+    """Represents a vote on an archived application.
+
+    Voting tokens and the vote status are dropped; a vote without an option was
+    never cast.
+    """
+
+    __tablename__ = "archived_votes"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    application_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("archived_applications.id"), nullable=False
+    )
+    voter_email: Mapped[str] = mapped_column(String, nullable=False)
+    vote: Mapped[VoteOption | None] = mapped_column(
+        PyEnum(VoteOption, native_enum=False), nullable=True
+    )
+    voted_at: Mapped[dt.datetime | None] = mapped_column(UTCDateTime, nullable=True)
+
+
+class ArchivedVoteHistory(Base):
+    """Represents one cast or change of a vote on an archived application."""
+
+    __tablename__ = "archived_vote_history"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    vote_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("archived_votes.id"), nullable=False
+    )
+    previous_vote: Mapped[VoteOption | None] = mapped_column(
+        PyEnum(VoteOption, native_enum=False), nullable=True
+    )
+    vote: Mapped[VoteOption] = mapped_column(
+        PyEnum(VoteOption, native_enum=False), nullable=False
+    )
+    cast_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, nullable=False)
+
+
+class ArchivedAttachment(Base):
+    """Represents an attachment of an archived application.
+
+    The file itself stays where it was stored.
+    """
+
+    __tablename__ = "archived_attachments"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    application_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("archived_applications.id"), nullable=False
+    )
+    filename: Mapped[str] = mapped_column(String, nullable=False)
+    filepath: Mapped[str] = mapped_column(String, nullable=False)
+    mime_type: Mapped[str] = mapped_column(String, nullable=False)
+    content_encoding: Mapped[str | None] = mapped_column(String, nullable=True)
+    compression_ratio: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+
+class Reminder(Base):
+    """Represents a reminder email sent to a board member about pending votes."""
+
+    __tablename__ = "reminders"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    voter_email: Mapped[str] = mapped_column(String, index=True, nullable=False)
+    pending_votes: Mapped[int] = mapped_column(Integer, nullable=False)
+    sent_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime, nullable=False, default=lambda: dt.datetime.now(dt.UTC)
+    )
+
+
+class EmailDelivery(Base):
+    """Represents the delivery of one email to one recipient.
+
+    The template name and variables are kept so that failed messages can be
+    rendered and sent again.
+    """
+
+    __tablename__ = "email_deliveries"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    recipient: Mapped[str] = mapped_column(String, index=True, nullable=False)
+    subject: Mapped[str] = mapped_column(String, nullable=False)
+    template_name: Mapped[str] = mapped_column(String, index=True, nullable=False)
+    template_body: Mapped[dict] = mapped_column(JSON, nullable=False)
+    status: Mapped[DeliveryStatus] = mapped_column(
+        PyEnum(DeliveryStatus, native_enum=False), index=True, nullable=False
+    )
+    attempts: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(String, nullable=True)
+    latency_ms: Mapped[float | None] = mapped_column(Float, nullable=True)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime, nullable=False, default=lambda: dt.datetime.now(dt.UTC)
+    )
+    last_attempt_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime, nullable=False, default=lambda: dt.datetime.now(dt.UTC)
+    )
+
+
+class IdempotencyKey(Base):
+    """Maps a client-supplied idempotency key to the application it created."""
+
+    __tablename__ = "idempotency_keys"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    key: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
+    application_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("applications.id"), nullable=False
+    )
+    created_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime, index=True, nullable=False, default=lambda: dt.datetime.now(dt.UTC)
+    )
+
+
+class ResumableUpload(Base):
+    """Represents a file uploaded in chunks before it is attached to an application.
+
+    The data is staged under ``data/uploads/tmp/<id>`` until a submission claims
+    the upload; unclaimed uploads are removed once they expire.
+    """
+
+    __tablename__ = "resumable_uploads"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
+    filename: Mapped[str] = mapped_column(String, nullable=False)
+    mime_type: Mapped[str] = mapped_column(String, nullable=False)
+    length: Mapped[int] = mapped_column(Integer, nullable=False)
+    offset: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sha256: Mapped[str | None] = mapped_column(String, nullable=True)
+    created_at: Mapped[dt.datetime] = mapped_column(
+        UTCDateTime, index=True, nullable=False, default=lambda: dt.datetime.now(dt.UTC)
+    )
+    completed_at: Mapped[dt.datetime | None] = mapped_column(UTCDateTime, nullable=True)
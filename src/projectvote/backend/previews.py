@@ -0,0 +1,217 @@
+"""Preview images of attachments, rendered in a pool of worker processes.
+
+Rendering needs the optional ``previews`` dependencies (Pillow for images and
+pypdfium2 for the first page of PDFs). Without them no previews are created.
+"""
+
+import asyncio
+import contextlib
+import importlib
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_SUFFIX = ".preview.jpg"
+PREVIEW_MEDIA_TYPE = "image/jpeg"
+# Previews never change once rendered, as attachments are immutable.
+PREVIEW_CACHE_MAX_AGE = 24 * 60 * 60
+
+PDF_TYPE = "application/pdf"
+IMAGE_TYPES = frozenset(
+    {
+        "image/bmp",
+        "image/gif",
+        "image/jpeg",
+        "image/png",
+        "image/tiff",
+        "image/webp",
+    }
+)
+
+
+def preview_path(path: Path) -> Path:
+    """Return where the preview of the attachment stored at ``path`` is kept."""
+    return path.with_name(path.name + PREVIEW_SUFFIX)
+
+
+def can_preview(mime_type: str) -> bool:
+    """Return whether previews are rendered for files of ``mime_type``."""
+    return mime_type == PDF_TYPE or mime_type in IMAGE_TYPES
+
+
+def _import_optional(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def render_preview(source: Path, target: Path, mime_type: str, max_size: int) -> bool:
+    """Render a JPEG preview of an image or of the first page of a PDF.
+
+    This is CPU-bound and meant to run in a worker process. The preview is
+    written to a temporary file first, so ``target`` is never seen half-written.
+
+    Parameters
+    ----------
+    source : Path
+        The attachment.
+    target : Path
+        Where to store the preview.
+    mime_type : str
+        The content type of the attachment.
+    max_size : int
+        Maximum width and height of the preview in pixels.
+
+    Returns
+    -------
+    bool
+        Whether a preview was written. ``False`` for unsupported types or if the
+        optional rendering dependencies are not installed.
+    """
+    if not can_preview(mime_type):
+        return False
+    image_module = _import_optional("PIL.Image")
+    if image_module is None:
+        return False
+    if mime_type == PDF_TYPE:
+        pdfium = _import_optional("pypdfium2")
+        if pdfium is None:
+            return False
+        pdf = pdfium.PdfDocument(source)
+        try:
+            page = pdf[0]
+            image = page.render(scale=max_size / max(page.get_size())).to_pil()
+        finally:
+            pdf.close()
+    else:
+        with image_module.open(source) as opened:
+            opened.draft("RGB", (max_size, max_size))
+            image = opened.copy()
+    image.thumbnail((max_size, max_size))
+    partial = target.with_name(target.name + ".part")
+    image.convert("RGB").save(partial, "JPEG", quality=80)
+    partial.replace(target)
+    return True
+
+
+@dataclass(frozen=True, slots=True)
+class PreviewJob:
+    """An attachment whose preview is still to be rendered.
+
+    Attributes
+    ----------
+    source : Path
+        The attachment.
+    mime_type : str
+        The content type of the attachment.
+    """
+
+    source: Path
+    mime_type: str
+
+
+class PreviewWorker:
+    """Render previews in worker processes, fed from a bounded queue.
+
+    Every worker process is fed by one consumer task, so at most ``processes``
+    previews are rendered at once and the event loop only waits for results.
+    When the queue is full, further jobs are dropped with a warning instead of
+    delaying the request that produced them.
+
+    Parameters
+    ----------
+    render : Callable[[Path, Path, str, int], bool]
+        Function rendering one preview. It runs in a worker process and must
+        therefore be picklable.
+    """
+
+    def __init__(
+        self, render: Callable[[Path, Path, str, int], bool] = render_preview
+    ) -> None:
+        self._render = render
+        self._queue: asyncio.Queue[PreviewJob] = asyncio.Queue()
+        self._pool: ProcessPoolExecutor | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self.max_size = 0
+
+    @property
+    def running(self) -> bool:
+        """Return whether the worker accepts jobs."""
+        return self._pool is not None
+
+    def start(self, processes: int, max_size: int, queue_size: int) -> None:
+        """Start ``processes`` worker processes. ``0`` leaves the worker stopped."""
+        if processes <= 0:
+            return
+        self.max_size = max_size
+        self._queue = asyncio.Queue(maxsize=queue_size)
+        # Forking the multi-threaded server process could deadlock the workers.
+        self._pool = ProcessPoolExecutor(
+            max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._tasks = [
+            asyncio.create_task(self._consume(), name=f"preview-worker:{i}")
+            for i in range(processes)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the consumers and shut down the process pool.
+
+        Jobs that are still queued are discarded.
+        """
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await asyncio.to_thread(pool.shutdown, cancel_futures=True)
+
+    def enqueue(self, source: Path, mime_type: str) -> bool:
+        """Queue the rendering of a preview for the attachment at ``source``.
+
+        Returns
+        -------
+        bool
+            Whether the job was queued. Jobs are not queued for unsupported
+            types, while the worker is stopped or when the queue is full.
+        """
+        if not self.running or not can_preview(mime_type):
+            return False
+        try:
+            self._queue.put_nowait(PreviewJob(source=source, mime_type=mime_type))
+        except asyncio.QueueFull:
+            logger.warning("Preview queue is full, skipping preview of %s", source)
+            return False
+        return True
+
+    async def join(self) -> None:
+        """Wait until every queued job has been processed."""
+        await self._queue.join()
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            try:
+                await loop.run_in_executor(
+                    self._pool,
+                    self._render,
+                    job.source,
+                    preview_path(job.source),
+                    job.mime_type,
+                    self.max_size,
+                )
+            except Exception:
+                logger.exception("Rendering the preview of %s failed", job.source)
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,281 @@
+"""Fast JSON rendering and compression of API responses."""
+
+import functools
+import importlib
+import zlib
+from collections.abc import Callable
+from http import HTTPStatus
+from types import ModuleType
+from typing import Any, Protocol
+
+import anyio.to_thread
+import pydantic_core
+from fastapi import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Media types that are compressed already and not worth compressing again. A
+# type ending in "/*" excludes the whole family.
+EXCLUDED_CONTENT_TYPES = frozenset(
+    {
+        "application/gzip",
+        "application/pdf",
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "application/x-gzip",
+        "application/zip",
+        "audio/*",
+        "font/woff",
+        "font/woff2",
+        "image/avif",
+        "image/gif",
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+        "text/event-stream",
+        "video/*",
+    }
+)
+
+
+def _import_brotli() -> ModuleType | None:
+    try:
+        return importlib.import_module("brotli")
+    except ImportError:
+        return None
+
+
+brotli = _import_brotli()
+
+
+def accepts_encoding(accept_encoding: str | None, encoding: str) -> bool:
+    """Return whether an ``Accept-Encoding`` header value allows ``encoding``.
+
+    >>> accepts_encoding("gzip, deflate, br", "gzip")
+    True
+    >>> accepts_encoding("gzip;q=0, *", "gzip")
+    False
+    """
+    if not accept_encoding:
+        return False
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted.get(encoding, accepted.get("*", 0.0)) > 0
+
+
+class PydanticJSONResponse(Response):
+    """JSON response rendered by pydantic's Rust serializer.
+
+    Models, dataclasses, datetimes and enums are written straight to bytes,
+    without building an intermediate ``dict`` or going through ``json.dumps``.
+    Content that is ``bytes`` already is assumed to be JSON and sent unchanged,
+    which allows caching serialized payloads.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: object) -> bytes:
+        """Serialize ``content`` to JSON bytes."""
+        if isinstance(content, bytes):
+            return content
+        return pydantic_core.to_json(content)
+
+
+class _Encoder(Protocol):
+    def compress(self, body: bytes, *, more_body: bool) -> bytes: ...
+
+
+class _GzipEncoder:
+    def __init__(self, compresslevel: int) -> None:
+        self._compressor = zlib.compressobj(
+            compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+        )
+
+    def compress(self, body: bytes, *, more_body: bool) -> bytes:
+        mode = zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH
+        return self._compressor.compress(body) + self._compressor.flush(mode)
+
+
+class _BrotliEncoder:
+    def __init__(self, brotli_module: ModuleType, quality: int) -> None:
+        self._compressor: Any = brotli_module.Compressor(quality=quality)
+
+    def compress(self, body: bytes, *, more_body: bool) -> bytes:
+        data = self._compressor.process(body)
+        if more_body:
+            return data + self._compressor.flush()
+        return data + self._compressor.finish()
+
+
+def is_excluded_content_type(content_type: str) -> bool:
+    """Return whether responses of ``content_type`` are sent uncompressed.
+
+    >>> is_excluded_content_type("application/pdf")
+    True
+    >>> is_excluded_content_type("video/mp4")
+    True
+    >>> is_excluded_content_type("application/json; charset=utf-8")
+    False
+    """
+    media_type = content_type.partition(";")[0].strip().lower()
+    family = media_type.partition("/")[0] + "/*"
+    return media_type in EXCLUDED_CONTENT_TYPES or family in EXCLUDED_CONTENT_TYPES
+
+
+class _CompressingSend:
+    """Compress the body of one response on its way to the client."""
+
+    def __init__(
+        self,
+        send: Send,
+        content_encoding: str,
+        make_encoder: Callable[[], _Encoder],
+        *,
+        minimum_size: int,
+        thread_minimum_size: int,
+    ) -> None:
+        self.send = send
+        self.content_encoding = content_encoding
+        self.make_encoder = make_encoder
+        self.minimum_size = minimum_size
+        self.thread_minimum_size = thread_minimum_size
+        self.encoder: _Encoder | None = None
+        # The start message is held back until the first body chunk shows
+        # whether the response is compressed.
+        self.start: Message | None = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] == HTTPStatus.PARTIAL_CONTENT
+                or is_excluded_content_type(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start = message
+            return
+        if message_type != "http.response.body" and self.start is not None:
+            # Files sent by the server itself are never compressed.
+            self.passthrough = True
+            await self.send(self.start)
+            self.start = None
+        if self.passthrough or message_type != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+            message["body"] = await self._compress(body, more_body=more_body)
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            headers["Content-Encoding"] = self.content_encoding
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            if not more_body and not start.get("trailers", False):
+                headers["Content-Length"] = str(len(message["body"]))
+            await self.send(start)
+            await self.send(message)
+            return
+        message["body"] = await self._compress(body, more_body=more_body)
+        await self.send(message)
+
+    async def _compress(self, body: bytes, *, more_body: bool) -> bytes:
+        # Only allocated once a body is actually compressed
+        if self.encoder is None:
+            self.encoder = self.make_encoder()
+        compress = functools.partial(self.encoder.compress, more_body=more_body)
+        if len(body) >= self.thread_minimum_size:
+            # Compressing large chunks inline would block the event loop.
+            return await anyio.to_thread.run_sync(compress, body)
+        return compress(body)
+
+
+class ResponseCompressionMiddleware:
+    """Compress response bodies with brotli or gzip.
+
+    Brotli is preferred if the client accepts it and the optional ``brotli``
+    package is installed; otherwise gzip is used. Bodies smaller than
+    ``minimum_size``, responses that already have a ``Content-Encoding`` (such
+    as compressed attachments), partial responses and already compressed media
+    types are sent unchanged.
+
+    Parameters
+    ----------
+    app : ASGIApp
+        The application to wrap.
+    minimum_size : int
+        Minimum body size in bytes for compression.
+    compresslevel : int
+        gzip compression level.
+    brotli_quality : int
+        brotli compression quality.
+    thread_minimum_size : int
+        Body chunks of at least this many bytes are compressed in a thread.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        compresslevel: int = 6,
+        brotli_quality: int = 4,
+        thread_minimum_size: int = 128 * 1024,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self.brotli_quality = brotli_quality
+        self.thread_minimum_size = thread_minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request, choosing the encoding of its response."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        make_encoder: Callable[[], _Encoder]
+        if brotli is not None and accepts_encoding(accept_encoding, "br"):
+            content_encoding = "br"
+            make_encoder = functools.partial(
+                _BrotliEncoder, brotli, self.brotli_quality
+            )
+        elif accepts_encoding(accept_encoding, "gzip"):
+            content_encoding = "gzip"
+            make_encoder = functools.partial(_GzipEncoder, self.compresslevel)
+        else:
+            await self.app(scope, receive, send)
+            return
+        await self.app(
+            scope,
+            receive,
+            _CompressingSend(
+                send,
+                content_encoding,
+                make_encoder,
+                minimum_size=self.minimum_size,
+                thread_minimum_size=self.thread_minimum_size,
+            ),
+        )
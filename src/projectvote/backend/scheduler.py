@@ -0,0 +1,71 @@
+"""Minimal in-process scheduler for periodic background jobs."""
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class PeriodicJob:
+    """A coroutine function that is run at a fixed interval.
+
+    Attributes
+    ----------
+    name : str
+        Name of the job, used in log messages.
+    interval : float
+        Seconds between the end of one run and the start of the next.
+    func : Callable[[], Awaitable[object]]
+        The coroutine function to run.
+    """
+
+    name: str
+    interval: float
+    func: Callable[[], Awaitable[object]]
+
+
+class Scheduler:
+    """Run periodic jobs as asyncio tasks for the lifetime of the application.
+
+    Every job runs in its own task, so a slow job never delays the others. A
+    failing run is logged and the job is retried after its regular interval.
+    """
+
+    def __init__(self) -> None:
+        self.jobs: list[PeriodicJob] = []
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def add_job(
+        self, name: str, interval: float, func: Callable[[], Awaitable[object]]
+    ) -> None:
+        """Register a job. Jobs added after ``start`` are not run."""
+        self.jobs.append(PeriodicJob(name=name, interval=interval, func=func))
+
+    def start(self) -> None:
+        """Start one task per registered job."""
+        self._tasks = [
+            asyncio.create_task(self._run(job), name=f"scheduler:{job.name}")
+            for job in self.jobs
+        ]
+
+    async def stop(self) -> None:
+        """Cancel all running jobs and wait for them to finish."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+
+    @staticmethod
+    async def _run(job: PeriodicJob) -> None:
+        while True:
+            await asyncio.sleep(job.interval)
+            try:
+                await job.func()
+            except Exception:
+                logger.exception("Scheduled job '%s' failed", job.name)
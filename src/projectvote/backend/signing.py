@@ -0,0 +1,61 @@
+"""Signed, expiring tokens that identify a board member (magic links)."""
+
+import base64
+import binascii
+import datetime as dt
+import hashlib
+import hmac
+
+_SEPARATOR = "."
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _signature(payload: str, secret: str) -> str:
+    digest = hmac.new(secret.encode(), payload.encode(), hashlib.sha256).digest()
+    return _b64encode(digest)
+
+
+def create_voter_token(email: str, secret: str, expires_at: dt.datetime) -> str:
+    """Create a token that proves access to ``email`` until ``expires_at``.
+
+    Parameters
+    ----------
+    email : str
+        The email address of the board member.
+    secret : str
+        The server-side signing secret.
+    expires_at : dt.datetime
+        Timezone-aware expiry time of the token.
+
+    Returns
+    -------
+    str
+        A URL-safe token of the form ``<email>.<expiry>.<signature>``.
+    """
+    payload = f"{_b64encode(email.encode())}{_SEPARATOR}{int(expires_at.timestamp())}"
+    return f"{payload}{_SEPARATOR}{_signature(payload, secret)}"
+
+
+def verify_voter_token(token: str, secret: str, now: dt.datetime) -> str | None:
+    """Return the email encoded in ``token``, or ``None`` if it is invalid.
+
+    A token is invalid if it is malformed, was not signed with ``secret`` or has
+    expired at ``now``.
+    """
+    try:
+        encoded_email, expires, signature = token.split(_SEPARATOR)
+        payload = f"{encoded_email}{_SEPARATOR}{expires}"
+        if not hmac.compare_digest(signature, _signature(payload, secret)):
+            return None
+        if int(expires) <= now.timestamp():
+            return None
+        return _b64decode(encoded_email).decode()
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        return None
@@ -0,0 +1,148 @@
+"""In-process SMTP server that accepts every message, for local runs and load tests.
+
+The sink implements just enough of SMTP for ``aiosmtplib`` (and therefore
+fastapi-mail) to deliver messages: any credentials are accepted and there is no
+TLS. Messages are counted and optionally appended to an mbox file.
+
+Run it next to the backend with::
+
+    python -m projectvote.backend.smtp_sink --port 1025 --mbox data/sink.mbox
+"""
+
+import argparse
+import asyncio
+import base64
+import email
+import logging
+import mailbox
+from collections.abc import Awaitable, Callable
+from email.message import Message
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+HOSTNAME = "projectvote-sink"
+# Maximum length of a single line, including message body lines.
+LINE_LIMIT = 2**20
+
+type Reply = Callable[..., Awaitable[None]]
+
+
+class SMTPSink:
+    """An SMTP server that accepts all mail.
+
+    Parameters
+    ----------
+    mbox_path : Path | None
+        Mailbox to append received messages to. ``None`` only counts them.
+
+    Attributes
+    ----------
+    received : int
+        Number of messages received since the sink was created.
+    """
+
+    def __init__(self, mbox_path: Path | None = None) -> None:
+        self.mbox_path = mbox_path
+        self.received = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 1025) -> asyncio.Server:
+        """Start listening; use port ``0`` to pick a free port."""
+        return await asyncio.start_server(self.handle, host, port, limit=LINE_LIMIT)
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one SMTP session."""
+
+        async def reply(*lines: str) -> None:
+            writer.write("".join(f"{line}\r\n" for line in lines).encode())
+            await writer.drain()
+
+        await reply(f"220 {HOSTNAME} ESMTP")
+        try:
+            while line := await reader.readline():
+                command, _, argument = line.decode().rstrip("\r\n").partition(" ")
+                match command.upper():
+                    case "EHLO":
+                        await reply(
+                            f"250-{HOSTNAME}",
+                            "250-8BITMIME",
+                            "250-SMTPUTF8",
+                            "250 AUTH PLAIN LOGIN",
+                        )
+                    case "HELO" | "MAIL" | "RCPT" | "RSET" | "NOOP":
+                        await reply("250 OK")
+                    case "AUTH":
+                        await self._authenticate(argument, reader, reply)
+                    case "DATA":
+                        await reply("354 End data with <CR><LF>.<CR><LF>")
+                        await self._store(await self._read_data(reader))
+                        await reply("250 OK")
+                    case "QUIT":
+                        await reply("221 Bye")
+                        break
+                    case _:
+                        await reply("502 Command not implemented")
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _authenticate(
+        argument: str, reader: asyncio.StreamReader, reply: Reply
+    ) -> None:
+        """Complete an AUTH exchange, accepting any credentials."""
+        mechanism, _, initial_response = argument.partition(" ")
+        prompts = 2 if mechanism.upper() == "LOGIN" else int(not initial_response)
+        for prompt in ("Username:", "Password:")[:prompts]:
+            await reply(f"334 {base64.b64encode(prompt.encode()).decode()}")
+            await reader.readline()
+        await reply("235 Authentication successful")
+
+    @staticmethod
+    async def _read_data(reader: asyncio.StreamReader) -> bytes:
+        """Read a message body up to the terminating dot, undoing dot-stuffing."""
+        lines = []
+        while (line := await reader.readline()) not in {b".\r\n", b".\n", b""}:
+            lines.append(line.removeprefix(b"."))
+        return b"".join(lines)
+
+    async def _store(self, data: bytes) -> None:
+        self.received += 1
+        if self.mbox_path is not None:
+            message = email.message_from_bytes(data)
+            await asyncio.to_thread(_append, self.mbox_path, message)
+
+
+def _append(path: Path, message: Message) -> None:
+    box = mailbox.mbox(path)
+    box.lock()
+    try:
+        box.add(message)
+    finally:
+        box.close()
+
+
+async def serve(host: str, port: int, mbox_path: Path | None) -> None:
+    """Run the sink until cancelled."""
+    server = await SMTPSink(mbox_path).start(host, port)
+    logger.info("SMTP sink listening on %s:%s", host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the SMTP sink from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Run an SMTP server that accepts every message."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    parser.add_argument("--mbox", type=Path, help="append received messages here")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(serve(args.host, args.port, args.mbox))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Side-effect-free voting decision engine.
+
+The functions in this module only look at vote counts. They never touch the
+database or send emails, which makes them cheap enough to re-evaluate large
+numbers of applications at once (e.g. after a change of the board or when
+replaying historical votes).
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from .models import ApplicationStatus, VoteOption
+
+
+@dataclass(frozen=True, slots=True)
+class VoteTally:
+    """Vote counts of a single application.
+
+    Attributes
+    ----------
+    approvals : int
+        Number of cast 'approve' votes.
+    rejects : int
+        Number of cast 'reject' votes.
+    abstains : int
+        Number of cast 'abstain' votes.
+    electorate : int
+        Number of board members entitled to vote on the application.
+    """
+
+    approvals: int
+    rejects: int
+    abstains: int
+    electorate: int
+
+    @property
+    def cast(self) -> int:
+        """Return the number of votes cast so far."""
+        return self.approvals + self.rejects + self.abstains
+
+    @property
+    def remaining(self) -> int:
+        """Return the number of votes that are still outstanding."""
+        return self.electorate - self.cast
+
+    @property
+    def majority_needed(self) -> int:
+        """Return the simple majority of all votes that are not abstentions."""
+        return majority_needed(self.electorate, self.abstains)
+
+
+def majority_needed(electorate: int, abstains: int) -> int:
+    """Return the number of votes needed for a simple majority.
+
+    Abstentions are not counted as decisive votes, so the majority is computed
+    over the remaining part of the electorate.
+    """
+    return (electorate - abstains) // 2 + 1
+
+
+def tally_votes(votes: Iterable[VoteOption | None], electorate: int) -> VoteTally:
+    """Count a sequence of votes, ignoring votes that have not been cast yet.
+
+    Parameters
+    ----------
+    votes : Iterable[VoteOption | None]
+        The vote of every voter, ``None`` for votes that are still pending.
+    electorate : int
+        Number of board members entitled to vote.
+
+    Returns
+    -------
+    VoteTally
+        The counted votes.
+    """
+    approvals = rejects = abstains = 0
+    for vote in votes:
+        if vote == VoteOption.APPROVE:
+            approvals += 1
+        elif vote == VoteOption.REJECT:
+            rejects += 1
+        elif vote == VoteOption.ABSTAIN:
+            abstains += 1
+    return VoteTally(approvals, rejects, abstains, electorate)
+
+
+def _decide(
+    approvals: int, rejects: int, abstains: int, electorate: int, *, closed: bool
+) -> int:
+    """Return 1 for approval, -1 for rejection and 0 if still undecided."""
+    needed = majority_needed(electorate, abstains)
+    # 1. Is approval guaranteed?
+    if approvals >= needed:
+        return 1
+    # 2. Is rejection guaranteed? Either voting has closed, a majority rejected,
+    #    or approval can no longer be reached even if every outstanding vote is
+    #    an approval.
+    remaining = electorate - approvals - rejects - abstains
+    if closed or rejects >= needed or approvals + remaining < needed:
+        return -1
+    return 0
+
+
+_OUTCOMES = {
+    1: ApplicationStatus.APPROVED,
+    -1: ApplicationStatus.REJECTED,
+    0: ApplicationStatus.PENDING,
+}
+
+
+def decide(tally: VoteTally, *, closed: bool = False) -> ApplicationStatus:
+    """Return the outcome of a single application.
+
+    A definitive decision is reached if the outcome is determined even if not all
+    board members have voted. This occurs when a simple majority for 'approve' or
+    'reject' is irreversible. A tie is a rejection.
+
+    Parameters
+    ----------
+    tally : VoteTally
+        The vote counts of the application.
+    closed : bool
+        Whether voting has closed (e.g. its deadline passed). Outstanding votes
+        are then never cast, so anything short of an approval majority is a
+        rejection.
+
+    Returns
+    -------
+    ApplicationStatus
+        ``APPROVED`` or ``REJECTED`` once the outcome is final, ``PENDING``
+        otherwise.
+    """
+    return _OUTCOMES[
+        _decide(
+            tally.approvals,
+            tally.rejects,
+            tally.abstains,
+            tally.electorate,
+            closed=closed,
+        )
+    ]
+
+
+def decide_batch(
+    approvals: Sequence[int],
+    rejects: Sequence[int],
+    abstains: Sequence[int],
+    electorate: Sequence[int],
+    closed: Sequence[bool] | None = None,
+) -> list[ApplicationStatus]:
+    """Return the outcome of many applications at once.
+
+    The tallies are passed column-wise, one sequence per count, which matches
+    the shape of an aggregate ``GROUP BY`` query and avoids building one
+    ``VoteTally`` per application.
+
+    Parameters
+    ----------
+    approvals : Sequence[int]
+        Number of 'approve' votes per application.
+    rejects : Sequence[int]
+        Number of 'reject' votes per application.
+    abstains : Sequence[int]
+        Number of 'abstain' votes per application.
+    electorate : Sequence[int]
+        Number of board members entitled to vote per application.
+    closed : Sequence[bool] | None
+        Whether voting has closed per application, see ``decide``. ``None``
+        means voting is open for all applications.
+
+    Returns
+    -------
+    list[ApplicationStatus]
+        The outcome of every application, in input order.
+
+    Raises
+    ------
+    ValueError
+        If the sequences differ in length.
+    """
+    if closed is None:
+        closed = [False] * len(approvals)
+    if not (
+        len(approvals) == len(rejects) == len(abstains) == len(electorate)
+        and len(closed) == len(approvals)
+    ):
+        raise ValueError("All tally sequences must have the same length.")
+    outcomes = _OUTCOMES
+    return [
+        outcomes[_decide(a, r, x, e, closed=c)]
+        for a, r, x, e, c in zip(
+            approvals, rejects, abstains, electorate, closed, strict=True
+        )
+    ]
@@ -59,6 +59,7 @@ export interface ApplicationOut {
   status: ApplicationStatus;
   created_at: string;
   concluded_at?: string;
+  voting_deadline?: string | null;
   votes: VoteOut[];
   attachments: AttachmentOut[];
 }
@@ -74,6 +75,7 @@ export interface VoteDetails {
         attachments: AttachmentOut[];
     };
     vote_options: VoteOption[];
+    current_vote: VoteOption | null;
 }
 
 
@@ -97,12 +99,17 @@ export const getApplicationsArchive = async (): Promise<ApplicationOut[]> => {
 /**
  * Submits a new application to the backend.
  * @param applicationData - The data for the new application.
- * @param file - Optional file attachment.
+ * @param files - Optional file attachments.
+ * @param uploadIds - Ids of completed resumable uploads to attach.
+ * @param idempotencyKey - Optional key identifying this submission; retries with
+ *   the same key return the original application instead of creating a new one.
  * @returns The response from the server.
  */
 export const submitApplication = async (
   applicationData: ApplicationCreate,
-  file: File | null = null
+  files: File[] = [],
+  idempotencyKey?: string,
+  uploadIds: string[] = []
 ) => {
   try {
     // Create FormData to support file uploads
@@ -117,14 +124,14 @@ export const submitApplication = async (
     formData.append('project_description', applicationData.project_description);
     formData.append('costs', applicationData.costs.toString());
 
-    // Append file if provided
-    if (file) {
-      formData.append('attachment', file);
-    }
+    // Append all files under the same field name
+    files.forEach((file) => formData.append('attachments', file));
+    uploadIds.forEach((uploadId) => formData.append('upload_ids', uploadId));
 
     const response = await apiClient.post('/applications', formData, {
       headers: {
         'Content-Type': 'multipart/form-data',
+        ...(idempotencyKey && { 'Idempotency-Key': idempotencyKey }),
       },
     });
     return response.data;
@@ -134,6 +141,60 @@ export const submitApplication = async (
   }
 };
 
+// Size of the chunks sent by resumable uploads
+const UPLOAD_CHUNK_SIZE = 1024 * 1024; // 1MB
+const UPLOAD_MAX_RETRIES = 5;
+
+const sha256Hex = async (file: File): Promise<string> => {
+  const digest = await crypto.subtle.digest('SHA-256', await file.arrayBuffer());
+  return Array.from(new Uint8Array(digest))
+    .map((byte) => byte.toString(16).padStart(2, '0'))
+    .join('');
+};
+
+/**
+ * Uploads a file in chunks, resuming after failed requests.
+ * @param file - The file to upload.
+ * @returns The id of the completed upload, to be passed to submitApplication.
+ */
+export const uploadFileResumable = async (file: File): Promise<string> => {
+  const { data: upload } = await apiClient.post('/uploads', {
+    filename: file.name,
+    mime_type: file.type || 'application/octet-stream',
+    length: file.size,
+  });
+  let offset = 0;
+  let retries = 0;
+  while (offset < file.size) {
+    try {
+      const response = await apiClient.patch(
+        `/uploads/${upload.id}`,
+        file.slice(offset, offset + UPLOAD_CHUNK_SIZE),
+        {
+          headers: {
+            'Content-Type': 'application/offset+octet-stream',
+            'Upload-Offset': offset.toString(),
+          },
+        }
+      );
+      offset = parseInt(response.headers['upload-offset'], 10);
+      retries = 0;
+    } catch (error) {
+      if (++retries > UPLOAD_MAX_RETRIES) {
+        console.error('Error uploading file:', error);
+        throw error;
+      }
+      // Continue from the offset the server has acknowledged
+      const { data: state } = await apiClient.get(`/uploads/${upload.id}`);
+      offset = state.offset;
+    }
+  }
+  await apiClient.post(`/uploads/${upload.id}/complete`, {
+    sha256: await sha256Hex(file),
+  });
+  return upload.id;
+};
+
 /**
  * Fetches the details for a specific vote using a token.
  * @param token - The unique token for the vote.
@@ -184,6 +245,15 @@ export const getPublicAttachmentUrl = (attachmentId: number): string => {
   return `/api/attachments/${attachmentId}`;
 };
 
+/**
+ * Gets the URL of the preview image of an attachment.
+ * @param attachmentId - The attachment ID.
+ * @returns The preview URL. It answers 404 while no preview is available.
+ */
+export const getAttachmentPreviewUrl = (attachmentId: number): string => {
+  return `/api/attachments/${attachmentId}/preview`;
+};
+
 /**
  * Fetches the application version from the backend.
  * @returns The version string.
@@ -13,7 +13,11 @@ import {
   FormHelperText,
 } from '@mui/material';
 import { AttachFile, Close } from '@mui/icons-material';
-import { submitApplication, type ApplicationCreate } from '../apiService';
+import {
+  submitApplication,
+  uploadFileResumable,
+  type ApplicationCreate,
+} from '../apiService';
 
 const ApplicationForm: React.FC = () => {
   const [formData, setFormData] = useState({
@@ -26,10 +30,12 @@ const ApplicationForm: React.FC = () => {
     costs: '',
   });
 
-  const [selectedFile, setSelectedFile] = useState<File | null>(null);
+  const [selectedFiles, setSelectedFiles] = useState<File[]>([]);
   const [fileError, setFileError] = useState<string>('');
   const [errors, setErrors] = useState<Record<string, string>>({});
   const [isSubmitting, setIsSubmitting] = useState(false);
+  // Identifies the current submission, so retries never create duplicates
+  const [idempotencyKey, setIdempotencyKey] = useState(() => crypto.randomUUID());
 
   const [snackbar, setSnackbar] = useState<{
     open: boolean;
@@ -39,6 +45,9 @@ const ApplicationForm: React.FC = () => {
 
   // File validation constants
   const MAX_FILE_SIZE = 10 * 1024 * 1024; // 10MB
+  const MAX_TOTAL_SIZE = 50 * 1024 * 1024; // 50MB
+  const MAX_FILE_COUNT = 10;
+  const RESUMABLE_UPLOAD_THRESHOLD = 2 * 1024 * 1024; // 2MB
   const ALLOWED_FILE_TYPES = [
     'application/pdf',
     'application/vnd.openxmlformats-officedocument.wordprocessingml.document', // DOCX
@@ -94,22 +103,33 @@ const ApplicationForm: React.FC = () => {
   };
 
   const handleFileChange = (e: React.ChangeEvent<HTMLInputElement>) => {
-    const file = e.target.files?.[0];
-    if (file) {
-      const error = validateFile(file);
-      if (error) {
-        setFileError(error);
-        setSelectedFile(null);
-        e.target.value = ''; // Reset input
-      } else {
-        setFileError('');
-        setSelectedFile(file);
-      }
+    const files = Array.from(e.target.files ?? []);
+    e.target.value = ''; // Reset input, so the same file can be picked again
+    if (files.length === 0) {
+      return;
+    }
+    const error = files.map(validateFile).find((message) => message);
+    const combined = [...selectedFiles, ...files];
+    const totalSize = combined.reduce((sum, file) => sum + file.size, 0);
+    if (error) {
+      setFileError(error);
+    } else if (combined.length > MAX_FILE_COUNT) {
+      setFileError(`Es sind höchstens ${MAX_FILE_COUNT} Dateien erlaubt`);
+    } else if (totalSize > MAX_TOTAL_SIZE) {
+      setFileError('Die Dateien dürfen zusammen 50 MB nicht überschreiten');
+    } else {
+      setFileError('');
+      setSelectedFiles(combined);
     }
   };
 
-  const handleRemoveFile = () => {
-    setSelectedFile(null);
+  const handleRemoveFile = (index: number) => {
+    setSelectedFiles((files) => files.filter((_, i) => i !== index));
+    setFileError('');
+  };
+
+  const handleRemoveAllFiles = () => {
+    setSelectedFiles([]);
     setFileError('');
     // Reset file input
     const fileInput = document.getElementById('attachment-input') as HTMLInputElement;
@@ -147,7 +167,17 @@ const ApplicationForm: React.FC = () => {
         costs: parseFloat(formData.costs) || 0,
       };
 
-      const response = await submitApplication(applicationData, selectedFile);
+      // Large files are uploaded in resumable chunks beforehand
+      const largeFiles = selectedFiles.filter(
+        (file) => file.size > RESUMABLE_UPLOAD_THRESHOLD
+      );
+      const uploadIds = await Promise.all(largeFiles.map(uploadFileResumable));
+      const response = await submitApplication(
+        applicationData,
+        selectedFiles.filter((file) => file.size <= RESUMABLE_UPLOAD_THRESHOLD),
+        idempotencyKey,
+        uploadIds
+      );
 
       setSnackbar({
         open: true,
@@ -165,7 +195,8 @@ const ApplicationForm: React.FC = () => {
         project_description: '',
         costs: '',
       });
-      handleRemoveFile();
+      handleRemoveAllFiles();
+      setIdempotencyKey(crypto.randomUUID());
     } catch (error) {
       console.error('Fehler beim Einreichen des Antrags:', error);
       setSnackbar({
@@ -285,7 +316,7 @@ const ApplicationForm: React.FC = () => {
             <Grid>
               <Box sx={{ mt: 1 }}>
                 <Typography variant="body2" color="text.secondary" gutterBottom>
-                  Anhang (optional)
+                  Anhänge (optional)
                 </Typography>
                 <Button
                   variant="outlined"
@@ -294,17 +325,21 @@ const ApplicationForm: React.FC = () => {
                   fullWidth
                   sx={{ justifyContent: 'flex-start', textTransform: 'none' }}
                 >
-                  {selectedFile ? 'Datei ändern' : 'Datei auswählen'}
+                  {selectedFiles.length > 0
+                    ? 'Weitere Dateien hinzufügen'
+                    : 'Dateien auswählen'}
                   <input
                     type="file"
                     id="attachment-input"
                     hidden
+                    multiple
                     accept=".pdf,.doc,.docx,.xls,.xlsx"
                     onChange={handleFileChange}
                   />
                 </Button>
-                {selectedFile && (
+                {selectedFiles.map((file, index) => (
                   <Box
+                    key={`${file.name}-${index}`}
                     sx={{
                       mt: 1,
                       p: 1,
@@ -317,23 +352,24 @@ const ApplicationForm: React.FC = () => {
                     }}
                   >
                     <Typography variant="body2" sx={{ wordBreak: 'break-all' }}>
-                      {selectedFile.name} ({(selectedFile.size / 1024).toFixed(1)} KB)
+                      {file.name} ({(file.size / 1024).toFixed(1)} KB)
                     </Typography>
                     <Button
                       size="small"
-                      onClick={handleRemoveFile}
+                      onClick={() => handleRemoveFile(index)}
                       startIcon={<Close />}
                       sx={{ minWidth: 'auto' }}
                     >
                       Entfernen
                     </Button>
                   </Box>
-                )}
+                ))}
                 {fileError && (
                   <FormHelperText error>{fileError}</FormHelperText>
                 )}
                 <FormHelperText>
-                  Erlaubte Formate: PDF, DOC, DOCX, XLS, XLSX (max. 10 MB)
+                  Erlaubte Formate: PDF, DOC, DOCX, XLS, XLSX (max. 10 Dateien, je 10 MB,
+                  insgesamt 50 MB)
                 </FormHelperText>
               </Box>
             </Grid>
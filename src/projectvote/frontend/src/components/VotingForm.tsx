@@ -26,6 +26,7 @@ import {
   getVoteDetails,
   castVote,
   getAttachmentUrl,
+  getAttachmentPreviewUrl,
   type VoteDetails,
   type VoteCreate,
   VoteOption,
@@ -59,7 +60,9 @@ const VotingForm: React.FC = () => {
       try {
         const data = await getVoteDetails(token);
         setVoteDetails(data);
-        if (data.vote_options.length > 0) {
+        if (data.current_vote) {
+          setSelectedVote(data.current_vote);
+        } else if (data.vote_options.length > 0) {
           setSelectedVote(data.vote_options[0]);
         }
       } catch (err) {
@@ -155,6 +158,17 @@ const VotingForm: React.FC = () => {
                       >
                         {attachment.filename}
                       </Link>
+                      <Box
+                        component="img"
+                        src={getAttachmentPreviewUrl(attachment.id)}
+                        alt={`Vorschau von ${attachment.filename}`}
+                        loading="lazy"
+                        sx={{ display: 'block', mt: 1, maxWidth: 160, maxHeight: 160 }}
+                        // Not every file type has a preview
+                        onError={(e: React.SyntheticEvent<HTMLImageElement>) => {
+                          e.currentTarget.style.display = 'none';
+                        }}
+                      />
                     </ListItemText>
                   </ListItem>
                 ))}
@@ -1,5 +1,6 @@
 """Configuration and shared fixtures for pytest."""
 
+import os
 import shutil
 import tempfile
 from collections.abc import AsyncGenerator, Generator
@@ -12,10 +13,16 @@ from httpx import ASGITransport, AsyncClient
 from pydantic import SecretStr
 from pytest_mock import MockerFixture
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from projectvote.backend.config import Settings
-from projectvote.backend.database import get_db
-from projectvote.backend.main import app, get_app_settings, get_board_members
+from projectvote.backend.database import get_db, get_read_db, sqlite_database_path
+from projectvote.backend.main import (
+    app,
+    get_app_settings,
+    get_board_members,
+    vote_details_cache,
+)
 from projectvote.backend.models import Base
 
 # Define a separate set of board members for testing
@@ -25,15 +32,26 @@ TEST_BOARD_MEMBERS = [
     "test.member3@example.com",
     "test.member4@example.com",
 ]
-EMAILS_SENT_FOR_FINAL_DECISION = 5
+# One email to the applicant and one email addressed to the whole board
+EMAILS_SENT_FOR_FINAL_DECISION = 2
 
 # Setup a test database engine
-# Using a single test DB for the whole test suite.
-TEST_DB_URL = "sqlite+aiosqlite:///./data/test_applications.db"
-test_db_path = Path(TEST_DB_URL.rsplit("///", maxsplit=1)[-1])
-test_db_path.parent.mkdir(parents=True, exist_ok=True)
-
-test_engine = create_async_engine(TEST_DB_URL, echo=False)
+# Using a single test DB for the whole test suite. Set TEST_DATABASE_URL to run
+# the suite against another database, e.g. a local PostgreSQL.
+TEST_DB_URL = os.environ.get(
+    "TEST_DATABASE_URL", "sqlite+aiosqlite:///./data/test_applications.db"
+)
+test_db_path = sqlite_database_path(TEST_DB_URL)
+if test_db_path is not None:
+    test_db_path.parent.mkdir(parents=True, exist_ok=True)
+
+# Every test runs in its own event loop, and connections of server databases
+# are bound to the loop that opened them, so they are not pooled.
+test_engine = create_async_engine(
+    TEST_DB_URL,
+    echo=False,
+    poolclass=None if test_db_path is not None else NullPool,
+)
 TestSessionLocal = async_sessionmaker(bind=test_engine, expire_on_commit=False)
 
 
@@ -65,7 +83,7 @@ async def dispose_test_engine() -> AsyncGenerator[None, None]:
 def cleanup_db_file_after_session() -> Generator[None, None, None]:
     """Ensure the test database file is removed after the test session."""
     yield
-    if test_db_path.exists():
+    if test_db_path is not None and test_db_path.exists():
         test_db_path.unlink()
 
 
@@ -114,7 +132,11 @@ async def client_fixture(
     # Patch where it's USED (in main.py), not where it's defined
     mocker.patch("projectvote.backend.main.send_email", new_callable=mocker.AsyncMock)
 
+    # Start every test with an empty cache so payloads never leak between tests
+    vote_details_cache.clear()
+
     app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_read_db] = get_test_db
     app.dependency_overrides[get_board_members] = get_test_board_members
     app.dependency_overrides[get_app_settings] = get_overridden_settings
 
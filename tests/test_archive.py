@@ -0,0 +1,236 @@
+"""Tests for serializing the archive from database rows."""
+
+import datetime as dt
+from http import HTTPStatus
+from types import SimpleNamespace
+
+from httpx import AsyncClient
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from projectvote.backend.archive import build_archive
+from projectvote.backend.config import Settings
+from projectvote.backend.main import (
+    ApplicationOut,
+    archive_concluded_applications,
+    create_scheduler,
+    get_now,
+)
+from projectvote.backend.models import (
+    Application,
+    ApplicationStatus,
+    ArchivedApplication,
+    ArchivedAttachment,
+    ArchivedVote,
+    ArchivedVoteHistory,
+    Attachment,
+    IdempotencyKey,
+    VoteHistory,
+    VoteOption,
+    VoteRecord,
+)
+
+from .conftest import TEST_BOARD_MEMBERS
+
+ARCHIVE_ADAPTER = TypeAdapter(list[ApplicationOut])
+
+CREATED_AT = dt.datetime(2026, 1, 29, 12, 0, 0, tzinfo=dt.UTC)
+CONCLUDED_AT = dt.datetime(2026, 2, 3, 9, 30, 0, tzinfo=dt.UTC)
+
+
+def _application_row(application_id: int, concluded_at: dt.datetime | None) -> tuple:
+    return (
+        application_id,
+        "Row",
+        f"Applicant {application_id}",
+        f"applicant{application_id}@example.com",
+        "IT",
+        f"Project {application_id}",
+        "Serialized without validation.",
+        12.5,
+        ApplicationStatus.APPROVED if concluded_at else ApplicationStatus.PENDING,
+        CREATED_AT,
+        concluded_at,
+        None,
+    )
+
+
+def test_build_archive_matches_application_out() -> None:
+    """Test that rows are serialized exactly like validated ``ApplicationOut``."""
+    applications = [_application_row(2, CONCLUDED_AT), _application_row(1, None)]
+    votes = [
+        (2, "a@example.com", VoteOption.APPROVE, CREATED_AT),
+        (1, "a@example.com", None, None),
+        (2, "b@example.com", VoteOption.ABSTAIN, CONCLUDED_AT),
+    ]
+    attachments = [(2, 7, "plan.pdf")]
+
+    archive = build_archive(applications, votes, attachments)
+
+    expected = [
+        ApplicationOut.model_validate(
+            SimpleNamespace(
+                **dict(zip(ApplicationOut.model_fields, row, strict=False)),
+                votes=[
+                    SimpleNamespace(voter_email=email, vote=vote, voted_at=voted_at)
+                    for app_id, email, vote, voted_at in votes
+                    if app_id == row[0]
+                ],
+                attachments=[
+                    SimpleNamespace(id=att_id, filename=filename)
+                    for app_id, att_id, filename in attachments
+                    if app_id == row[0]
+                ],
+            )
+        )
+        for row in applications
+    ]
+    assert to_json(archive) == ARCHIVE_ADAPTER.dump_json(expected)
+    assert archive[1]["attachments"] == []
+
+
+async def test_archive_endpoint_matches_orm_serialization(
+    client: AsyncClient, session: AsyncSession
+) -> None:
+    """Test that the endpoint returns what validating ORM objects would."""
+    files = {"attachments": ("notes.txt", b"notes", "text/plain")}
+    for i in range(2):
+        response = await client.post(
+            "/applications",
+            data={
+                "first_name": "Archive",
+                "last_name": f"User {i}",
+                "applicant_email": f"archive{i}@example.com",
+                "department": "IT",
+                "project_title": f"Archive {i}",
+                "project_description": "Compared with the ORM path.",
+                "costs": 10.0,
+            },
+            files=files if i else None,
+        )
+        assert response.status_code == HTTPStatus.OK
+
+    response = await client.get("/applications/archive")
+
+    result = await session.execute(
+        select(Application)
+        .options(selectinload(Application.votes), selectinload(Application.attachments))
+        .order_by(Application.id.desc())
+    )
+    expected = [ApplicationOut.model_validate(app) for app in result.scalars()]
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == ARCHIVE_ADAPTER.dump_json(expected)
+
+
+async def _submit(client: AsyncClient, index: int, *, attach: bool = False) -> int:
+    files = {"attachments": ("notes.txt", b"notes", "text/plain")}
+    response = await client.post(
+        "/applications",
+        data={
+            "first_name": "Cold",
+            "last_name": f"User {index}",
+            "applicant_email": f"cold{index}@example.com",
+            "department": "IT",
+            "project_title": f"Cold {index}",
+            "project_description": "Moved to cold storage.",
+            "costs": 10.0,
+        },
+        files=files if attach else None,
+        headers={"Idempotency-Key": f"cold-{index}"},
+    )
+    assert response.status_code == HTTPStatus.OK
+    return response.json()["application_id"]
+
+
+async def _conclude(
+    session: AsyncSession, application_id: int, concluded_at: dt.datetime
+) -> None:
+    await session.execute(
+        update(Application)
+        .where(Application.id == application_id)
+        .values(status=ApplicationStatus.APPROVED, concluded_at=concluded_at)
+    )
+    await session.commit()
+
+
+async def _count(session: AsyncSession, model: type) -> int:
+    return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+async def test_cold_archival_is_transparent_to_the_archive(
+    client: AsyncClient, session: AsyncSession, test_settings: Settings
+) -> None:
+    """Test that old applications move to cold storage without changing the API."""
+    now = get_now()
+    old = [await _submit(client, i, attach=i == 0) for i in range(3)]
+    recent = await _submit(client, 3)
+    pending = await _submit(client, 4)
+    for application_id in old:
+        await _conclude(session, application_id, now - dt.timedelta(days=6 * 366))
+    await _conclude(session, recent, now - dt.timedelta(days=30))
+    vote_id = (
+        await session.execute(
+            select(VoteRecord.id).where(VoteRecord.application_id == old[0]).limit(1)
+        )
+    ).scalar_one()
+    session.add(VoteHistory(vote_id=vote_id, vote=VoteOption.APPROVE))
+    await session.commit()
+    attachment_id = (
+        await session.execute(
+            select(Attachment.id).where(Attachment.application_id == old[0])
+        )
+    ).scalar_one()
+    before = await client.get("/applications/archive")
+    settings = test_settings.model_copy(
+        update={"archive_after_years": 5, "archive_batch_size": 2}
+    )
+
+    archived = await archive_concluded_applications(session, settings, now)
+
+    assert archived == len(old)
+    assert await archive_concluded_applications(session, settings, now) == 0
+    hot_ids = (await session.execute(select(Application.id))).scalars().all()
+    assert sorted(hot_ids) == [recent, pending]
+    assert await _count(session, ArchivedApplication) == len(old)
+    assert await _count(session, ArchivedVote) == len(old) * len(TEST_BOARD_MEMBERS)
+    assert await _count(session, ArchivedVoteHistory) == 1
+    assert await _count(session, VoteHistory) == 0
+    assert await _count(session, ArchivedAttachment) == 1
+    assert await _count(session, IdempotencyKey) == len(hot_ids)
+    after = await client.get("/applications/archive")
+    assert after.status_code == HTTPStatus.OK
+    assert after.content == before.content
+    download = await client.get(f"/attachments/{attachment_id}")
+    assert download.status_code == HTTPStatus.OK
+    assert download.content == b"notes"
+    preview = await client.get(f"/attachments/{attachment_id}/preview")
+    assert preview.json()["detail"] == "Preview not available."
+
+
+async def test_archived_ids_are_not_reused(
+    client: AsyncClient, session: AsyncSession, test_settings: Settings
+) -> None:
+    """Test that new applications never get the id of an archived one."""
+    now = get_now()
+    application_id = await _submit(client, 0)
+    await _conclude(session, application_id, now - dt.timedelta(days=2 * 366))
+    settings = test_settings.model_copy(update={"archive_after_years": 1})
+    assert await archive_concluded_applications(session, settings, now) == 1
+
+    new_id = await _submit(client, 1)
+
+    assert new_id > application_id
+    archive = (await client.get("/applications/archive")).json()
+    assert [application["id"] for application in archive] == [new_id, application_id]
+
+
+def test_archival_job_is_scheduled_when_enabled(test_settings: Settings) -> None:
+    """Test that the cold archiver only runs with ``archive_after_years``."""
+    job_names = [job.name for job in create_scheduler(test_settings).jobs]
+    assert "cold-archiver" not in job_names
+    settings = test_settings.model_copy(update={"archive_after_years": 2})
+    assert "cold-archiver" in [job.name for job in create_scheduler(settings).jobs]
@@ -0,0 +1,177 @@
+"""Tests for online backups of the database and attachments."""
+
+import contextlib
+import datetime as dt
+import io
+import sqlite3
+import tarfile
+import threading
+import time
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+
+from projectvote.backend.backup import (
+    BACKUP_DATABASE_NAME,
+    backup_database,
+    create_backup,
+)
+
+from .conftest import TEST_DB_URL, test_db_path
+
+ADMIN_HEADERS = {"X-Admin-Token": "admin-secret"}
+NOW = dt.datetime(2026, 10, 19, 12, 0, tzinfo=dt.UTC)
+
+requires_sqlite = pytest.mark.skipif(
+    test_db_path is None, reason="online backups need a SQLite test database"
+)
+
+
+def _create_database(path: Path, filepaths: list[str], rows: int = 0) -> None:
+    with contextlib.closing(sqlite3.connect(path, isolation_level=None)) as db:
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("CREATE TABLE attachments (filepath TEXT)")
+        db.execute("CREATE TABLE archived_attachments (filepath TEXT)")
+        db.execute("CREATE TABLE items (data BLOB)")
+        db.executemany("INSERT INTO attachments VALUES (?)", [(p,) for p in filepaths])
+        db.executemany("INSERT INTO items VALUES (randomblob(500))", [()] * rows)
+
+
+def _count(path: Path, table: str) -> int:
+    with contextlib.closing(sqlite3.connect(path)) as db:
+        return db.execute(f"SELECT count(*) FROM {table}").fetchone()[0]  # noqa: S608
+
+
+def test_backup_is_a_consistent_snapshot_under_writes(tmp_path: Path) -> None:
+    """Test that concurrent writes neither restart nor tear the backup."""
+    source = tmp_path / "app.db"
+    target = tmp_path / "backup.db"
+    _create_database(source, ["data/uploads/a.pdf"], rows=2000)
+    stop = threading.Event()
+
+    def write() -> None:
+        with contextlib.closing(sqlite3.connect(source, isolation_level=None)) as db:
+            while not stop.is_set():
+                db.execute("INSERT INTO items VALUES (randomblob(500))")
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        filepaths = backup_database(source, target, pages_per_step=5, step_sleep=0)
+    finally:
+        stop.set()
+        writer.join()
+
+    assert filepaths == ["data/uploads/a.pdf"]
+    assert 2000 <= _count(target, "items") < _count(source, "items")  # noqa: PLR2004
+    with contextlib.closing(sqlite3.connect(target)) as db:
+        assert db.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+
+
+def test_backup_pauses_between_steps(tmp_path: Path) -> None:
+    """Test that every step but the last is followed by ``step_sleep``."""
+    source = tmp_path / "app.db"
+    _create_database(source, [], rows=200)
+    with contextlib.closing(sqlite3.connect(source)) as db:
+        pages = db.execute("PRAGMA page_count").fetchone()[0]
+    steps = -(-pages // 5)
+
+    started = time.monotonic()
+    backup_database(source, tmp_path / "backup.db", pages_per_step=5, step_sleep=0.02)
+
+    assert time.monotonic() - started >= (steps - 1) * 0.02
+
+
+def test_create_backup_bundles_attachments(tmp_path: Path) -> None:
+    """Test that the archive holds the database and all referenced files."""
+    uploads = tmp_path / "data" / "uploads"
+    uploads.mkdir(parents=True)
+    (uploads / "a.pdf").write_bytes(b"pdf")
+    (uploads / "a.pdf.preview.jpg").write_bytes(b"jpeg")
+    (uploads / "later.txt").write_bytes(b"not in the snapshot")
+    database = tmp_path / "app.db"
+    _create_database(database, ["data/uploads/a.pdf", "data/uploads/gone.txt"])
+
+    result = create_backup(
+        database,
+        tmp_path,
+        tmp_path / "backups",
+        pages_per_step=10,
+        step_sleep=0,
+        now=NOW,
+    )
+
+    assert result.path == tmp_path / "backups" / "projectvote-20261019T120000Z.tar"
+    assert result.attachment_count == 1
+    assert result.size == result.path.stat().st_size
+    assert sorted(p.name for p in (tmp_path / "backups").iterdir()) == [
+        result.path.name
+    ]
+    with tarfile.open(result.path) as tar:
+        assert tar.getnames() == [
+            BACKUP_DATABASE_NAME,
+            "data/uploads/a.pdf",
+            "data/uploads/a.pdf.preview.jpg",
+        ]
+        tar.extractall(tmp_path / "restored", filter="data")
+    assert _count(tmp_path / "restored" / BACKUP_DATABASE_NAME, "attachments") == 2  # noqa: PLR2004
+
+
+class TestBackupEndpoint:
+    """Tests for POST /admin/backups."""
+
+    @pytest.mark.asyncio
+    async def test_requires_admin_token(self, client: AsyncClient) -> None:
+        """Test that backups are part of the admin API."""
+        response = await client.post("/admin/backups", headers=ADMIN_HEADERS)
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    @pytest.mark.settings_override(
+        {
+            "admin_token": "admin-secret",
+            "database_url": "postgresql+asyncpg://localhost/projectvote",
+        }
+    )
+    @pytest.mark.asyncio
+    async def test_only_sqlite_is_supported(self, client: AsyncClient) -> None:
+        """Test that other databases are answered with 409."""
+        response = await client.post("/admin/backups", headers=ADMIN_HEADERS)
+
+        assert response.status_code == HTTPStatus.CONFLICT
+        assert "only supported for SQLite" in response.json()["detail"]
+
+    @requires_sqlite
+    @pytest.mark.settings_override(
+        {"admin_token": "admin-secret", "database_url": TEST_DB_URL}
+    )
+    @pytest.mark.asyncio
+    async def test_backup_of_running_application(self, client: AsyncClient) -> None:
+        """Test that the database and uploads are backed up while in use."""
+        files = {
+            "attachments": ("plan.pdf", io.BytesIO(b"%PDF plan"), "application/pdf")
+        }
+        submitted = await client.post(
+            "/applications",
+            data={
+                "first_name": "Backup",
+                "last_name": "User",
+                "applicant_email": "backup.user@example.com",
+                "department": "IT",
+                "project_title": "Backup Test",
+                "project_description": "Backed up while running.",
+                "costs": 50.0,
+            },
+            files=files,
+        )
+        assert submitted.status_code == HTTPStatus.OK
+
+        response = await client.post("/admin/backups", headers=ADMIN_HEADERS)
+
+        assert response.status_code == HTTPStatus.CREATED
+        body = response.json()
+        assert body["filename"].startswith("projectvote-")
+        assert body["attachment_count"] == 1
+        assert body["size"] > 0
@@ -0,0 +1,82 @@
+"""Tests for cache.py."""
+
+from projectvote.backend.cache import TTLCache
+
+
+class FakeTimer:
+    """A manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+def test_entries_expire_after_ttl() -> None:
+    """Test that entries are served until their time to live has passed."""
+    timer = FakeTimer()
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=5.0, timer=timer)
+    cache.set("a", 1)
+
+    timer.now = 4.9
+    assert cache.get("a") == 1
+
+    timer.now = 5.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    """Test that the least recently used entry is evicted when the cache is full."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used entry
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3  # noqa: PLR2004
+
+
+def test_invalidate() -> None:
+    """Test removing single and multiple keys, including unknown ones."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60.0)
+    for i, key in enumerate("abcd"):
+        cache.set(key, i)
+
+    cache.invalidate("a", "unknown")
+    cache.invalidate_many(iter(["b", "c"]))
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("d") == 3  # noqa: PLR2004
+
+
+def test_disabled_cache_stores_nothing() -> None:
+    """Test that a size or time to live of zero disables the cache."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60.0)
+    cache.set("a", 1)
+
+    cache.configure(maxsize=0, ttl=60.0)
+    cache.set("b", 2)
+
+    assert not cache.enabled
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+
+
+def test_set_skips_values_read_before_an_invalidation() -> None:
+    """Test that a value computed during an invalidation is not stored."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60.0)
+    generation = cache.generation
+
+    cache.invalidate("a")
+    cache.set("a", 1, generation)
+    cache.set("b", 2, cache.generation)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2  # noqa: PLR2004
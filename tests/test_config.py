@@ -1,5 +1,7 @@
 """Tests for the configuration module."""
 
+import importlib
+
 import pytest
 
 from projectvote.backend.config import Settings
@@ -43,3 +45,15 @@ def test_settings_missing_required_raises_error(
     # Clean up for other tests
     Settings.model_config["env_file"] = ".env"
     Settings.model_rebuild(force=True)
+
+
+def test_zstd_compression_requires_support() -> None:
+    """Test that zstd compression is refused where Python lacks zstd."""
+    try:
+        importlib.import_module("compression.zstd")
+    except ImportError:
+        with pytest.raises(ValueError, match=r"requires Python 3\.14"):
+            Settings(board_members="a@b.com", attachment_compression="zstd")
+    else:
+        settings = Settings(board_members="a@b.com", attachment_compression="zstd")
+        assert settings.attachment_compression == "zstd"
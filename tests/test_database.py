@@ -1,11 +1,23 @@
 """Tests for database.py."""
 
 import contextlib
+import datetime as dt
+from pathlib import Path
+from zoneinfo import ZoneInfo
 
 import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.pool import QueuePool
 
-from projectvote.backend.database import get_db
+from projectvote.backend.database import (
+    create_engines,
+    get_db,
+    get_read_db,
+    read_engine,
+)
+from projectvote.backend.models import Application
 
 
 @pytest.mark.asyncio
@@ -19,3 +31,97 @@ async def test_get_db() -> None:
     # Clean up the generator
     with contextlib.suppress(StopAsyncIteration):
         await anext(db_gen)
+
+
+@pytest.mark.asyncio
+async def test_get_read_db() -> None:
+    """Test that get_read_db yields a session of the reader engine."""
+    db_gen = get_read_db()
+    db_session = await anext(db_gen)
+
+    assert db_session.bind is read_engine
+
+    with contextlib.suppress(StopAsyncIteration):
+        await anext(db_gen)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_reader_is_read_only(tmp_path: Path) -> None:
+    """Test that SQLite runs in WAL mode and the reader cannot write."""
+    writer, reader = create_engines(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    try:
+        async with writer.begin() as conn:
+            journal_mode = await conn.scalar(text("PRAGMA journal_mode"))
+            await conn.execute(text("CREATE TABLE items (name TEXT)"))
+            await conn.execute(text("INSERT INTO items VALUES ('written')"))
+
+        async with reader.connect() as conn:
+            names = (await conn.scalars(text("SELECT name FROM items"))).all()
+            with pytest.raises(OperationalError, match="readonly"):
+                await conn.execute(text("INSERT INTO items VALUES ('read')"))
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+    assert journal_mode == "wal"
+    assert names == ["written"]
+
+
+def test_replica_url_is_used_for_reads() -> None:
+    """Test that a configured replica URL is used by the reader engine."""
+    writer, reader = create_engines(
+        "sqlite+aiosqlite:///./data/primary.db", "sqlite+aiosqlite:///./data/replica.db"
+    )
+
+    assert writer.url.database == "./data/primary.db"
+    assert reader.url.database == "./data/replica.db"
+
+
+def test_pool_settings_are_applied() -> None:
+    """Test that both engines use the configured pool size."""
+    pool_size = 3
+    writer, reader = create_engines(
+        "sqlite+aiosqlite:///./data/pool.db", pool_size=pool_size, max_overflow=1
+    )
+
+    assert isinstance(writer.pool, QueuePool)
+    assert isinstance(reader.pool, QueuePool)
+    assert writer.pool.size() == reader.pool.size() == pool_size
+
+
+def test_in_memory_database_without_pool_settings() -> None:
+    """Test that in-memory SQLite databases ignore the pool settings."""
+    writer, reader = create_engines("sqlite+aiosqlite://", pool_size=3)
+
+    assert writer.url == reader.url
+
+
+@pytest.mark.asyncio
+async def test_timestamps_are_stored_and_loaded_as_utc(session: AsyncSession) -> None:
+    """Test that aware timestamps are stored as UTC and loaded as aware UTC."""
+    berlin = dt.datetime(2026, 7, 1, 14, 0, tzinfo=ZoneInfo("Europe/Berlin"))
+    application = Application(
+        first_name="UTC",
+        last_name="Storage",
+        applicant_email="utc.storage@example.com",
+        department="IT",
+        project_title="Timestamps",
+        project_description="Stored in UTC.",
+        costs=1.0,
+        voting_deadline=berlin,
+    )
+    session.add(application)
+    await session.commit()
+
+    stored = await session.scalar(
+        text("SELECT voting_deadline FROM applications WHERE id = :id"),
+        {"id": application.id},
+    )
+    await session.refresh(application)
+
+    # SQLite returns the stored text, other databases a naive datetime
+    assert str(stored).startswith("2026-07-01 12:00:00")
+    assert application.voting_deadline is not None
+    assert application.voting_deadline == berlin
+    assert application.voting_deadline.tzinfo is dt.UTC
+    assert application.created_at.tzinfo is dt.UTC
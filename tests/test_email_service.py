@@ -1,12 +1,31 @@
 """Tests for the email service module."""
 
+import mailbox
+from email.utils import getaddresses
+from pathlib import Path
+from typing import Literal
+
 import pytest
 from fastapi_mail import NameEmail
 from pydantic import SecretStr
 from pytest_mock import MockerFixture
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from projectvote.backend.config import Settings
-from projectvote.backend.email_service import get_mailer, send_email
+from projectvote.backend.email_service import (
+    TEMPLATE_DIR,
+    build_messages,
+    delivery_counts,
+    get_mailer,
+    get_template_environment,
+    precompile_templates,
+    render_template,
+    resend_failed_emails,
+    send_email,
+    to_email_message,
+)
+from projectvote.backend.models import DeliveryStatus, EmailDelivery
 
 
 @pytest.mark.asyncio
@@ -16,6 +35,10 @@ async def test_send_email(mocker: MockerFixture) -> None:
     mock_mailer = mocker.patch("projectvote.backend.email_service.get_mailer")
     mock_send = mocker.AsyncMock()
     mock_mailer.return_value.send_message = mock_send
+    mock_render = mocker.patch(
+        "projectvote.backend.email_service.render_template",
+        return_value="<p>value</p>",
+    )
 
     recipients = ["test@example.com"]
     subject = "Test Subject"
@@ -28,11 +51,67 @@ async def test_send_email(mocker: MockerFixture) -> None:
 
     # Assert
     mock_send.assert_called_once()
-    call_args = mock_send.call_args[0][0]
-    assert call_args.recipients == [NameEmail(name=r, email=r) for r in recipients]
-    assert call_args.subject == subject
-    assert call_args.template_body == template_body
-    assert mock_send.call_args[1]["template_name"] == template_name
+    [message] = mock_send.call_args[0][0]
+    assert message.recipients == [NameEmail(name=r, email=r) for r in recipients]
+    assert message.subject == subject
+    assert message.body == "<p>value</p>"
+    mock_render.assert_awaited_once_with(template_name, template_body)
+
+
+@pytest.mark.asyncio
+async def test_send_email_renders_once_for_many_recipients(
+    mocker: MockerFixture,
+) -> None:
+    """Test that several recipients share one rendering and one SMTP session."""
+    mock_mailer = mocker.patch("projectvote.backend.email_service.get_mailer")
+    mock_send = mocker.AsyncMock()
+    mock_mailer.return_value.send_message = mock_send
+    mock_render = mocker.patch(
+        "projectvote.backend.email_service.render_template",
+        return_value="<p>value</p>",
+    )
+    recipients = ["a@example.com", "b@example.com", "c@example.com"]
+    settings = Settings(board_members=",".join(recipients))
+
+    await send_email(recipients, "Subject", {"key": "value"}, "test.html", settings)
+
+    mock_render.assert_awaited_once()
+    mock_send.assert_awaited_once()
+    messages = mock_send.call_args[0][0]
+    assert [m.recipients for m in messages] == [
+        [NameEmail(name=r, email=r)] for r in recipients
+    ]
+    assert all(m.body == "<p>value</p>" and not m.bcc for m in messages)
+
+
+def test_build_messages_with_bcc() -> None:
+    """Test that BCC mode builds a single message addressed to the sender."""
+    recipients = ["a@example.com", "b@example.com"]
+    settings = Settings(
+        board_members=",".join(recipients),
+        mail_use_bcc=True,
+        mail_from="sender@example.com",
+    )
+
+    [message] = build_messages(recipients, "Subject", "<p>body</p>", settings)
+
+    assert message.recipients == [
+        NameEmail(name=settings.mail_from_name, email="sender@example.com")
+    ]
+    assert message.bcc == [NameEmail(name=r, email=r) for r in recipients]
+    assert message.body == "<p>body</p>"
+
+
+def test_build_messages_with_bcc_single_recipient() -> None:
+    """Test that a single recipient is addressed directly even in BCC mode."""
+    settings = Settings(board_members="a@example.com", mail_use_bcc=True)
+
+    [message] = build_messages(["a@example.com"], "Subject", "<p>body</p>", settings)
+
+    assert message.recipients == [
+        NameEmail(name="a@example.com", email="a@example.com")
+    ]
+    assert message.bcc == []
 
 
 def test_get_mailer_with_password() -> None:
@@ -88,6 +167,11 @@ async def test_send_email_success(mocker: MockerFixture) -> None:
         "projectvote.backend.email_service.get_mailer", return_value=mock_fast_mail
     )
 
+    mocker.patch(
+        "projectvote.backend.email_service.render_template",
+        return_value="<p>value</p>",
+    )
+
     # Mock logger
     mock_logger = mocker.patch("projectvote.backend.email_service.logger")
 
@@ -121,6 +205,11 @@ async def test_send_email_failure(mocker: MockerFixture) -> None:
         "projectvote.backend.email_service.get_mailer", return_value=mock_fast_mail
     )
 
+    mocker.patch(
+        "projectvote.backend.email_service.render_template",
+        return_value="<p>value</p>",
+    )
+
     # Mock logger
     mock_logger = mocker.patch("projectvote.backend.email_service.logger")
 
@@ -135,3 +224,207 @@ async def test_send_email_failure(mocker: MockerFixture) -> None:
 
     # Verify logger.exception was called
     mock_logger.exception.assert_called_once()
+
+
+def test_precompile_templates() -> None:
+    """Test that every email template is loaded at startup."""
+    names = precompile_templates()
+
+    assert sorted(names) == sorted(path.name for path in TEMPLATE_DIR.glob("*.html"))
+    assert "new_application.html" in names
+
+
+def test_template_environment_is_shared() -> None:
+    """Test that templates are parsed once per process."""
+    env = get_template_environment()
+
+    assert get_template_environment() is env
+    assert env.get_template("new_application.html") is env.get_template(
+        "new_application.html"
+    )
+
+
+@pytest.mark.asyncio
+async def test_render_template_independent_of_working_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that templates are found and escaped from any working directory."""
+    monkeypatch.chdir(tmp_path)
+
+    html = await render_template(
+        "pending_votes_reminder.html",
+        {
+            "votes": [
+                {
+                    "project_title": "<script>",
+                    "created_at": "19.10.2026, 12:00 Uhr",
+                    "vote_url": "http://localhost:5173/vote/token",
+                }
+            ]
+        },
+    )
+
+    assert "&lt;script&gt;" in html
+    assert "http://localhost:5173/vote/token" in html
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("mail_format", "mailbox_type"),
+    [("mbox", mailbox.mbox), ("maildir", mailbox.Maildir)],
+)
+async def test_file_driver_appends_to_mailbox(
+    tmp_path: Path,
+    mail_format: Literal["mbox", "maildir"],
+    mailbox_type: type[mailbox.Mailbox],
+) -> None:
+    """Test that the file driver stores every rendered message locally."""
+    path = tmp_path / "outbox"
+    settings = Settings(
+        board_members="test@example.com",
+        mail_driver="file",
+        mail_file_path=path,
+        mail_file_format=mail_format,
+    )
+    recipients = ["a@example.com", "b@example.com"]
+
+    await send_email(
+        recipients, "Erinnerung", {"votes": []}, "pending_votes_reminder.html", settings
+    )
+
+    messages = list(mailbox_type(path))
+    # A maildir does not preserve the insertion order.
+    assert sorted(getaddresses([m["To"]])[0][1] for m in messages) == recipients
+    assert all(m["Subject"] == "Erinnerung" for m in messages)
+
+
+def test_to_email_message_keeps_blind_copies() -> None:
+    """Test that messages for the local mailbox record every recipient."""
+    settings = Settings(
+        board_members="test@example.com", mail_use_bcc=True, mail_from_name="Vote"
+    )
+    (message,) = build_messages(
+        ["a@example.com", "b@example.com"], "Subject", "<p>Hi</p>", settings
+    )
+
+    email = to_email_message(message, settings)
+
+    assert email["To"] == f"Vote <{settings.mail_from}>"
+    assert email["Bcc"] == "a@example.com, b@example.com"
+    assert email.get_content_type() == "text/html"
+    assert email.get_content() == "<p>Hi</p>\n"
+
+
+@pytest.mark.asyncio
+async def test_null_driver_only_counts(mocker: MockerFixture) -> None:
+    """Test that the null driver counts messages without a mail server."""
+    mock_mailer = mocker.patch("projectvote.backend.email_service.get_mailer")
+    settings = Settings(board_members="test@example.com", mail_driver="null")
+    before = delivery_counts["null"]
+
+    await send_email(
+        ["a@example.com", "b@example.com"],
+        "Subject",
+        {"votes": []},
+        "pending_votes_reminder.html",
+        settings,
+    )
+
+    assert delivery_counts["null"] - before == 2  # noqa: PLR2004
+    mock_mailer.assert_not_called()
+
+
+class TestDeliveryLog:
+    """Tests for recording and re-sending email deliveries."""
+
+    TEMPLATE = "pending_votes_reminder.html"
+
+    @staticmethod
+    def _settings(max_attempts: int = 3, batch_size: int = 50) -> Settings:
+        return Settings(
+            board_members="test@example.com",
+            mail_max_attempts=max_attempts,
+            mail_resend_batch_size=batch_size,
+        )
+
+    async def _send(
+        self, session: AsyncSession, settings: Settings, recipients: list[str]
+    ) -> list[EmailDelivery]:
+        await send_email(
+            recipients, "Subject", {"votes": []}, self.TEMPLATE, settings, db=session
+        )
+        await session.commit()
+        result = await session.execute(select(EmailDelivery).order_by(EmailDelivery.id))
+        return list(result.scalars())
+
+    @pytest.mark.asyncio
+    async def test_successful_delivery_is_logged(
+        self, session: AsyncSession, mocker: MockerFixture
+    ) -> None:
+        """Test that every recipient gets a sent log entry."""
+        mocker.patch("projectvote.backend.email_service.deliver_messages")
+
+        deliveries = await self._send(
+            session, self._settings(), ["a@example.com", "b@example.com"]
+        )
+
+        assert [d.recipient for d in deliveries] == ["a@example.com", "b@example.com"]
+        assert all(d.status == DeliveryStatus.SENT for d in deliveries)
+        assert all(d.attempts == 1 and d.last_error is None for d in deliveries)
+        assert all(d.latency_ms is not None for d in deliveries)
+        assert deliveries[0].template_name == self.TEMPLATE
+        assert deliveries[0].template_body == {"votes": []}
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_is_logged(
+        self, session: AsyncSession, mocker: MockerFixture
+    ) -> None:
+        """Test that failures are recorded and dead-lettered after max attempts."""
+        mocker.patch(
+            "projectvote.backend.email_service.deliver_messages",
+            side_effect=ConnectionError("refused"),
+        )
+
+        [failed] = await self._send(session, self._settings(), ["a@example.com"])
+        [_, dead] = await self._send(
+            session, self._settings(max_attempts=1), ["b@example.com"]
+        )
+
+        assert failed.status == DeliveryStatus.FAILED
+        assert failed.last_error == "ConnectionError('refused')"
+        assert dead.status == DeliveryStatus.DEAD
+
+    @pytest.mark.asyncio
+    async def test_resend_failed_emails(
+        self, session: AsyncSession, mocker: MockerFixture
+    ) -> None:
+        """Test that failed emails are retried in batches until dead-lettered."""
+        deliver = mocker.patch(
+            "projectvote.backend.email_service.deliver_messages",
+            side_effect=ConnectionError("refused"),
+        )
+        settings = self._settings(max_attempts=2, batch_size=2)
+        deliveries = await self._send(
+            session, settings, ["a@example.com", "b@example.com", "c@example.com"]
+        )
+
+        # A second failure exhausts the attempts
+        outcomes = await resend_failed_emails(session, settings)
+        assert outcomes == {DeliveryStatus.DEAD: 3}
+        assert await resend_failed_emails(session, settings) == {}
+
+        # Dead-lettered messages are only re-sent on request
+        deliver.side_effect = None
+        outcomes = await resend_failed_emails(
+            session, settings, [deliveries[0].id], include_dead=True
+        )
+        assert outcomes == {DeliveryStatus.SENT: 1}
+        for delivery in deliveries:
+            await session.refresh(delivery)
+        assert [d.status for d in deliveries] == [
+            DeliveryStatus.SENT,
+            DeliveryStatus.DEAD,
+            DeliveryStatus.DEAD,
+        ]
+        assert deliveries[0].attempts == 3  # noqa: PLR2004
+        assert deliveries[0].last_error is None
@@ -1,15 +1,38 @@
 """Tests for the file upload functionality in the ProjectVote application."""
 
+import datetime as dt
+import gzip
+import hashlib
 import io
+import os
 from http import HTTPStatus
+from pathlib import Path
+from typing import Any
 
+import aiofiles.os
 import pytest
-from httpx import AsyncClient
+from fastapi import UploadFile
+from httpx import AsyncClient, Response
+from pytest_mock import MockerFixture
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from projectvote.backend import main
+from projectvote.backend.attachments import (
+    StoredFile,
+    UploadLimitError,
+    compress_stored_file,
+    iter_decompressed,
+    store_uploads,
+)
 from projectvote.backend.config import Settings
-from projectvote.backend.models import Application, Attachment, VoteRecord
+from projectvote.backend.main import _staging_path, delete_expired_uploads, get_now
+from projectvote.backend.models import (
+    Application,
+    Attachment,
+    ResumableUpload,
+    VoteRecord,
+)
 
 
 @pytest.mark.asyncio
@@ -268,3 +291,480 @@ async def test_archive_and_vote_details_include_attachments(
     assert "attachments" in vote_data["application"]
     assert len(vote_data["application"]["attachments"]) == 1
     assert vote_data["application"]["attachments"][0]["filename"] == file_name
+
+
+MULTI_UPLOAD_APPLICATION = {
+    "first_name": "Many",
+    "last_name": "Files",
+    "applicant_email": "many.files@example.com",
+    "department": "IT",
+    "project_title": "Multiple Attachments",
+    "project_description": "Testing multiple file uploads.",
+    "costs": 80.0,
+}
+
+
+def _stored_files(settings: Settings) -> set[Path]:
+    uploads_dir = settings.project_root / "data" / "uploads"
+    return set(uploads_dir.iterdir()) if uploads_dir.exists() else set()
+
+
+@pytest.mark.asyncio
+async def test_create_application_with_multiple_attachments(
+    client: AsyncClient, session: AsyncSession, test_settings: Settings
+) -> None:
+    """Test that all files of the attachments field and the legacy field are stored."""
+    files = [
+        ("attachments", ("plan.pdf", io.BytesIO(b"plan"), "application/pdf")),
+        ("attachments", ("budget.csv", io.BytesIO(b"budget"), "text/csv")),
+        ("attachment", ("legacy.txt", io.BytesIO(b"legacy"), "text/plain")),
+    ]
+
+    response = await client.post(
+        "/applications", data=MULTI_UPLOAD_APPLICATION, files=files
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    app_id = response.json()["application_id"]
+    result = await session.execute(
+        select(Attachment)
+        .where(Attachment.application_id == app_id)
+        .order_by(Attachment.id)
+    )
+    attachments = result.scalars().all()
+    assert [(att.filename, att.mime_type) for att in attachments] == [
+        ("plan.pdf", "application/pdf"),
+        ("budget.csv", "text/csv"),
+        ("legacy.txt", "text/plain"),
+    ]
+    assert [
+        (test_settings.project_root / att.filepath).read_bytes() for att in attachments
+    ] == [b"plan", b"budget", b"legacy"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.settings_override({"max_attachment_bytes": 8})
+async def test_attachment_over_file_limit_is_rejected(
+    client: AsyncClient, test_settings: Settings
+) -> None:
+    """Test that a file over the per-file limit fails and leaves no files behind."""
+    before = _stored_files(test_settings)
+    files = [
+        ("attachments", ("small.txt", io.BytesIO(b"small"), "text/plain")),
+        ("attachments", ("large.txt", io.BytesIO(b"far too large"), "text/plain")),
+    ]
+
+    response = await client.post(
+        "/applications", data=MULTI_UPLOAD_APPLICATION, files=files
+    )
+
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert _stored_files(test_settings) == before
+
+
+@pytest.mark.asyncio
+@pytest.mark.settings_override({"max_attachments_total_bytes": 10})
+async def test_attachments_over_total_limit_are_rejected(
+    client: AsyncClient, test_settings: Settings
+) -> None:
+    """Test that files over the combined limit fail and leave no files behind."""
+    before = _stored_files(test_settings)
+    files = [
+        ("attachments", (f"part{i}.txt", io.BytesIO(b"123456"), "text/plain"))
+        for i in range(2)
+    ]
+
+    response = await client.post(
+        "/applications", data=MULTI_UPLOAD_APPLICATION, files=files
+    )
+
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert _stored_files(test_settings) == before
+
+
+@pytest.mark.asyncio
+@pytest.mark.settings_override({"max_attachment_count": 1})
+async def test_too_many_attachments_are_rejected(client: AsyncClient) -> None:
+    """Test that more files than allowed are rejected."""
+    files = [
+        ("attachments", (f"file{i}.txt", io.BytesIO(b"x"), "text/plain"))
+        for i in range(2)
+    ]
+
+    response = await client.post(
+        "/applications", data=MULTI_UPLOAD_APPLICATION, files=files
+    )
+
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    assert response.json()["detail"] == "At most 1 attachments are allowed."
+
+
+@pytest.mark.asyncio
+async def test_store_uploads_checks_streamed_size(tmp_path: Path) -> None:
+    """Test that the limit holds for uploads without a declared size."""
+    uploads = [
+        UploadFile(io.BytesIO(b"x" * 16), filename=f"file{i}.bin") for i in range(3)
+    ]
+
+    with pytest.raises(UploadLimitError):
+        await store_uploads(
+            uploads,
+            tmp_path,
+            max_count=3,
+            max_file_size=16,
+            max_total_size=40,
+            concurrency=2,
+        )
+
+    assert await aiofiles.os.listdir(tmp_path) == []
+
+
+CHUNK_HEADERS = {"Content-Type": "application/offset+octet-stream"}
+
+
+class TestResumableUploads:
+    """Tests for chunked, resumable uploads."""
+
+    DATA = b"0123456789" * 3
+
+    async def _create(self, client: AsyncClient, length: int | None = None) -> str:
+        response = await client.post(
+            "/uploads",
+            json={
+                "filename": "large.pdf",
+                "mime_type": "application/pdf",
+                "length": len(self.DATA) if length is None else length,
+            },
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        assert response.headers["Location"] == f"/uploads/{response.json()['id']}"
+        return response.json()["id"]
+
+    async def _patch(
+        self, client: AsyncClient, upload_id: str, offset: int, data: bytes
+    ) -> Response:
+        return await client.patch(
+            f"/uploads/{upload_id}",
+            content=data,
+            headers={**CHUNK_HEADERS, "Upload-Offset": str(offset)},
+        )
+
+    async def test_upload_in_chunks_and_submit(
+        self, client: AsyncClient, session: AsyncSession, test_settings: Settings
+    ) -> None:
+        """Test the full flow from creating an upload to attaching it."""
+        upload_id = await self._create(client)
+
+        for offset in range(0, len(self.DATA), 10):
+            response = await self._patch(
+                client, upload_id, offset, self.DATA[offset : offset + 10]
+            )
+            assert response.status_code == HTTPStatus.NO_CONTENT
+            assert response.headers["Upload-Offset"] == str(offset + 10)
+        response = await client.post(
+            f"/uploads/{upload_id}/complete",
+            json={"sha256": hashlib.sha256(self.DATA).hexdigest()},
+        )
+        assert response.status_code == HTTPStatus.OK
+        submit = await client.post(
+            "/applications",
+            data={**MULTI_UPLOAD_APPLICATION, "upload_ids": [upload_id]},
+        )
+
+        assert submit.status_code == HTTPStatus.OK
+        app_id = submit.json()["application_id"]
+        result = await session.execute(
+            select(Attachment).where(Attachment.application_id == app_id)
+        )
+        attachment = result.scalar_one()
+        assert (attachment.filename, attachment.mime_type) == (
+            "large.pdf",
+            "application/pdf",
+        )
+        assert (test_settings.project_root / attachment.filepath).read_bytes() == (
+            self.DATA
+        )
+        assert await session.get(ResumableUpload, upload_id) is None
+        assert not _staging_path(upload_id, test_settings).exists()
+
+    async def test_failed_submission_keeps_upload(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        test_settings: Settings,
+        mocker: MockerFixture,
+    ) -> None:
+        """Test that an upload can be submitted again after a failed submission."""
+        upload_id = await self._create(client)
+        await self._patch(client, upload_id, 0, self.DATA)
+        await client.post(
+            f"/uploads/{upload_id}/complete",
+            json={"sha256": hashlib.sha256(self.DATA).hexdigest()},
+        )
+        stored_before = _stored_files(test_settings)
+        send_voting_links = mocker.patch.object(
+            main, "send_voting_links", side_effect=RuntimeError("mail server down")
+        )
+
+        with pytest.raises(RuntimeError, match="mail server down"):
+            await client.post(
+                "/applications",
+                data={**MULTI_UPLOAD_APPLICATION, "upload_ids": [upload_id]},
+            )
+        await session.rollback()  # As closing the session of the request does
+
+        assert _stored_files(test_settings) == stored_before
+        assert _staging_path(upload_id, test_settings).read_bytes() == self.DATA
+        send_voting_links.side_effect = None
+        retry = await client.post(
+            "/applications",
+            data={**MULTI_UPLOAD_APPLICATION, "upload_ids": [upload_id]},
+        )
+        assert retry.status_code == HTTPStatus.OK
+        assert not _staging_path(upload_id, test_settings).exists()
+
+    async def test_resume_after_offset_mismatch(self, client: AsyncClient) -> None:
+        """Test that a chunk at a wrong offset is refused with the current offset."""
+        upload_id = await self._create(client)
+        await self._patch(client, upload_id, 0, self.DATA[:10])
+
+        response = await self._patch(client, upload_id, 20, self.DATA[20:])
+        state = await client.get(f"/uploads/{upload_id}")
+
+        assert response.status_code == HTTPStatus.CONFLICT
+        assert response.headers["Upload-Offset"] == "10"
+        assert state.json()["offset"] == len(self.DATA[:10])
+        assert state.headers["Cache-Control"] == "no-store"
+        resumed = await self._patch(client, upload_id, 10, self.DATA[10:])
+        assert resumed.headers["Upload-Offset"] == str(len(self.DATA))
+
+    async def test_chunk_beyond_length_is_rejected(self, client: AsyncClient) -> None:
+        """Test that data beyond the declared length is refused and discarded."""
+        upload_id = await self._create(client, length=5)
+
+        response = await self._patch(client, upload_id, 0, self.DATA)
+        state = await client.get(f"/uploads/{upload_id}")
+
+        assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+        assert state.json()["offset"] == 0
+
+    async def test_concurrent_chunk_at_same_offset_is_refused(
+        self, client: AsyncClient, mocker: MockerFixture
+    ) -> None:
+        """Test that a chunk is claimed before it is written."""
+        upload_id = await self._create(client)
+        write_chunk = main.write_chunk
+        concurrent: list[Response] = []
+
+        async def write_with_concurrent_chunk(*args: Any) -> int:  # noqa: ANN401
+            concurrent.append(await self._patch(client, upload_id, 0, b"x" * 10))
+            return await write_chunk(*args)
+
+        mocker.patch.object(main, "write_chunk", write_with_concurrent_chunk)
+        response = await self._patch(client, upload_id, 0, self.DATA[:10])
+
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert concurrent[0].status_code == HTTPStatus.CONFLICT
+        assert concurrent[0].headers["Upload-Offset"] == "10"
+
+    async def test_failed_write_releases_claim(
+        self, client: AsyncClient, mocker: MockerFixture
+    ) -> None:
+        """Test that the offset is reset when a chunk cannot be written."""
+        upload_id = await self._create(client)
+        mocker.patch.object(main, "write_chunk", side_effect=OSError("disk full"))
+
+        with pytest.raises(OSError, match="disk full"):
+            await self._patch(client, upload_id, 0, self.DATA[:10])
+        state = await client.get(f"/uploads/{upload_id}")
+
+        assert state.json()["offset"] == 0
+
+    async def test_chunk_requires_offset_content_type(
+        self, client: AsyncClient
+    ) -> None:
+        """Test that chunks must be sent as application/offset+octet-stream."""
+        upload_id = await self._create(client)
+
+        response = await client.patch(
+            f"/uploads/{upload_id}", content=self.DATA, headers={"Upload-Offset": "0"}
+        )
+
+        assert response.status_code == HTTPStatus.UNSUPPORTED_MEDIA_TYPE
+
+    async def test_checksum_mismatch_discards_upload(
+        self, client: AsyncClient, test_settings: Settings
+    ) -> None:
+        """Test that an upload with a wrong checksum is discarded."""
+        upload_id = await self._create(client)
+        await self._patch(client, upload_id, 0, self.DATA)
+
+        response = await client.post(
+            f"/uploads/{upload_id}/complete", json={"sha256": "0" * 64}
+        )
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert (await client.get(f"/uploads/{upload_id}")).status_code == (
+            HTTPStatus.NOT_FOUND
+        )
+        assert not _staging_path(upload_id, test_settings).exists()
+
+    async def test_incomplete_upload_cannot_be_submitted(
+        self, client: AsyncClient
+    ) -> None:
+        """Test that only completed uploads can be attached to an application."""
+        upload_id = await self._create(client)
+        await self._patch(client, upload_id, 0, self.DATA[:10])
+
+        complete = await client.post(
+            f"/uploads/{upload_id}/complete",
+            json={"sha256": hashlib.sha256(self.DATA).hexdigest()},
+        )
+        submit = await client.post(
+            "/applications",
+            data={**MULTI_UPLOAD_APPLICATION, "upload_ids": [upload_id]},
+        )
+
+        assert complete.status_code == HTTPStatus.CONFLICT
+        assert submit.status_code == HTTPStatus.BAD_REQUEST
+
+    @pytest.mark.settings_override({"max_attachment_bytes": 8})
+    async def test_upload_over_file_limit_is_rejected(
+        self, client: AsyncClient
+    ) -> None:
+        """Test that an upload larger than the per-file limit cannot be started."""
+        response = await client.post(
+            "/uploads", json={"filename": "large.pdf", "length": 9}
+        )
+
+        assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+    async def test_expired_uploads_are_deleted(
+        self, client: AsyncClient, session: AsyncSession, test_settings: Settings
+    ) -> None:
+        """Test that the sweeper removes expired uploads and their staged data."""
+        upload_id = await self._create(client)
+        await self._patch(client, upload_id, 0, self.DATA)
+
+        later = get_now() + dt.timedelta(
+            hours=test_settings.resumable_upload_ttl_hours + 1
+        )
+        deleted = await delete_expired_uploads(session, test_settings, now=later)
+
+        assert deleted == 1
+        assert await session.get(ResumableUpload, upload_id) is None
+        assert not _staging_path(upload_id, test_settings).exists()
+
+
+class TestCompressedAttachments:
+    """Tests for at-rest compression of attachments."""
+
+    TEXT = b"Kostenaufstellung;Betrag\n" * 200
+
+    @staticmethod
+    async def _upload(
+        client: AsyncClient, session: AsyncSession, content: bytes, mime_type: str
+    ) -> Attachment:
+        files = {"attachments": ("file.csv", io.BytesIO(content), mime_type)}
+        response = await client.post(
+            "/applications", data=MULTI_UPLOAD_APPLICATION, files=files
+        )
+        result = await session.execute(
+            select(Attachment).where(
+                Attachment.application_id == response.json()["application_id"]
+            )
+        )
+        return result.scalar_one()
+
+    @pytest.mark.settings_override({"attachment_compression": "gzip"})
+    async def test_text_is_stored_compressed(
+        self, client: AsyncClient, session: AsyncSession, test_settings: Settings
+    ) -> None:
+        """Test that compressible files are stored gzip-compressed."""
+        attachment = await self._upload(client, session, self.TEXT, "text/csv")
+
+        path = test_settings.project_root / attachment.filepath
+        assert attachment.content_encoding == "gzip"
+        assert path.suffix == ".gz"
+        assert gzip.decompress(path.read_bytes()) == self.TEXT
+        assert attachment.compression_ratio == len(self.TEXT) / path.stat().st_size
+        assert not path.with_suffix("").exists()
+
+    @pytest.mark.settings_override({"attachment_compression": "gzip"})
+    async def test_compressed_download(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that compressed files are passed through or decompressed."""
+        attachment = await self._upload(client, session, self.TEXT, "text/csv")
+
+        passed_through = await client.get(
+            f"/attachments/{attachment.id}", headers={"Accept-Encoding": "gzip"}
+        )
+        decompressed = await client.get(
+            f"/attachments/{attachment.id}", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert passed_through.headers["content-encoding"] == "gzip"
+        assert passed_through.content == self.TEXT
+        assert "content-encoding" not in decompressed.headers
+        assert decompressed.content == self.TEXT
+        assert decompressed.headers["content-disposition"] == (
+            'attachment; filename="file.csv"'
+        )
+        assert decompressed.headers["content-type"].startswith("text/csv")
+
+    @pytest.mark.settings_override({"attachment_compression": "gzip"})
+    async def test_incompressible_files_are_stored_raw(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that files are kept uncompressed if compression does not pay off."""
+        random_text = await self._upload(
+            client, session, os.urandom(4096), "text/plain"
+        )
+        image = await self._upload(client, session, self.TEXT, "image/png")
+
+        assert (random_text.content_encoding, random_text.compression_ratio) == (
+            None,
+            None,
+        )
+        assert image.content_encoding is None
+
+    async def test_compression_is_off_by_default(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that attachments are stored uncompressed by default."""
+        attachment = await self._upload(client, session, self.TEXT, "text/csv")
+
+        assert attachment.content_encoding is None
+
+    async def test_failed_compression_leaves_no_partial_file(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        """Test that a compressed copy that could not be finished is removed."""
+        path = tmp_path / "notes.txt"
+        path.write_bytes(self.TEXT)
+        file = StoredFile("notes.txt", path, "text/plain", len(self.TEXT))
+
+        def copy_until_disk_full(
+            src: io.BufferedReader, dst: gzip.GzipFile, _: int
+        ) -> None:
+            dst.write(src.read(100))
+            raise OSError("disk full")
+
+        mocker.patch("shutil.copyfileobj", side_effect=copy_until_disk_full)
+        with pytest.raises(OSError, match="disk full"):
+            await compress_stored_file(file, "gzip")
+
+        assert not await aiofiles.os.path.exists(path.with_name("notes.txt.gz"))
+
+    async def test_zstd_round_trip(self, tmp_path: Path) -> None:
+        """Test compressing and decompressing a file with zstd."""
+        pytest.importorskip("compression.zstd")
+        path = tmp_path / "notes.txt"
+        path.write_bytes(self.TEXT)
+        file = StoredFile("notes.txt", path, "text/plain", len(self.TEXT))
+
+        compressed = await compress_stored_file(file, "zstd")
+
+        assert (compressed.encoding, compressed.path.suffix) == ("zstd", ".zst")
+        assert b"".join(iter_decompressed(compressed.path, "zstd")) == self.TEXT
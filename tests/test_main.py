@@ -12,32 +12,49 @@ Test Organization:
 
 import datetime as dt
 from http import HTTPStatus
+from typing import Any, ClassVar
 from zoneinfo import ZoneInfo
 
 import pytest
 from _pytest.outcomes import Failed
-from httpx import ASGITransport, AsyncClient
+from httpx import ASGITransport, AsyncClient, Response
+from pydantic import SecretStr
 from pytest_mock import MockerFixture
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from projectvote.backend.config import Settings
 from projectvote.backend.main import (
     app,
+    close_expired_applications,
+    create_scheduler,
+    delete_expired_idempotency_keys,
+    finalize_applications,
     format_datetime_for_email,
     get_app_settings,
     get_board_members,
     get_now,
+    parse_board_members,
+    send_pending_vote_reminders,
+    sync_board_members,
+    vote_details_cache,
 )
 from projectvote.backend.models import (
     Application,
     ApplicationStatus,
     Attachment,
+    BoardMember,
+    DeliveryStatus,
+    EmailDelivery,
+    IdempotencyKey,
+    Reminder,
+    VoteHistory,
     VoteOption,
     VoteRecord,
     VoteStatus,
 )
+from projectvote.backend.signing import create_voter_token, verify_voter_token
 
 from .conftest import EMAILS_SENT_FOR_FINAL_DECISION, TEST_BOARD_MEMBERS
 
@@ -105,8 +122,8 @@ class TestAppInitialization:
         assert response.status_code == HTTPStatus.OK
         assert response.json() == {"message": "Welcome to the Funding Application API"}
 
-    def test_get_board_members_from_config(self, mocker: MockerFixture) -> None:
-        """Test that get_board_members correctly parses the config string."""
+    def test_parse_board_members_from_config(self, mocker: MockerFixture) -> None:
+        """Test that parse_board_members correctly parses the config string."""
         # Arrange
         test_emails = "board1@test.com,board2@test.com,board3@test.com"
         expected_list = ["board1@test.com", "board2@test.com", "board3@test.com"]
@@ -122,7 +139,7 @@ class TestAppInitialization:
         )
 
         # Act
-        actual_list = get_board_members(mock_settings_instance)
+        actual_list = parse_board_members(mock_settings_instance)
 
         # Assert
         assert actual_list == expected_list
@@ -137,13 +154,64 @@ class TestAppInitialization:
         mock_settings_instance = mocker.MagicMock(spec=Settings)
         mock_settings_instance.board_members = test_emails
 
-        actual_list = get_board_members(mock_settings_instance)
+        actual_list = parse_board_members(mock_settings_instance)
 
         assert actual_list == expected_list
         # Verify no leading/trailing whitespace
         for email in actual_list:
             assert email == email.strip()
 
+    def test_parse_board_members_skips_empty_and_duplicate_entries(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test that empty entries and case-insensitive duplicates are dropped."""
+        mock_settings_instance = mocker.MagicMock(spec=Settings)
+        mock_settings_instance.board_members = "a@test.com,, b@test.com ,A@Test.com,"
+
+        assert parse_board_members(mock_settings_instance) == [
+            "a@test.com",
+            "b@test.com",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sync_board_members(self, session: AsyncSession) -> None:
+        """Test that syncing adds, deactivates and reactivates board members."""
+        await sync_board_members(session, ["a@test.com", "b@test.com"])
+        await sync_board_members(session, ["b@test.com", "c@test.com"])
+
+        result = await session.execute(select(BoardMember).order_by(BoardMember.id))
+        members = {m.email: m.is_active for m in result.scalars()}
+        assert members == {"a@test.com": False, "b@test.com": True, "c@test.com": True}
+
+        await sync_board_members(session, ["a@test.com"])
+        result = await session.execute(
+            select(BoardMember.email).where(BoardMember.is_active.is_(True))
+        )
+        assert list(result.scalars()) == ["a@test.com"]
+
+    @pytest.mark.asyncio
+    async def test_sync_board_members_ignores_case(self, session: AsyncSession) -> None:
+        """Test that duplicates and a change in case do not add members."""
+        await sync_board_members(session, ["a@test.com", "A@test.com", ""])
+        await sync_board_members(session, ["A@TEST.COM", "b@test.com"])
+
+        result = await session.execute(select(BoardMember).order_by(BoardMember.id))
+        members = {m.email: m.is_active for m in result.scalars()}
+        assert members == {"a@test.com": True, "b@test.com": True}
+
+    @pytest.mark.asyncio
+    async def test_get_board_members_from_database(
+        self, session: AsyncSession, test_settings: Settings
+    ) -> None:
+        """Test that active members in the database take precedence over config."""
+        # An empty table falls back to the configuration
+        assert await get_board_members(session, test_settings) == TEST_BOARD_MEMBERS
+
+        await sync_board_members(session, ["db.member@example.com"])
+        assert await get_board_members(session, test_settings) == [
+            "db.member@example.com"
+        ]
+
     def test_get_app_settings_development_env_file_not_exists(
         self, mocker: MockerFixture
     ) -> None:
@@ -367,11 +435,12 @@ class TestVoting:
                 HTTPStatus.NOT_FOUND,
                 "Invalid or expired token.",
             ),
+            ("Vote Already Cast", "ALREADY_CAST_TOKEN", HTTPStatus.OK, None),
             (
-                "Vote Already Cast",
-                "ALREADY_CAST_TOKEN",
+                "Voting Closed",
+                "CLOSED_TOKEN",
                 HTTPStatus.BAD_REQUEST,
-                "This vote has already been cast.",
+                "Voting for this application has closed.",
             ),
         ],
     )
@@ -414,9 +483,16 @@ class TestVoting:
         if token_to_use == invalid_token:
             final_token_to_use = token_to_use
         elif token_to_use == already_cast_token:
-            # Cast the vote first to trigger the "already cast" error
+            # A cast vote can still be viewed (and changed) while voting is open
             await client.post(f"/vote/{valid_token}", json={"decision": "approve"})
             final_token_to_use = valid_token
+        elif token_to_use == "CLOSED_TOKEN":  # noqa: S105
+            # Two rejections out of four votes conclude the application
+            result = await session.execute(
+                select(VoteRecord).where(VoteRecord.application_id == app_id)
+            )
+            for record in result.scalars().all()[:2]:
+                await client.post(f"/vote/{record.token}", json={"decision": "reject"})
 
         # --- Act: Perform the request ---
         response = await client.get(f"/vote/{final_token_to_use}")
@@ -451,11 +527,18 @@ class TestVoting:
                 "Vote cast successfully",
             ),
             (
-                "Already Cast",
+                "Changed Vote",
                 "ALREADY_CAST_TOKEN",
                 VoteOption.REJECT,
+                HTTPStatus.OK,
+                "Vote cast successfully",
+            ),
+            (
+                "Voting Closed",
+                "CLOSED_TOKEN",
+                VoteOption.APPROVE,
                 HTTPStatus.BAD_REQUEST,
-                "Vote has already been cast.",
+                "Voting for this application has closed.",
             ),
             (
                 "Invalid Token",
@@ -509,11 +592,21 @@ class TestVoting:
         if token_type == "INVALID_TOKEN":  # noqa: S105
             final_token_to_use = invalid_token
         elif token_type == already_cast_token:
-            # Cast the vote first to trigger the "already cast" error
+            # Cast a different vote first; it is changed by the request below
             await client.post(
                 f"/vote/{valid_token}", json={"decision": VoteOption.APPROVE.value}
             )
             final_token_to_use = valid_token
+        elif token_type == "CLOSED_TOKEN":  # noqa: S105
+            # Two rejections by other members conclude the application
+            result = await session.execute(
+                select(VoteRecord).where(
+                    VoteRecord.application_id == app_id,
+                    VoteRecord.voter_email != TEST_BOARD_MEMBERS[0],
+                )
+            )
+            for record in result.scalars().all()[:2]:
+                await client.post(f"/vote/{record.token}", json={"decision": "reject"})
 
         # --- Act: Perform the request ---
         response = await client.post(
@@ -539,6 +632,96 @@ class TestVoting:
         else:
             assert response.json() == {"detail": expected_message}
 
+    @pytest.mark.asyncio
+    async def test_change_vote_adjusts_tallies_and_history(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that changing a vote moves it between tallies and is audited."""
+        app_data = {
+            "first_name": "Change",
+            "last_name": "Vote",
+            "applicant_email": "change.vote@example.com",
+            "department": "Testing",
+            "project_title": "Changing votes",
+            "project_description": "A board member changes their mind.",
+            "costs": 150.00,
+        }
+        create_response = await client.post("/applications", data=app_data)
+        app_id = create_response.json()["application_id"]
+        result = await session.execute(
+            select(VoteRecord)
+            .where(VoteRecord.application_id == app_id)
+            .order_by(VoteRecord.voter_email)
+        )
+        vote_record = result.scalars().first()
+        assert vote_record is not None
+
+        for decision in ["approve", "approve", "reject"]:
+            response = await client.post(
+                f"/vote/{vote_record.token}", json={"decision": decision}
+            )
+            assert response.status_code == HTTPStatus.OK
+
+        application = await session.get(Application, app_id)
+        assert application is not None
+        await session.refresh(application)
+        assert (
+            application.approve_count,
+            application.reject_count,
+            application.abstain_count,
+        ) == (0, 1, 0)
+
+        # Repeating the current decision is not recorded again
+        history = await session.execute(
+            select(VoteHistory.previous_vote, VoteHistory.vote)
+            .where(VoteHistory.vote_id == vote_record.id)
+            .order_by(VoteHistory.id)
+        )
+        assert history.all() == [
+            (None, VoteOption.APPROVE),
+            (VoteOption.APPROVE, VoteOption.REJECT),
+        ]
+
+        details = await client.get(f"/vote/{vote_record.token}")
+        assert details.json()["current_vote"] == VoteOption.REJECT.value
+
+    @pytest.mark.asyncio
+    async def test_change_vote_can_conclude_application(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that a changed vote that creates a majority concludes voting."""
+        app_data = {
+            "first_name": "Change",
+            "last_name": "Majority",
+            "applicant_email": "change.majority@example.com",
+            "department": "Testing",
+            "project_title": "Changing to a majority",
+            "project_description": "A changed vote decides the application.",
+            "costs": 150.00,
+        }
+        create_response = await client.post("/applications", data=app_data)
+        app_id = create_response.json()["application_id"]
+        result = await session.execute(
+            select(VoteRecord)
+            .where(VoteRecord.application_id == app_id)
+            .order_by(VoteRecord.voter_email)
+        )
+        tokens = [record.token for record in result.scalars().all()]
+
+        for token, decision in zip(
+            tokens, ["approve", "approve", "reject"], strict=False
+        ):
+            await client.post(f"/vote/{token}", json={"decision": decision})
+        application = await session.get(Application, app_id)
+        assert application is not None
+        assert application.status == ApplicationStatus.PENDING
+
+        await client.post(f"/vote/{tokens[2]}", json={"decision": "approve"})
+
+        await session.refresh(application)
+        assert application.status == ApplicationStatus.APPROVED
+        assert application.concluded_at is not None
+
     @pytest.mark.asyncio
     async def test_get_vote_details_with_attachments(
         self, client: AsyncClient, session: AsyncSession
@@ -578,6 +761,115 @@ class TestVoting:
             == "project_plan.pdf"
         )
 
+    @pytest.mark.asyncio
+    async def test_get_vote_details_is_served_from_cache(
+        self, client: AsyncClient, session: AsyncSession, mocker: MockerFixture
+    ) -> None:
+        """Test that repeated opens of a voting link do not query the database."""
+        app_data = {
+            "first_name": "Cache",
+            "last_name": "Test",
+            "applicant_email": "cache.test@example.com",
+            "department": "IT",
+            "project_title": "Cached Vote Details",
+            "project_description": "Test caching of vote details",
+            "costs": "150.00",
+        }
+        response = await client.post("/applications", data=app_data)
+        app_id = response.json()["application_id"]
+        result = await session.execute(
+            select(VoteRecord).where(VoteRecord.application_id == app_id)
+        )
+        vote_record = result.scalars().first()
+        assert vote_record is not None
+        token = vote_record.token
+
+        first = await client.get(f"/vote/{token}")
+        execute_spy = mocker.spy(session, "execute")
+        second = await client.get(f"/vote/{token}")
+
+        assert first.json() == second.json()
+        execute_spy.assert_not_called()
+        assert vote_details_cache.get(token) is not None
+
+    @pytest.mark.asyncio
+    async def test_vote_details_cache_is_invalidated(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that casting a vote and concluding an application evict tokens."""
+        app_data = {
+            "first_name": "Cache",
+            "last_name": "Invalidation",
+            "applicant_email": "cache.invalidation@example.com",
+            "department": "IT",
+            "project_title": "Cache Invalidation",
+            "project_description": "Test invalidation of cached vote details",
+            "costs": "150.00",
+        }
+        response = await client.post("/applications", data=app_data)
+        app_id = response.json()["application_id"]
+        result = await session.execute(
+            select(VoteRecord)
+            .where(VoteRecord.application_id == app_id)
+            .order_by(VoteRecord.voter_email)
+        )
+        tokens = [record.token for record in result.scalars().all()]
+        for token in tokens:
+            await client.get(f"/vote/{token}")
+        assert all(vote_details_cache.get(token) for token in tokens)
+
+        # Casting a vote evicts that voter's token only
+        await client.post(f"/vote/{tokens[0]}", json={"decision": "reject"})
+        assert vote_details_cache.get(tokens[0]) is None
+        assert vote_details_cache.get(tokens[3]) is not None
+
+        # Concluding the application evicts every token of the application
+        await client.post(f"/vote/{tokens[1]}", json={"decision": "reject"})
+        assert all(vote_details_cache.get(token) is None for token in tokens)
+
+    @pytest.mark.asyncio
+    async def test_vote_details_read_during_invalidation_are_not_cached(
+        self, client: AsyncClient, session: AsyncSession, mocker: MockerFixture
+    ) -> None:
+        """Test that details read while a vote is cast do not overwrite it."""
+        app_data = {
+            "first_name": "Cache",
+            "last_name": "Race",
+            "applicant_email": "cache.race@example.com",
+            "department": "IT",
+            "project_title": "Cache Race",
+            "project_description": "Test a vote cast during a cached read",
+            "costs": "150.00",
+        }
+        response = await client.post("/applications", data=app_data)
+        app_id = response.json()["application_id"]
+        result = await session.execute(
+            select(VoteRecord.token).where(VoteRecord.application_id == app_id)
+        )
+        token = result.scalars().first()
+        assert token is not None
+        execute = session.execute
+
+        async def execute_during_vote(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            vote_details_cache.invalidate(token)  # As cast_vote does concurrently
+            return await execute(*args, **kwargs)
+
+        mocker.patch.object(session, "execute", execute_during_vote)
+        details = await client.get(f"/vote/{token}")
+
+        assert details.status_code == HTTPStatus.OK
+        assert vote_details_cache.get(token) is None
+
+    @pytest.mark.asyncio
+    async def test_vote_details_schema_is_documented(self, client: AsyncClient) -> None:
+        """Test that the voting page keeps its response schema in OpenAPI."""
+        openapi = (await client.get("/openapi.json")).json()
+
+        response = openapi["paths"]["/vote/{token}"]["get"]["responses"]["200"]
+        assert response["content"]["application/json"]["schema"] == {
+            "$ref": "#/components/schemas/VoteDetailsOut"
+        }
+
     @pytest.mark.asyncio
     async def test_vote_options_in_get_vote_details(
         self, client: AsyncClient, session: AsyncSession
@@ -612,6 +904,146 @@ class TestVoting:
         assert VoteOption.REJECT.value in response_data["vote_options"]
 
 
+# --- Test Voter Dashboard ---
+
+
+class TestVoterDashboard:
+    """Tests for the per-member dashboard and batch voting."""
+
+    @staticmethod
+    async def _submit(client: AsyncClient, count: int) -> list[int]:
+        """Submit ``count`` applications and return their ids."""
+        app_ids = []
+        for i in range(count):
+            response = await client.post(
+                "/applications",
+                data={
+                    "first_name": "Dashboard",
+                    "last_name": f"Test {i}",
+                    "applicant_email": f"dashboard.{i}@example.com",
+                    "department": "Testing",
+                    "project_title": f"Dashboard project {i}",
+                    "project_description": "Shown on the voter dashboard.",
+                    "costs": 100.00 + i,
+                },
+            )
+            app_ids.append(response.json()["application_id"])
+        return app_ids
+
+    @staticmethod
+    async def _tokens(session: AsyncSession, voter_email: str) -> dict[int, str]:
+        """Return the voting tokens of a member keyed by application id."""
+        result = await session.execute(
+            select(VoteRecord.application_id, VoteRecord.token).where(
+                VoteRecord.voter_email == voter_email
+            )
+        )
+        return {row.application_id: row.token for row in result}
+
+    @pytest.mark.asyncio
+    async def test_open_votes_with_voting_token(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that any voting token lists all open votes of its member."""
+        app_ids = await self._submit(client, 3)
+        tokens = await self._tokens(session, TEST_BOARD_MEMBERS[0])
+        # Conclude the first application; it must no longer be listed
+        result = await session.execute(
+            select(VoteRecord.token).where(VoteRecord.application_id == app_ids[0])
+        )
+        for token in result.scalars().all()[:2]:
+            await client.post(f"/vote/{token}", json={"decision": "reject"})
+
+        response = await client.get(f"/voters/{tokens[app_ids[2]]}/votes")
+
+        assert response.status_code == HTTPStatus.OK
+        dashboard = response.json()
+        assert dashboard["voter_email"] == TEST_BOARD_MEMBERS[0]
+        assert [v["application_id"] for v in dashboard["votes"]] == app_ids[1:]
+        assert all(
+            v["token"] == tokens[v["application_id"]] for v in dashboard["votes"]
+        )
+
+    @pytest.mark.settings_override({"secret_key": "test-secret"})
+    @pytest.mark.asyncio
+    async def test_open_votes_with_magic_link(self, client: AsyncClient) -> None:
+        """Test that a signed magic link authenticates the member."""
+        await self._submit(client, 2)
+        magic_token = create_voter_token(
+            TEST_BOARD_MEMBERS[1], "test-secret", get_now() + dt.timedelta(hours=1)
+        )
+
+        response = await client.get(f"/voters/{magic_token}/votes")
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["voter_email"] == TEST_BOARD_MEMBERS[1]
+        assert len(response.json()["votes"]) == 2  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_open_votes_with_invalid_credential(
+        self, client: AsyncClient
+    ) -> None:
+        """Test that unknown credentials are rejected."""
+        response = await client.get("/voters/unknown-token/votes")
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_batch_cast_votes(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test casting votes on several applications in one request."""
+        app_ids = await self._submit(client, 3)
+        tokens = await self._tokens(session, TEST_BOARD_MEMBERS[0])
+
+        response = await client.post(
+            f"/voters/{tokens[app_ids[0]]}/votes",
+            json={
+                "votes": [
+                    {"token": tokens[app_ids[0]], "decision": "approve"},
+                    {"token": tokens[app_ids[1]], "decision": "reject"},
+                ]
+            },
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["votes_cast"] == 2  # noqa: PLR2004
+        result = await session.execute(
+            select(VoteRecord.application_id, VoteRecord.vote)
+            .where(VoteRecord.voter_email == TEST_BOARD_MEMBERS[0])
+            .execution_options(populate_existing=True)
+        )
+        assert {row.application_id: row.vote for row in result} == {
+            app_ids[0]: VoteOption.APPROVE,
+            app_ids[1]: VoteOption.REJECT,
+            app_ids[2]: None,
+        }
+
+    @pytest.mark.asyncio
+    async def test_batch_cast_rejects_foreign_tokens(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that a batch containing another member's token changes nothing."""
+        app_ids = await self._submit(client, 1)
+        own_token = (await self._tokens(session, TEST_BOARD_MEMBERS[0]))[app_ids[0]]
+        foreign_token = (await self._tokens(session, TEST_BOARD_MEMBERS[1]))[app_ids[0]]
+
+        response = await client.post(
+            f"/voters/{own_token}/votes",
+            json={
+                "votes": [
+                    {"token": own_token, "decision": "approve"},
+                    {"token": foreign_token, "decision": "approve"},
+                ]
+            },
+        )
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        application = await session.get(Application, app_ids[0])
+        assert application is not None
+        await session.refresh(application)
+        assert application.approve_count == 0
+
+
 # --- Test Voting Scenarios ---
 
 
@@ -960,6 +1392,132 @@ class TestVotingScenarios:
         else:
             assert updated_app.concluded_at is not None
 
+    @pytest.mark.asyncio
+    async def test_quorum_uses_electorate_snapshot(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that a board change after submission does not alter the quorum."""
+        app_data = {
+            "first_name": "Snapshot",
+            "last_name": "Test",
+            "applicant_email": "snapshot.test@example.com",
+            "department": "Scenarios",
+            "project_title": "Electorate snapshot",
+            "project_description": "The board shrinks while voting is open.",
+            "costs": 500.00,
+        }
+        create_response = await client.post("/applications", data=app_data)
+        app_id = create_response.json()["application_id"]
+
+        application = await session.get(Application, app_id)
+        assert application is not None
+        assert application.electorate_size == len(TEST_BOARD_MEMBERS)
+
+        # The board shrinks to two members; two approvals would be a majority of
+        # the new board but not of the four members entitled to this vote.
+        app.dependency_overrides[get_board_members] = lambda: TEST_BOARD_MEMBERS[:2]
+        result = await session.execute(
+            select(VoteRecord)
+            .where(VoteRecord.application_id == app_id)
+            .order_by(VoteRecord.voter_email)
+        )
+        for vote_record in result.scalars().all()[:2]:
+            await client.post(
+                f"/vote/{vote_record.token}",
+                json={"decision": VoteOption.APPROVE.value},
+            )
+
+        await session.refresh(application)
+        assert application.status == ApplicationStatus.PENDING
+
+
+# --- Test Finalization ---
+
+
+class TestFinalization:
+    """Tests for finalizing many applications at once."""
+
+    @staticmethod
+    async def _add_application(
+        session: AsyncSession,
+        tallies: tuple[int, int, int],
+        status: ApplicationStatus = ApplicationStatus.PENDING,
+    ) -> Application:
+        """Add an application with four voters and the given tallies."""
+        approvals, rejects, abstains = tallies
+        application = Application(
+            first_name="Batch",
+            last_name="Finalization",
+            applicant_email="batch.finalization@example.com",
+            department="Testing",
+            project_title="Batch finalization",
+            project_description="Finalized together with others.",
+            costs=100.00,
+            status=status,
+            electorate_size=len(TEST_BOARD_MEMBERS),
+            approve_count=approvals,
+            reject_count=rejects,
+            abstain_count=abstains,
+        )
+        application.votes = [
+            VoteRecord(voter_email=email) for email in TEST_BOARD_MEMBERS
+        ]
+        session.add(application)
+        await session.commit()
+        return application
+
+    @pytest.mark.asyncio
+    async def test_finalize_applications(
+        self, session: AsyncSession, test_settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """Test that only definitive, pending applications are concluded."""
+        send_emails_mock = mocker.patch(
+            "projectvote.backend.main.send_final_decision_emails",
+            new_callable=mocker.AsyncMock,
+        )
+        approved = await self._add_application(session, (3, 0, 0))
+        rejected = await self._add_application(session, (0, 2, 0))
+        pending = await self._add_application(session, (1, 1, 0))
+        concluded = await self._add_application(
+            session, (3, 0, 0), status=ApplicationStatus.REJECTED
+        )
+
+        concluded_ids = await finalize_applications(
+            [approved.id, rejected.id, pending.id, concluded.id],
+            session,
+            test_settings,
+        )
+
+        assert concluded_ids == [approved.id, rejected.id]
+        for application in (approved, rejected, pending, concluded):
+            await session.refresh(application)
+        assert approved.status == ApplicationStatus.APPROVED
+        assert rejected.status == ApplicationStatus.REJECTED
+        assert pending.status == ApplicationStatus.PENDING
+        assert concluded.status == ApplicationStatus.REJECTED
+        assert approved.concluded_at is not None
+        assert pending.concluded_at is None
+
+        assert send_emails_mock.await_count == 2  # noqa: PLR2004
+        board_recipients = send_emails_mock.await_args_list[0].args[1]
+        assert sorted(board_recipients) == sorted(TEST_BOARD_MEMBERS)
+
+    @pytest.mark.asyncio
+    async def test_finalize_applications_without_decisions(
+        self, session: AsyncSession, test_settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """Test that nothing is sent when no application can be concluded."""
+        send_emails_mock = mocker.patch(
+            "projectvote.backend.main.send_final_decision_emails",
+            new_callable=mocker.AsyncMock,
+        )
+        pending = await self._add_application(session, (1, 0, 0))
+
+        assert await finalize_applications([], session, test_settings) == []
+        assert await finalize_applications([pending.id], session, test_settings) == []
+        assert await finalize_applications([12345], session, test_settings) == []
+        send_emails_mock.assert_not_called()
+
 
 # --- Test Attachments ---
 
@@ -1180,8 +1738,19 @@ class TestAttachments:
     ) -> None:
         """Test the public attachment endpoint when file is missing from disk."""
         # Create a mock attachment record without a corresponding file
+        application = Application(
+            first_name="Missing",
+            last_name="File",
+            applicant_email="missing.file@example.com",
+            department="Testing",
+            project_title="Missing file",
+            project_description="The attachment was deleted from disk.",
+            costs=10.00,
+        )
+        session.add(application)
+        await session.flush()
         attachment = Attachment(
-            application_id=1,
+            application_id=application.id,
             filename="missing_file.txt",
             filepath="data/uploads/missing_file_id.txt",
             mime_type="text/plain",
@@ -1391,13 +1960,14 @@ class TestEmailFunctionality:
         assert applicant_template_body["status"] == expected_german_status
         assert "frontend_url" in applicant_template_body
 
-        # Check board member emails
+        # Check the board member email, rendered once for the whole board
         board_member_email_calls = [
             call
             for call in send_email_mock.call_args_list
             if call.kwargs["recipients"] != [app_data["applicant_email"]]
         ]
-        assert len(board_member_email_calls) == len(TEST_BOARD_MEMBERS)
+        assert len(board_member_email_calls) == 1
+        assert board_member_email_calls[0].kwargs["recipients"] == TEST_BOARD_MEMBERS
         for call in board_member_email_calls:
             assert (
                 call.kwargs["subject"]
@@ -1576,7 +2146,9 @@ class TestEmailFunctionality:
             for call in send_email_mock.call_args_list
             if call.kwargs["recipients"] != [app_data["applicant_email"]]
         ]
-        assert len(board_member_emails_sent) == len(TEST_BOARD_MEMBERS)
+        assert [call.kwargs["recipients"] for call in board_member_emails_sent] == [
+            TEST_BOARD_MEMBERS
+        ]
 
     def test_format_datetime_for_email_with_none(self) -> None:
         """Test that format_datetime_for_email returns 'N/A' when timestamp is None."""
@@ -1627,3 +2199,541 @@ class TestEmailFunctionality:
         assert now.tzinfo is not None
         # Use str comparison to handle various UTC representations
         assert str(now.tzinfo) in ("UTC", "UTC+00:00", "ZoneInfo(key='UTC')")
+
+
+class TestReminders:
+    """Tests for reminder emails about pending votes."""
+
+    NOW = dt.datetime(2026, 10, 19, 12, 0, tzinfo=dt.UTC)
+
+    @staticmethod
+    async def _add_application(
+        session: AsyncSession, title: str, age: dt.timedelta, cast_by: int = 0
+    ) -> Application:
+        """Add a pending application where the first ``cast_by`` members voted."""
+        application = Application(
+            first_name="Reminder",
+            last_name="Test",
+            applicant_email="reminder.test@example.com",
+            department="Testing",
+            project_title=title,
+            project_description="Still waiting for votes.",
+            costs=100.00,
+            created_at=TestReminders.NOW - age,
+            electorate_size=len(TEST_BOARD_MEMBERS),
+        )
+        application.votes = [
+            VoteRecord(
+                voter_email=email,
+                vote=VoteOption.ABSTAIN if i < cast_by else None,
+                vote_status=VoteStatus.CAST if i < cast_by else VoteStatus.PENDING,
+            )
+            for i, email in enumerate(TEST_BOARD_MEMBERS)
+        ]
+        session.add(application)
+        await session.commit()
+        return application
+
+    @pytest.mark.asyncio
+    async def test_one_digest_per_member(
+        self, session: AsyncSession, test_settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """Test that each member gets one email listing all overdue votes."""
+        send_email_mock = mocker.patch(
+            "projectvote.backend.main.send_email", new_callable=mocker.AsyncMock
+        )
+        settings = test_settings.model_copy(update={"reminder_after_days": 3})
+        await self._add_application(session, "Old", dt.timedelta(days=5), cast_by=1)
+        await self._add_application(session, "Older", dt.timedelta(days=7))
+        await self._add_application(session, "New", dt.timedelta(days=1))
+
+        sent = await send_pending_vote_reminders(session, settings, now=self.NOW)
+
+        assert sent == len(TEST_BOARD_MEMBERS)
+        votes_by_recipient = {
+            call.kwargs["recipients"][0]: [
+                vote["project_title"] for vote in call.kwargs["template_body"]["votes"]
+            ]
+            for call in send_email_mock.call_args_list
+        }
+        assert votes_by_recipient == {
+            TEST_BOARD_MEMBERS[0]: ["Older"],
+            TEST_BOARD_MEMBERS[1]: ["Older", "Old"],
+            TEST_BOARD_MEMBERS[2]: ["Older", "Old"],
+            TEST_BOARD_MEMBERS[3]: ["Older", "Old"],
+        }
+        reminders = (await session.execute(select(Reminder))).scalars().all()
+        assert {r.voter_email: r.pending_votes for r in reminders} == {
+            email: len(titles) for email, titles in votes_by_recipient.items()
+        }
+
+    @pytest.mark.asyncio
+    async def test_digest_links_to_dashboard(
+        self, session: AsyncSession, test_settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """Test that digests carry a magic link valid until the next reminder."""
+        send_email_mock = mocker.patch(
+            "projectvote.backend.main.send_email", new_callable=mocker.AsyncMock
+        )
+        settings = test_settings.model_copy(
+            update={"reminder_after_days": 3, "secret_key": SecretStr("test-secret")}
+        )
+        await self._add_application(session, "Old", dt.timedelta(days=5))
+
+        await send_pending_vote_reminders(session, settings, now=self.NOW)
+
+        for call in send_email_mock.call_args_list:
+            url = call.kwargs["template_body"]["dashboard_url"]
+            prefix = f"{settings.frontend_url}/api/voters/"
+            assert url.startswith(prefix)
+            assert url.endswith("/votes")
+            credential = url.removeprefix(prefix).removesuffix("/votes")
+            recipient = call.kwargs["recipients"][0]
+            next_reminder = self.NOW + dt.timedelta(days=3)
+            assert verify_voter_token(credential, "test-secret", self.NOW) == recipient
+            assert verify_voter_token(credential, "test-secret", next_reminder) is None
+
+    @pytest.mark.asyncio
+    async def test_digest_without_secret_key_has_no_dashboard_link(
+        self, session: AsyncSession, test_settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """Test that magic links are only issued with a signing secret."""
+        send_email_mock = mocker.patch(
+            "projectvote.backend.main.send_email", new_callable=mocker.AsyncMock
+        )
+        settings = test_settings.model_copy(update={"reminder_after_days": 3})
+        await self._add_application(session, "Old", dt.timedelta(days=5))
+
+        await send_pending_vote_reminders(session, settings, now=self.NOW)
+
+        assert send_email_mock.call_args_list
+        for call in send_email_mock.call_args_list:
+            assert call.kwargs["template_body"]["dashboard_url"] is None
+
+    @pytest.mark.asyncio
+    async def test_recently_reminded_members_are_skipped(
+        self, session: AsyncSession, test_settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """Test that a member is reminded at most once per reminder period."""
+        send_email_mock = mocker.patch(
+            "projectvote.backend.main.send_email", new_callable=mocker.AsyncMock
+        )
+        settings = test_settings.model_copy(update={"reminder_after_days": 3})
+        await self._add_application(session, "Old", dt.timedelta(days=5))
+
+        members = len(TEST_BOARD_MEMBERS)
+        first = await send_pending_vote_reminders(session, settings, now=self.NOW)
+        later = self.NOW + dt.timedelta(days=1)
+        second = await send_pending_vote_reminders(session, settings, now=later)
+        much_later = self.NOW + dt.timedelta(days=4)
+        third = await send_pending_vote_reminders(session, settings, now=much_later)
+
+        assert (first, second, third) == (members, 0, members)
+        assert send_email_mock.call_count == 2 * len(TEST_BOARD_MEMBERS)
+
+    def test_scheduler_job_is_opt_in(self, test_settings: Settings) -> None:
+        """Test that the reminder job is only scheduled when enabled."""
+        job_names = [job.name for job in create_scheduler(test_settings).jobs]
+        assert "pending-vote-reminders" not in job_names
+        settings = test_settings.model_copy(update={"reminder_after_days": 3})
+        jobs = {job.name: job for job in create_scheduler(settings).jobs}
+        job = jobs["pending-vote-reminders"]
+        assert job.interval == settings.scheduler_interval_seconds
+
+    def test_disabled_scheduler_has_no_jobs(self, test_settings: Settings) -> None:
+        """Test that instances without the scheduler run no background jobs."""
+        settings = test_settings.model_copy(
+            update={"scheduler_enabled": False, "reminder_after_days": 3}
+        )
+        assert create_scheduler(settings).jobs == []
+
+
+class TestVotingDeadline:
+    """Tests for voting deadlines and the deadline sweeper."""
+
+    @staticmethod
+    async def _add_application(
+        session: AsyncSession,
+        tallies: tuple[int, int, int],
+        voting_deadline: dt.datetime | None,
+    ) -> Application:
+        """Add a pending application with four voters and the given tallies."""
+        approvals, rejects, abstains = tallies
+        application = Application(
+            first_name="Deadline",
+            last_name="Test",
+            applicant_email="deadline.test@example.com",
+            department="Testing",
+            project_title="Deadline",
+            project_description="Voting closes at a fixed time.",
+            costs=100.00,
+            electorate_size=len(TEST_BOARD_MEMBERS),
+            approve_count=approvals,
+            reject_count=rejects,
+            abstain_count=abstains,
+            voting_deadline=voting_deadline,
+        )
+        application.votes = [
+            VoteRecord(voter_email=email) for email in TEST_BOARD_MEMBERS
+        ]
+        session.add(application)
+        await session.commit()
+        return application
+
+    @pytest.mark.settings_override({"voting_period_days": 7})
+    @pytest.mark.asyncio
+    async def test_submission_sets_deadline(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that new applications get a deadline from the voting period."""
+        before = get_now()
+        response = await client.post(
+            "/applications",
+            data={
+                "first_name": "Deadline",
+                "last_name": "Test",
+                "applicant_email": "deadline.test@example.com",
+                "department": "Testing",
+                "project_title": "Deadline",
+                "project_description": "Voting closes after a week.",
+                "costs": 100.00,
+            },
+        )
+
+        application = await session.get(Application, response.json()["application_id"])
+        assert application is not None
+        assert application.voting_deadline is not None
+        deadline = application.voting_deadline
+        assert deadline - before >= dt.timedelta(days=7)
+        assert deadline - get_now() <= dt.timedelta(days=7)
+
+    @pytest.mark.asyncio
+    async def test_sweeper_concludes_expired_applications(
+        self, session: AsyncSession, test_settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """Test that expired applications are concluded in batches, tie rejects."""
+        send_emails_mock = mocker.patch(
+            "projectvote.backend.main.send_final_decision_emails",
+            new_callable=mocker.AsyncMock,
+        )
+        settings = test_settings.model_copy(update={"deadline_sweep_batch_size": 1})
+        past = get_now() - dt.timedelta(hours=1)
+        tie = await self._add_application(session, (1, 1, 0), past)
+        majority = await self._add_application(session, (2, 0, 1), past)
+        silent = await self._add_application(session, (0, 0, 0), past)
+        running = await self._add_application(
+            session, (1, 1, 0), get_now() + dt.timedelta(days=1)
+        )
+        unlimited = await self._add_application(session, (1, 1, 0), None)
+
+        concluded_ids = await close_expired_applications(session, settings)
+
+        assert sorted(concluded_ids) == [tie.id, majority.id, silent.id]
+        for application in (tie, majority, silent, running, unlimited):
+            await session.refresh(application)
+        assert majority.status == ApplicationStatus.APPROVED
+        assert tie.status == ApplicationStatus.REJECTED
+        assert silent.status == ApplicationStatus.REJECTED
+        assert running.status == ApplicationStatus.PENDING
+        assert unlimited.status == ApplicationStatus.PENDING
+        assert send_emails_mock.call_count == len(concluded_ids)
+
+    @pytest.mark.asyncio
+    async def test_sweeper_concludes_at_given_time(
+        self, session: AsyncSession, test_settings: Settings, mocker: MockerFixture
+    ) -> None:
+        """Test that the sweep time decides the outcome and the conclusion time."""
+        mocker.patch(
+            "projectvote.backend.main.send_final_decision_emails",
+            new_callable=mocker.AsyncMock,
+        )
+        now = get_now() + dt.timedelta(days=2)
+        application = await self._add_application(
+            session, (1, 1, 0), get_now() + dt.timedelta(days=1)
+        )
+
+        concluded_ids = await close_expired_applications(session, test_settings, now)
+
+        assert concluded_ids == [application.id]
+        await session.refresh(application)
+        assert application.status == ApplicationStatus.REJECTED
+        assert application.concluded_at == now
+
+    @pytest.mark.asyncio
+    async def test_voting_closes_at_deadline(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that votes can no longer be viewed or cast after the deadline."""
+        application = await self._add_application(
+            session, (0, 0, 0), get_now() - dt.timedelta(minutes=1)
+        )
+        token = application.votes[0].token
+
+        details = await client.get(f"/vote/{token}")
+        cast = await client.post(f"/vote/{token}", json={"decision": "approve"})
+        dashboard = await client.get(f"/voters/{token}/votes")
+
+        assert details.status_code == HTTPStatus.BAD_REQUEST
+        assert cast.status_code == HTTPStatus.BAD_REQUEST
+        assert cast.json()["detail"] == "Voting for this application has closed."
+        assert dashboard.json()["votes"] == []
+        await session.refresh(application)
+        assert application.approve_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cached_details_are_not_served_after_deadline(
+        self, client: AsyncClient, session: AsyncSession, mocker: MockerFixture
+    ) -> None:
+        """Test that voting closes even while the vote details are cached."""
+        deadline = get_now() + dt.timedelta(minutes=1)
+        application = await self._add_application(session, (0, 0, 0), deadline)
+        token = application.votes[0].token
+        assert (await client.get(f"/vote/{token}")).status_code == HTTPStatus.OK
+
+        mocker.patch(
+            "projectvote.backend.main.get_now",
+            return_value=deadline + dt.timedelta(seconds=1),
+        )
+        details = await client.get(f"/vote/{token}")
+
+        assert details.status_code == HTTPStatus.BAD_REQUEST
+
+
+ADMIN_HEADERS = {"X-Admin-Token": "admin-secret"}
+
+
+class TestAdminEmails:
+    """Tests for the admin API of the email delivery log."""
+
+    @staticmethod
+    async def _log(session: AsyncSession) -> list[EmailDelivery]:
+        """Add sent, failed and dead deliveries of two templates."""
+        deliveries = [
+            EmailDelivery(
+                recipient=f"member{i}@example.com",
+                subject="Subject",
+                template_name=template_name,
+                template_body={"votes": [], "costs": 100.0},
+                status=status,
+                attempts=1 if status == DeliveryStatus.SENT else 3,
+                last_error=None if status == DeliveryStatus.SENT else "refused",
+                latency_ms=latency_ms,
+            )
+            for i, (template_name, status, latency_ms) in enumerate(
+                [
+                    ("new_application.html", DeliveryStatus.SENT, 10.0),
+                    ("new_application.html", DeliveryStatus.SENT, 20.0),
+                    ("new_application.html", DeliveryStatus.FAILED, 30.0),
+                    ("pending_votes_reminder.html", DeliveryStatus.DEAD, 40.0),
+                ]
+            )
+        ]
+        session.add_all(deliveries)
+        await session.commit()
+        return deliveries
+
+    @pytest.mark.asyncio
+    async def test_admin_api_requires_token(self, client: AsyncClient) -> None:
+        """Test that the admin API is disabled without a configured token."""
+        response = await client.get("/admin/emails", headers=ADMIN_HEADERS)
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    @pytest.mark.settings_override({"admin_token": "admin-secret"})
+    @pytest.mark.asyncio
+    async def test_admin_api_rejects_wrong_token(self, client: AsyncClient) -> None:
+        """Test that a wrong or missing admin token is rejected."""
+        wrong = await client.get("/admin/emails", headers={"X-Admin-Token": "guess"})
+        missing = await client.get("/admin/emails")
+
+        assert wrong.status_code == HTTPStatus.UNAUTHORIZED
+        assert missing.status_code == HTTPStatus.UNAUTHORIZED
+
+    @pytest.mark.settings_override({"admin_token": "admin-secret"})
+    @pytest.mark.asyncio
+    async def test_list_failed_emails(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that failed and dead-lettered messages are listed by default."""
+        deliveries = await self._log(session)
+
+        response = await client.get("/admin/emails", headers=ADMIN_HEADERS)
+        sent = await client.get(
+            "/admin/emails", params={"status": "sent"}, headers=ADMIN_HEADERS
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert [d["id"] for d in response.json()] == [
+            deliveries[3].id,
+            deliveries[2].id,
+        ]
+        assert response.json()[0]["status"] == "dead"
+        assert response.json()[0]["last_error"] == "refused"
+        assert {d["id"] for d in sent.json()} == {deliveries[0].id, deliveries[1].id}
+
+    @pytest.mark.settings_override({"admin_token": "admin-secret"})
+    @pytest.mark.asyncio
+    async def test_resend_emails(
+        self, client: AsyncClient, session: AsyncSession, mocker: MockerFixture
+    ) -> None:
+        """Test that failed messages are re-sent, dead ones only on request."""
+        deliver = mocker.patch("projectvote.backend.email_service.deliver_messages")
+        deliveries = await self._log(session)
+
+        failed_only = await client.post(
+            "/admin/emails/resend", json={}, headers=ADMIN_HEADERS
+        )
+        with_dead = await client.post(
+            "/admin/emails/resend", json={"include_dead": True}, headers=ADMIN_HEADERS
+        )
+
+        assert failed_only.json() == {"sent": 1, "failed": 0, "dead": 0}
+        assert with_dead.json() == {"sent": 1, "failed": 0, "dead": 0}
+        assert deliver.await_count == 2  # noqa: PLR2004
+        await session.refresh(deliveries[3])
+        assert deliveries[3].status == DeliveryStatus.SENT
+
+    @pytest.mark.settings_override({"admin_token": "admin-secret"})
+    @pytest.mark.asyncio
+    async def test_delivery_stats_per_template(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that counts, failure rate and latency are aggregated per template."""
+        await self._log(session)
+
+        response = await client.get("/admin/emails/stats", headers=ADMIN_HEADERS)
+
+        assert response.json() == [
+            {
+                "template_name": "new_application.html",
+                "total": 3,
+                "sent": 2,
+                "failed": 1,
+                "dead": 0,
+                "failure_rate": pytest.approx(1 / 3),
+                "avg_latency_ms": 20.0,
+            },
+            {
+                "template_name": "pending_votes_reminder.html",
+                "total": 1,
+                "sent": 0,
+                "failed": 0,
+                "dead": 1,
+                "failure_rate": 1.0,
+                "avg_latency_ms": 40.0,
+            },
+        ]
+
+
+class TestIdempotentSubmission:
+    """Tests for submissions with an Idempotency-Key header."""
+
+    APPLICATION: ClassVar[dict[str, str | float]] = {
+        "first_name": "Idempotent",
+        "last_name": "Applicant",
+        "applicant_email": "idempotent@example.com",
+        "department": "Testing",
+        "project_title": "Submitted twice",
+        "project_description": "The submit button was clicked twice.",
+        "costs": 100.00,
+    }
+
+    async def _submit(self, client: AsyncClient, key: str | None) -> Response:
+        headers = {"Idempotency-Key": key} if key is not None else {}
+        return await client.post(
+            "/applications", data=self.APPLICATION, headers=headers
+        )
+
+    @staticmethod
+    async def _application_count(session: AsyncSession) -> int:
+        result = await session.execute(select(func.count()).select_from(Application))
+        return result.scalar_one()
+
+    @pytest.mark.asyncio
+    async def test_retry_returns_original_application(
+        self, client: AsyncClient, session: AsyncSession, mocker: MockerFixture
+    ) -> None:
+        """Test that a retried submission neither stores nor emails anything."""
+        send_email_mock = mocker.patch(
+            "projectvote.backend.main.send_email", new_callable=mocker.AsyncMock
+        )
+
+        first = await self._submit(client, "key-1")
+        emails_sent = send_email_mock.call_count
+        retry = await self._submit(client, "key-1")
+
+        assert retry.status_code == HTTPStatus.OK
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+        assert send_email_mock.call_count == emails_sent
+        assert await self._application_count(session) == 1
+
+    @pytest.mark.asyncio
+    async def test_different_or_missing_keys_create_applications(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that only requests with the same key are deduplicated."""
+        ids = {
+            (await self._submit(client, key)).json()["application_id"]
+            for key in ("key-1", "key-2", None, None)
+        }
+
+        assert len(ids) == 4  # noqa: PLR2004
+        assert await self._application_count(session) == 4  # noqa: PLR2004
+
+    @pytest.mark.asyncio
+    async def test_expired_key_is_reused(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that a key older than the TTL starts a new submission."""
+        first = await self._submit(client, "key-1")
+        key = (await session.execute(select(IdempotencyKey))).scalar_one()
+        key.created_at = get_now() - dt.timedelta(days=2)
+        await session.commit()
+
+        second = await self._submit(client, "key-1")
+
+        assert second.json()["application_id"] != first.json()["application_id"]
+        keys = (await session.execute(select(IdempotencyKey))).scalars().all()
+        assert [k.application_id for k in keys] == [second.json()["application_id"]]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_returns_winner(
+        self, client: AsyncClient, session: AsyncSession, mocker: MockerFixture
+    ) -> None:
+        """Test that losing the race for a key returns the winning application."""
+        first = await self._submit(client, "key-1")
+        application_id = first.json()["application_id"]
+        # Simulate a request that checked for the key before the first committed
+        mocker.patch(
+            "projectvote.backend.main._find_submission",
+            side_effect=[None, application_id],
+        )
+
+        second = await self._submit(client, "key-1")
+
+        assert second.json()["application_id"] == application_id
+        assert second.headers["Idempotent-Replayed"] == "true"
+        assert await self._application_count(session) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_expired_idempotency_keys(
+        self, client: AsyncClient, session: AsyncSession, test_settings: Settings
+    ) -> None:
+        """Test that the sweep only deletes keys older than the TTL."""
+        await self._submit(client, "old")
+        await self._submit(client, "new")
+        old = (
+            await session.execute(
+                select(IdempotencyKey).where(IdempotencyKey.key == "old")
+            )
+        ).scalar_one()
+        old.created_at = get_now() - dt.timedelta(days=2)
+        await session.commit()
+
+        deleted = await delete_expired_idempotency_keys(session, test_settings)
+
+        assert deleted == 1
+        keys = (await session.execute(select(IdempotencyKey.key))).scalars().all()
+        assert keys == ["new"]
@@ -0,0 +1,173 @@
+"""Tests for attachment previews and the preview worker."""
+
+import io
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from projectvote.backend import main
+from projectvote.backend.config import Settings
+from projectvote.backend.models import Attachment
+from projectvote.backend.previews import (
+    PREVIEW_CACHE_MAX_AGE,
+    PreviewWorker,
+    preview_path,
+    render_preview,
+)
+
+APPLICATION = {
+    "first_name": "Preview",
+    "last_name": "User",
+    "applicant_email": "preview.user@example.com",
+    "department": "IT",
+    "project_title": "Preview Test",
+    "project_description": "Testing attachment previews.",
+    "costs": 90.0,
+}
+
+
+def copy_render(source: Path, target: Path, mime_type: str, max_size: int) -> bool:
+    """Stand-in renderer that copies the source; runs in a worker process."""
+    target.write_bytes(source.read_bytes() + f"{mime_type}:{max_size}".encode())
+    return True
+
+
+def test_preview_path() -> None:
+    """Test that previews are stored next to their attachment."""
+    path = Path("data/uploads/abc.pdf")
+
+    assert preview_path(path) == Path("data/uploads/abc.pdf.preview.jpg")
+
+
+def test_render_preview_skips_unsupported_types(tmp_path: Path) -> None:
+    """Test that no preview is rendered for unsupported file types."""
+    source = tmp_path / "notes.txt"
+    source.write_text("notes")
+
+    assert not render_preview(source, preview_path(source), "text/plain", 64)
+    assert not preview_path(source).exists()
+
+
+def test_render_preview_of_image(tmp_path: Path) -> None:
+    """Test that an image preview is a JPEG no larger than the maximum size."""
+    image_module = pytest.importorskip("PIL.Image")
+    source = tmp_path / "photo.png"
+    image_module.new("RGBA", (400, 200), "red").save(source)
+
+    assert render_preview(source, preview_path(source), "image/png", 64)
+
+    with image_module.open(preview_path(source)) as preview:
+        assert (preview.format, preview.size) == ("JPEG", (64, 32))
+
+
+async def test_worker_renders_in_process_pool(tmp_path: Path) -> None:
+    """Test that queued previews are rendered by the worker processes."""
+    worker = PreviewWorker(render=copy_render)
+    worker.start(processes=2, max_size=64, queue_size=10)
+    sources = [tmp_path / f"image{i}.png" for i in range(3)]
+    for source in sources:
+        source.write_bytes(source.name.encode())
+
+    try:
+        assert all(worker.enqueue(source, "image/png") for source in sources)
+        assert not worker.enqueue(tmp_path / "notes.txt", "text/plain")
+        await worker.join()
+    finally:
+        await worker.stop()
+
+    assert [preview_path(source).read_bytes() for source in sources] == [
+        f"{source.name}image/png:64".encode() for source in sources
+    ]
+    assert not worker.running
+    assert not worker.enqueue(sources[0], "image/png")
+
+
+async def test_worker_drops_jobs_when_queue_is_full(tmp_path: Path) -> None:
+    """Test that a full queue drops further jobs instead of blocking."""
+    worker = PreviewWorker(render=copy_render)
+    worker.start(processes=1, max_size=64, queue_size=1)
+
+    try:
+        # Without yielding to the event loop, no consumer has taken a job yet.
+        assert worker.enqueue(tmp_path / "a.png", "image/png")
+        assert not worker.enqueue(tmp_path / "b.png", "image/png")
+    finally:
+        await worker.stop()
+
+
+async def test_submission_queues_previews(
+    client: AsyncClient, mocker: MockerFixture, test_settings: Settings
+) -> None:
+    """Test that stored attachments are queued for preview rendering."""
+    enqueue = mocker.patch.object(main.preview_worker, "enqueue")
+    files = {"attachments": ("photo.png", io.BytesIO(b"png"), "image/png")}
+
+    response = await client.post("/applications", data=APPLICATION, files=files)
+
+    assert response.status_code == HTTPStatus.OK
+    ((path, mime_type),) = [call.args for call in enqueue.call_args_list]
+    assert path.parent == test_settings.project_root / "data" / "uploads"
+    assert mime_type == "image/png"
+
+
+class TestPreviewEndpoint:
+    """Tests for GET /attachments/{id}/preview."""
+
+    @staticmethod
+    async def _create_attachment(client: AsyncClient, session: AsyncSession) -> int:
+        files = {"attachments": ("photo.png", io.BytesIO(b"png"), "image/png")}
+        response = await client.post("/applications", data=APPLICATION, files=files)
+        result = await session.execute(
+            select(Attachment.id).where(
+                Attachment.application_id == response.json()["application_id"]
+            )
+        )
+        return result.scalar_one()
+
+    async def test_preview_not_rendered_yet(
+        self, client: AsyncClient, session: AsyncSession
+    ) -> None:
+        """Test that a missing preview is answered with 404."""
+        attachment_id = await self._create_attachment(client, session)
+
+        response = await client.get(f"/attachments/{attachment_id}/preview")
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert response.json()["detail"] == "Preview not available."
+
+    async def test_unknown_attachment(self, client: AsyncClient) -> None:
+        """Test that previews of unknown attachments are answered with 404."""
+        response = await client.get("/attachments/999999/preview")
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert response.json()["detail"] == "Attachment not found."
+
+    async def test_preview_with_cache_headers(
+        self, client: AsyncClient, session: AsyncSession, test_settings: Settings
+    ) -> None:
+        """Test that previews are cacheable and revalidated by their ETag."""
+        attachment_id = await self._create_attachment(client, session)
+        attachment = await session.get(Attachment, attachment_id)
+        assert attachment is not None
+        preview = preview_path(test_settings.project_root / attachment.filepath)
+        preview.write_bytes(b"jpeg")
+
+        response = await client.get(f"/attachments/{attachment_id}/preview")
+        revalidated = await client.get(
+            f"/attachments/{attachment_id}/preview",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.content == b"jpeg"
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.headers["Cache-Control"] == (
+            f"public, max-age={PREVIEW_CACHE_MAX_AGE}"
+        )
+        assert revalidated.status_code == HTTPStatus.NOT_MODIFIED
+        assert revalidated.headers["ETag"] == response.headers["ETag"]
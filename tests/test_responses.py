@@ -0,0 +1,171 @@
+"""Tests for JSON rendering and compression of API responses."""
+
+import datetime as dt
+import gzip
+import io
+from collections.abc import Iterator
+from http import HTTPStatus
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from projectvote.backend.main import AttachmentOut
+from projectvote.backend.models import VoteOption
+from projectvote.backend.responses import (
+    PydanticJSONResponse,
+    ResponseCompressionMiddleware,
+    accepts_encoding,
+)
+
+APPLICATION = {
+    "first_name": "Compressed",
+    "last_name": "Response",
+    "applicant_email": "compressed.response@example.com",
+    "department": "IT",
+    "project_title": "Compression Test",
+    "project_description": "A description that makes the archive larger. " * 40,
+    "costs": 10.0,
+}
+
+
+def test_pydantic_json_response_renders_models_directly() -> None:
+    """Test that models, enums and datetimes are rendered without a dict step."""
+    response = PydanticJSONResponse(
+        {
+            "attachment": AttachmentOut(id=1, filename="plan.pdf"),
+            "vote": VoteOption.APPROVE,
+            "at": dt.datetime(2026, 1, 29, 12, 0, tzinfo=dt.UTC),
+        }
+    )
+
+    assert response.body == (
+        b'{"attachment":{"id":1,"filename":"plan.pdf"},"vote":"approve",'
+        b'"at":"2026-01-29T12:00:00Z"}'
+    )
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_pydantic_json_response_passes_bytes_through() -> None:
+    """Test that already serialized payloads are sent unchanged."""
+    assert PydanticJSONResponse(b'{"cached":true}').body == b'{"cached":true}'
+
+
+async def test_large_json_is_gzip_compressed(client: AsyncClient) -> None:
+    """Test that a large JSON body is gzip-compressed if the client accepts it."""
+    await client.post("/applications", data=APPLICATION)
+
+    response = await client.get(
+        "/applications/archive", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json()[0]["project_title"] == APPLICATION["project_title"]
+
+
+async def test_uncompressed_without_accept_encoding(client: AsyncClient) -> None:
+    """Test that bodies are sent as they are to clients without gzip support."""
+    await client.post("/applications", data=APPLICATION)
+
+    response = await client.get(
+        "/applications/archive", headers={"Accept-Encoding": "identity"}
+    )
+
+    assert "content-encoding" not in response.headers
+    assert int(response.headers["content-length"]) == len(response.content)
+
+
+async def test_small_responses_are_not_compressed(client: AsyncClient) -> None:
+    """Test that bodies below the minimum size are not compressed."""
+    response = await client.get("/version", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+
+
+async def test_compressed_media_types_are_not_compressed(client: AsyncClient) -> None:
+    """Test that already compressed attachment types are sent unchanged."""
+    pdf = b"%PDF-1.7 " + b"0" * 4096
+    files = {"attachments": ("plan.pdf", io.BytesIO(pdf), "application/pdf")}
+    await client.post("/applications", data=APPLICATION, files=files)
+    archive = await client.get("/applications/archive")
+    attachment_id = archive.json()[0]["attachments"][0]["id"]
+
+    response = await client.get(
+        f"/attachments/{attachment_id}", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert "content-encoding" not in response.headers
+    assert response.content == pdf
+
+
+async def test_brotli_is_preferred(client: AsyncClient) -> None:
+    """Test that brotli is used if installed and accepted by the client."""
+    pytest.importorskip("brotli")
+    await client.post("/applications", data=APPLICATION)
+
+    response = await client.get(
+        "/applications/archive", headers={"Accept-Encoding": "gzip, br"}
+    )
+
+    # httpx decodes brotli itself if the package is installed
+    assert response.headers["content-encoding"] == "br"
+    assert response.json()[0]["project_title"] == APPLICATION["project_title"]
+
+
+async def test_streamed_bodies_are_compressed_chunk_by_chunk() -> None:
+    """Test that a streamed body is compressed without a Content-Length."""
+    chunks = [b"streamed line\n" * 200] * 3
+    streaming_app = FastAPI()
+
+    @streaming_app.get("/stream")
+    def stream() -> StreamingResponse:
+        def body() -> Iterator[bytes]:
+            yield from chunks
+
+        return StreamingResponse(body(), media_type="text/plain")
+
+    transport = ASGITransport(app=ResponseCompressionMiddleware(streaming_app))
+    async with (
+        AsyncClient(transport=transport, base_url="http://test") as client,
+        client.stream(
+            "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+        ) as response,
+    ):
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw) == b"".join(chunks)
+
+
+async def test_refused_encodings_are_not_used(client: AsyncClient) -> None:
+    """Test that an encoding with a quality of zero is never chosen."""
+    await client.post("/applications", data=APPLICATION)
+
+    response = await client.get(
+        "/applications/archive", headers={"Accept-Encoding": "gzip;q=0, br;q=0"}
+    )
+
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        (None, False),
+        ("gzip, deflate, br", True),
+        ("GZIP", True),
+        ("gzip;q=0.5", True),
+        ("gzip;q=0", False),
+        ("br, *", True),
+        ("*;q=0", False),
+        ("gzip;q=invalid", False),
+    ],
+)
+def test_accepts_encoding(accept_encoding: str | None, expected: bool) -> None:  # noqa: FBT001
+    """Test parsing of the Accept-Encoding header."""
+    assert accepts_encoding(accept_encoding, "gzip") is expected
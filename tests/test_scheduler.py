@@ -0,0 +1,50 @@
+"""Tests for the periodic job scheduler."""
+
+import asyncio
+
+import pytest
+
+from projectvote.backend.scheduler import Scheduler
+
+MIN_RUNS = 2
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_periodically_until_stopped() -> None:
+    """Test that a job runs repeatedly and stops running after ``stop``."""
+    runs = 0
+
+    async def job() -> None:
+        nonlocal runs
+        runs += 1
+
+    scheduler = Scheduler()
+    scheduler.add_job("count", 0.01, job)
+    scheduler.start()
+    await asyncio.sleep(0.1)
+    await scheduler.stop()
+
+    assert runs >= MIN_RUNS
+    runs_at_stop = runs
+    await asyncio.sleep(0.05)
+    assert runs == runs_at_stop
+
+
+@pytest.mark.asyncio
+async def test_failing_job_keeps_running(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that an exception is logged and the job is retried."""
+    runs = 0
+
+    async def job() -> None:
+        nonlocal runs
+        runs += 1
+        raise RuntimeError("boom")
+
+    scheduler = Scheduler()
+    scheduler.add_job("failing", 0.01, job)
+    scheduler.start()
+    await asyncio.sleep(0.1)
+    await scheduler.stop()
+
+    assert runs >= MIN_RUNS
+    assert "Scheduled job 'failing' failed" in caplog.text
@@ -0,0 +1,42 @@
+"""Tests for signing.py."""
+
+import datetime as dt
+
+import pytest
+
+from projectvote.backend.signing import create_voter_token, verify_voter_token
+
+NOW = dt.datetime(2026, 1, 29, 12, 0, 0, tzinfo=dt.UTC)
+SECRET = "test-secret"  # noqa: S105
+
+
+def test_round_trip() -> None:
+    """Test that a fresh token resolves to the signed email."""
+    token = create_voter_token("a@example.com", SECRET, NOW + dt.timedelta(hours=1))
+    assert verify_voter_token(token, SECRET, NOW) == "a@example.com"
+
+
+@pytest.mark.parametrize(
+    ("token_secret", "expires_in", "tamper"),
+    [
+        ("other-secret", dt.timedelta(hours=1), False),
+        (SECRET, dt.timedelta(0), False),
+        (SECRET, dt.timedelta(hours=1), True),
+    ],
+    ids=["wrong secret", "expired", "tampered"],
+)
+def test_invalid_tokens(
+    token_secret: str, expires_in: dt.timedelta, *, tamper: bool
+) -> None:
+    """Test that foreign, expired and tampered tokens are rejected."""
+    token = create_voter_token("a@example.com", token_secret, NOW + expires_in)
+    if tamper:
+        _, expires, signature = token.split(".")
+        token = f"YkBleGFtcGxlLmNvbQ.{expires}.{signature}"
+    assert verify_voter_token(token, SECRET, NOW) is None
+
+
+@pytest.mark.parametrize("token", ["", "not-a-token", "a.b.c", "a.b.c.d"])
+def test_malformed_tokens(token: str) -> None:
+    """Test that malformed tokens are rejected without raising."""
+    assert verify_voter_token(token, SECRET, NOW) is None
@@ -0,0 +1,42 @@
+"""Tests for the local SMTP sink."""
+
+import mailbox
+from email.utils import getaddresses
+from pathlib import Path
+
+import pytest
+from pydantic import SecretStr
+
+from projectvote.backend.config import Settings
+from projectvote.backend.email_service import send_email
+from projectvote.backend.smtp_sink import SMTPSink
+
+
+@pytest.mark.asyncio
+async def test_sink_receives_messages_from_send_email(tmp_path: Path) -> None:
+    """Test a full SMTP delivery, including login, into the sink's mailbox."""
+    mbox_path = tmp_path / "sink.mbox"
+    sink = SMTPSink(mbox_path)
+    server = await sink.start(port=0)
+    port = server.sockets[0].getsockname()[1]
+    settings = Settings(
+        board_members="test@example.com",
+        mail_server="127.0.0.1",
+        mail_port=port,
+        mail_password=SecretStr("any-password"),
+    )
+    recipients = ["a@example.com", "b@example.com", "c@example.com"]
+
+    async with server:
+        await send_email(
+            recipients,
+            "Abstimmung abgeschlossen",
+            {"votes": []},
+            "pending_votes_reminder.html",
+            settings,
+        )
+
+    assert sink.received == len(recipients)
+    messages = list(mailbox.mbox(mbox_path))
+    assert [getaddresses([m["To"]])[0][1] for m in messages] == recipients
+    assert all(m["Subject"] == "Abstimmung abgeschlossen" for m in messages)
@@ -0,0 +1,99 @@
+"""Tests for the voting decision engine."""
+
+import itertools
+
+import pytest
+
+from projectvote.backend.models import ApplicationStatus, VoteOption
+from projectvote.backend.voting import (
+    VoteTally,
+    decide,
+    decide_batch,
+    majority_needed,
+    tally_votes,
+)
+
+BOARD_SIZE = 4
+
+
+@pytest.mark.parametrize(
+    ("votes", "expected_status"),
+    [
+        (["approve", "approve", "approve", "reject"], ApplicationStatus.APPROVED),
+        (["approve", "approve", "reject", "reject"], ApplicationStatus.REJECTED),
+        (["approve", "approve", "abstain", "abstain"], ApplicationStatus.APPROVED),
+        (["approve", "reject", "abstain", "abstain"], ApplicationStatus.REJECTED),
+        (["abstain", "abstain", "abstain", "abstain"], ApplicationStatus.REJECTED),
+        (["approve", "approve", "approve"], ApplicationStatus.APPROVED),
+        (["reject", "reject"], ApplicationStatus.REJECTED),
+        (["approve", "approve", "reject"], ApplicationStatus.PENDING),
+        (["approve", "abstain"], ApplicationStatus.PENDING),
+        (["approve"], ApplicationStatus.PENDING),
+        ([], ApplicationStatus.PENDING),
+    ],
+)
+def test_decide(votes: list[str], expected_status: ApplicationStatus) -> None:
+    """Test the outcome of a single application for typical vote combinations."""
+    tally = tally_votes(
+        [VoteOption(v) for v in votes] + [None] * (BOARD_SIZE - len(votes)),
+        electorate=BOARD_SIZE,
+    )
+    assert decide(tally) == expected_status
+
+
+@pytest.mark.parametrize(
+    ("votes", "expected_status"),
+    [
+        (["approve", "approve", "approve"], ApplicationStatus.APPROVED),
+        (["approve", "approve", "abstain"], ApplicationStatus.APPROVED),
+        (["approve", "approve", "reject"], ApplicationStatus.REJECTED),
+        (["approve", "reject"], ApplicationStatus.REJECTED),
+        (["approve", "abstain"], ApplicationStatus.REJECTED),
+        ([], ApplicationStatus.REJECTED),
+    ],
+)
+def test_decide_closed(votes: list[str], expected_status: ApplicationStatus) -> None:
+    """Test that closed voting rejects anything short of an approval majority."""
+    tally = tally_votes([VoteOption(v) for v in votes], electorate=BOARD_SIZE)
+    assert decide(tally, closed=True) == expected_status
+
+
+def test_tally_votes_ignores_pending_votes() -> None:
+    """Test that pending votes only count towards the remaining votes."""
+    tally = tally_votes(
+        [VoteOption.APPROVE, None, VoteOption.ABSTAIN, None], electorate=BOARD_SIZE
+    )
+    assert tally == VoteTally(approvals=1, rejects=0, abstains=1, electorate=4)
+    assert tally.cast == 2  # noqa: PLR2004
+    assert tally.remaining == 2  # noqa: PLR2004
+    assert tally.majority_needed == majority_needed(BOARD_SIZE, 1) == 2  # noqa: PLR2004
+
+
+def test_decide_batch_matches_decide() -> None:
+    """Test that the batch evaluation agrees with the single evaluation."""
+    tallies = [
+        VoteTally(a, r, x, electorate)
+        for electorate in range(1, 8)
+        for a, r, x in itertools.product(range(electorate + 1), repeat=3)
+        if a + r + x <= electorate
+    ]
+
+    columns = (
+        [t.approvals for t in tallies],
+        [t.rejects for t in tallies],
+        [t.abstains for t in tallies],
+        [t.electorate for t in tallies],
+    )
+
+    assert decide_batch(*columns) == [decide(t) for t in tallies]
+    assert decide_batch(*columns, closed=[True] * len(tallies)) == [
+        decide(t, closed=True) for t in tallies
+    ]
+
+
+def test_decide_batch_rejects_mismatched_lengths() -> None:
+    """Test that tally columns of different lengths are rejected."""
+    with pytest.raises(ValueError, match="same length"):
+        decide_batch([1, 2], [0], [0, 0], [4, 4])
+    with pytest.raises(ValueError, match="same length"):
+        decide_batch([1, 2], [0, 0], [0, 0], [4, 4], closed=[True])